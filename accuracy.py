@@ -0,0 +1,161 @@
+import math
+import time
+from utils import IS_WEB, GOAL_SIZE, PATH_TOLERANCE
+
+# numpy 가 있으면 궤적 점 x 경로 선분을 한 번에 계산 (없으면 순수 파이썬)
+# 브라우저 빌드는 numpy 휠을 받지 않도록 항상 순수 파이썬 경로
+np = None
+if not IS_WEB:
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+
+COVERAGE_BIN = 10          # 경로를 이 길이(px) 구간으로 나눠 덮였는지 판정
+CHUNK_ELEMENTS = 1 << 18   # numpy 한 번에 계산할 (점 x 선분) 수 (임시 배열 크기 제한)
+# 순수 파이썬은 궤적을 이 점 수 이하로 솎고, SLICE_POINTS 점씩 나눠 채점
+# (선분 50개면 조각 하나가 데스크톱 ~1ms, 게임 루프가 프레임마다 한 조각씩 실행)
+FALLBACK_POINTS = 200
+SLICE_POINTS = 16
+
+
+class TrailScore:
+    """스테이지 클리어 시 궤적 정확도"""
+
+    __slots__ = ("stage_num", "points", "mean", "max", "coverage", "ms")
+
+    def __init__(self, stage_num, points, mean, max_deviation, coverage, ms):
+        self.stage_num = stage_num
+        self.points = points          # 채점한 궤적 점 수
+        self.mean = mean              # 경로까지 평균 거리 (px)
+        self.max = max_deviation      # 경로까지 최대 거리 (px)
+        self.coverage = coverage      # PATH_TOLERANCE 이내로 지나간 경로 비율 (0~1)
+        self.ms = ms                  # 계산 시간
+
+    def format(self):
+        return (f"Accuracy {self.coverage * 100:.0f}%  "
+                f"(mean {self.mean:.1f}px, max {self.max:.1f}px)")
+
+
+def _segment_table(path):
+    """선분 테이블 (x1, y1, dx, dy, 길이 제곱)과 각 선분 시작까지의 누적 길이"""
+    segments = []
+    starts = []
+    total = 0.0
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        dx, dy = x2 - x1, y2 - y1
+        segments.append((x1, y1, dx, dy, dx * dx + dy * dy))
+        starts.append(total)
+        total += math.hypot(dx, dy)
+    return segments, starts, total
+
+
+def _score_numpy(points, segments, starts, bins):
+    """(점별 경로까지 거리 배열, 덮인 구간 수): 모든 점 x 모든 선분을 브로드캐스팅으로 한 번에"""
+    # 픽셀 좌표라 float32 로 충분 (float64 보다 메모리 대역폭 절반)
+    seg = np.asarray(segments, dtype=np.float32)
+    x1, y1, dx, dy, len_sq = seg.T
+    length = np.sqrt(len_sq)
+    inv_len_sq = np.divide(1.0, len_sq, out=np.zeros_like(len_sq), where=len_sq > 0)
+    starts = np.asarray(starts, dtype=np.float32)
+    pts = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+    tolerance_sq = PATH_TOLERANCE * PATH_TOLERANCE
+
+    dist = np.empty(len(pts))
+    marks = np.zeros(bins + 1, dtype=np.intp)  # 구간 [lo, hi] 표시용 차분 배열
+    chunk = max(1, CHUNK_ELEMENTS // len(seg))
+    for i in range(0, len(pts), chunk):
+        # (점, 선분) 배열 (임시 배열을 줄이려고 제자리 연산)
+        ex = np.subtract.outer(pts[i:i + chunk, 0], x1)
+        ey = np.subtract.outer(pts[i:i + chunk, 1], y1)
+        t = ex * dx
+        t += ey * dy
+        t *= inv_len_sq
+        np.clip(t, 0.0, 1.0, out=t)
+        ex -= t * dx
+        ey -= t * dy
+        ex *= ex
+        ey *= ey
+        d_sq = ex
+        d_sq += ey
+        dist[i:i + chunk] = np.sqrt(d_sq.min(axis=1))
+
+        rows, cols = np.nonzero(d_sq <= tolerance_sq)
+        arc = starts[cols] + t[rows, cols] * length[cols]
+        reach = np.sqrt(tolerance_sq - d_sq[rows, cols])
+        lo = np.clip((arc - reach) // COVERAGE_BIN, 0, bins - 1).astype(np.intp)
+        hi = np.clip((arc + reach) // COVERAGE_BIN, 0, bins - 1).astype(np.intp)
+        marks += np.bincount(lo, minlength=bins + 1)
+        marks -= np.bincount(hi + 1, minlength=bins + 1)
+    return dist, int(np.count_nonzero(np.cumsum(marks[:-1])))
+
+
+def _iter_score_python(points, segments, starts, bins):
+    """_score_numpy 와 같은 계산 (numpy 가 없을 때), SLICE_POINTS 점마다 yield
+
+    반환값은 (거리 목록, 덮인 구간 수, 조각 사이 대기를 뺀 계산 시간 ms).
+    """
+    tolerance_sq = PATH_TOLERANCE * PATH_TOLERANCE
+    dist = []
+    marked = set()
+    ms = 0.0
+    for begin in range(0, len(points), SLICE_POINTS):
+        yield
+        slice_start = time.perf_counter()
+        for px, py in points[begin:begin + SLICE_POINTS]:
+            best_sq = math.inf
+            for (x1, y1, dx, dy, len_sq), start in zip(segments, starts):
+                t = 0.0 if len_sq == 0 else max(0.0, min(1.0, ((px - x1) * dx + (py - y1) * dy) / len_sq))
+                ex = px - (x1 + t * dx)
+                ey = py - (y1 + t * dy)
+                d_sq = ex * ex + ey * ey
+                best_sq = min(best_sq, d_sq)
+                if d_sq <= tolerance_sq:
+                    arc = start + t * math.sqrt(len_sq)
+                    reach = math.sqrt(tolerance_sq - d_sq)
+                    lo = min(max(int((arc - reach) // COVERAGE_BIN), 0), bins - 1)
+                    hi = min(max(int((arc + reach) // COVERAGE_BIN), 0), bins - 1)
+                    marked.update(range(lo, hi + 1))
+            dist.append(math.sqrt(best_sq))
+        ms += (time.perf_counter() - slice_start) * 1000
+    return dist, len(marked), ms
+
+
+def iter_score_trail(trail, path, stage_num=0, use_numpy=True):
+    """궤적 전체를 경로와 비교해 정확도 계산 (조각마다 yield, 반환값은 TrailScore / 경로가 없으면 None)
+
+    각 궤적 점의 경로까지 거리로 평균/최대 편차를 구한다. 커버율은 경로를
+    COVERAGE_BIN 구간으로 나눠, 허용 거리 안에 궤적 점이 있는 구간의 비율이다
+    (점에서 허용 거리 원이 닿는 선분 구간을 모두 덮은 것으로 봄).
+    numpy 가 있으면 한 번에 계산하고, 없으면 호출한 쪽이 프레임마다 나눠 실행할 수 있게
+    FALLBACK_POINTS 이하로 솎은 궤적을 SLICE_POINTS 점마다 yield 하며 계산한다.
+    """
+    if len(path) < 2 or not trail:
+        return None
+    segments, starts, total = _segment_table(path)
+    # 골 박스에 닿으면 바로 클리어되므로 마지막 GOAL_SIZE 구간은 커버율에서 제외
+    bins = max(1, math.ceil((total - GOAL_SIZE) / COVERAGE_BIN))
+
+    if np is not None and use_numpy:
+        start = time.perf_counter()
+        points = len(trail)
+        dist, covered = _score_numpy(trail, segments, starts, bins)
+        mean, max_deviation = float(dist.mean()), float(dist.max())
+        ms = (time.perf_counter() - start) * 1000
+    else:
+        sample = trail[::max(1, math.ceil(len(trail) / FALLBACK_POINTS))]
+        points = len(sample)
+        dist, covered, ms = yield from _iter_score_python(sample, segments, starts, bins)
+        mean, max_deviation = sum(dist) / len(dist), max(dist)
+
+    return TrailScore(stage_num, points, mean, max_deviation, covered / bins, ms)
+
+
+def score_trail(trail, path, stage_num=0, use_numpy=True):
+    """iter_score_trail 을 한 번에 실행"""
+    steps = iter_score_trail(trail, path, stage_num, use_numpy)
+    try:
+        while True:
+            next(steps)
+    except StopIteration as done:
+        return done.value
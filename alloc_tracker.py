@@ -0,0 +1,64 @@
+import os
+import tracemalloc
+
+# KSH_DEBUG_ALLOC=1 이면 프레임당 메모리 할당량을 추적해서 주기적으로 출력
+DEBUG_ALLOC = bool(os.environ.get("KSH_DEBUG_ALLOC"))
+REPORT_FRAMES = 300  # 이 프레임 수마다 평균을 출력
+TOP_SITES = 3        # 할당이 가장 많이 늘어난 위치 몇 개를 같이 출력
+
+
+class AllocationTracker:
+    """tracemalloc 스냅샷을 매 프레임 비교해서 프레임당 남는 할당(블록 수, 바이트)을 집계
+
+    오브젝트 풀/캐시가 제대로 동작하면 정상 상태에서 값이 0 근처에 머문다.
+    """
+
+    def __init__(self, enabled=DEBUG_ALLOC, report_frames=REPORT_FRAMES):
+        self.enabled = enabled
+        self.report_frames = report_frames
+        self._previous = None
+        self._frames = 0
+        self._blocks = 0
+        self._bytes = 0
+        self._sites = {}  # 위치 -> 누적 바이트
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def _snapshot(self):
+        # 추적기 자신이 만든 할당은 제외
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ))
+
+    def frame(self):
+        """프레임 끝에서 호출 (이전 프레임 대비 할당 변화 기록)"""
+        if not self.enabled:
+            return
+
+        snapshot = self._snapshot()
+        if self._previous is not None:
+            for stat in snapshot.compare_to(self._previous, "lineno"):
+                self._blocks += stat.count_diff
+                self._bytes += stat.size_diff
+                if stat.size_diff > 0:
+                    site = str(stat.traceback[0])
+                    self._sites[site] = self._sites.get(site, 0) + stat.size_diff
+            self._frames += 1
+        self._previous = snapshot
+
+        if self._frames >= self.report_frames:
+            self.report()
+
+    def report(self):
+        """프레임당 평균 할당 출력 후 초기화"""
+        frames = max(self._frames, 1)
+        print(f"[alloc] {self._blocks / frames:+.1f} blocks/frame, "
+              f"{self._bytes / frames:+.0f} B/frame over {self._frames} frames")
+        top = sorted(self._sites.items(), key=lambda item: item[1], reverse=True)[:TOP_SITES]
+        for site, size in top:
+            print(f"[alloc]   {site}: {size / frames:+.0f} B/frame")
+        self._frames = 0
+        self._blocks = 0
+        self._bytes = 0
+        self._sites.clear()
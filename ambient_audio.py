@@ -0,0 +1,218 @@
+import array
+import asyncio
+import math
+import random
+import pygame
+
+# 스트리밍 앰비언트 사운드 설정
+SAMPLE_RATE = 22050
+BLOCK_SAMPLES = 2048          # 블록 하나 ~93ms
+BLOCK_SECONDS = BLOCK_SAMPLES / SAMPLE_RATE
+RING_SIZE = 3                 # 재생 중 + 대기열 + 작성 중
+TABLE_SIZE = 4096             # 사인/노이즈 테이블 크기
+SWELL_DECAY = 0.9             # 블록마다 일시적 강조(swell)가 줄어드는 비율
+# 합성 한 조각 (블록 하나를 이만큼씩 나눠 프레임 유휴 시간에 실행, 데스크톱 ~0.7ms)
+SLICE_SAMPLES = 256
+
+# 레이어 이름 (SoundManager.play 에서 이 이름이면 스트림 강조로 처리)
+LAYERS = ('drone', 'heartbeat', 'breathing')
+
+_SINE = array.array('f', (math.sin(2 * math.pi * i / TABLE_SIZE) for i in range(TABLE_SIZE)))
+_NOISE = array.array('f', (random.uniform(-1, 1) for _ in range(TABLE_SIZE)))
+
+
+def _heartbeat_table():
+    """심장박동 한 번 (쿵-쿵) 파형"""
+    length = int(SAMPLE_RATE * 0.35)
+    table = array.array('f', bytes(4 * length))
+    for i in range(length):
+        t = i / SAMPLE_RATE
+        pulse1 = math.exp(-((t - 0.1) ** 2) * 500) * math.sin(2 * math.pi * 60 * t)
+        pulse2 = math.exp(-((t - 0.25) ** 2) * 500) * math.sin(2 * math.pi * 50 * t) * 0.7
+        table[i] = (pulse1 + pulse2) * 0.8
+    return table
+
+
+class AmbientStream:
+    """드론/심장박동/숨소리를 작은 블록 단위로 합성해서 Channel.queue 로 이어 재생
+
+    버퍼는 RING_SIZE 개의 Sound 를 돌려 쓰므로 메모리 사용량이 고정이고,
+    파라미터(심박수, 레이어 볼륨)는 다음 블록부터 바로 반영된다.
+    """
+
+    def __init__(self, channel):
+        self.channel = channel
+        self._heartbeat = _heartbeat_table()
+        self._block = array.array('h', bytes(2 * 2 * BLOCK_SAMPLES))  # 스테레오 16비트
+        self._ring = [pygame.mixer.Sound(buffer=self._block) for _ in range(RING_SIZE)]
+        self._ring_index = 0
+        try:
+            self._views = [memoryview(sound).cast('B').cast('h') for sound in self._ring]
+        except TypeError:
+            self._views = None  # 버퍼에 직접 못 쓰는 환경이면 블록마다 Sound 생성
+
+        # 발진기 위상 (블록 경계에서 끊기지 않도록 유지)
+        self._drone_phase = [0.0, 0.0, 0.0]
+        self._lfo_phase = 0.0
+        self._beat_pos = 0.0
+        self._breath_phase = 0.0
+
+        # 현재/목표 레이어 볼륨
+        self.gains = {layer: 0.0 for layer in LAYERS}
+        self.targets = {layer: 0.0 for layer in LAYERS}
+        self._swell = {layer: 0.0 for layer in LAYERS}
+        self.bpm = 60.0
+        self.breaths_per_min = 15.0
+        self.blocks = 0  # 합성한 블록 수
+
+    def set_params(self, glitch_level, proximity):
+        """글리치 레벨과 적 근접도(0~1)로 레이어 파라미터 갱신"""
+        if glitch_level <= 0 and proximity <= 0:
+            for layer in LAYERS:
+                self.targets[layer] = 0.0
+            return
+
+        self.targets['drone'] = min(0.25 + 0.05 * glitch_level, 0.5)
+        self.targets['heartbeat'] = min(0.3 + 0.1 * glitch_level + 0.5 * proximity, 1.0)
+        self.targets['breathing'] = 0.6 * proximity
+        self.bpm = min(60 + 8 * glitch_level + 70 * proximity, 170)
+        self.breaths_per_min = 15 + 20 * proximity
+
+    def swell(self, layer, volume):
+        """레이어를 잠깐 크게 (예전 일회성 drone/heartbeat/breathing 재생 대신)"""
+        self._swell[layer] = max(self._swell[layer], volume)
+
+    def silent(self):
+        return all(self.gains[layer] + self._swell[layer] < 0.01 and self.targets[layer] == 0
+                   for layer in LAYERS)
+
+    def _synthesize(self):
+        """다음 블록을 한 번에 합성"""
+        for _ in self._iter_synthesize():
+            pass
+
+    def _iter_synthesize(self):
+        """다음 블록을 SLICE_SAMPLES 씩 나눠 합성 (self._block 에 기록)
+
+        각 조각 앞에서 yield 하므로 호출하는 쪽이 조각 사이에 유휴 시간을 기다릴 수 있다.
+        """
+        rate = SAMPLE_RATE
+        sine, noise, heartbeat = _SINE, _NOISE, self._heartbeat
+        mask = TABLE_SIZE - 1
+        heartbeat_len = len(heartbeat)
+
+        # 블록 동안 볼륨을 선형으로 바꿔서 튀는 소리 방지
+        start = {}
+        step = {}
+        for layer in LAYERS:
+            target = self.targets[layer] + self._swell[layer]
+            start[layer] = self.gains[layer]
+            step[layer] = (target - self.gains[layer]) / BLOCK_SAMPLES
+            self.gains[layer] = target
+            self._swell[layer] *= SWELL_DECAY
+        drone_gain, heart_gain, breath_gain = start['drone'], start['heartbeat'], start['breathing']
+        drone_step, heart_step, breath_step = step['drone'], step['heartbeat'], step['breathing']
+
+        p1, p2, p3 = self._drone_phase
+        d1, d2, d3 = (TABLE_SIZE * f / rate for f in (50, 75, 100))
+        lfo, lfo_step = self._lfo_phase, TABLE_SIZE * 0.1 / rate
+        beat_pos, beat_period = self._beat_pos, rate * 60 / self.bpm
+        breath, breath_step_phase = self._breath_phase, TABLE_SIZE * self.breaths_per_min / 60 / rate
+        noise_pos = random.randrange(TABLE_SIZE)
+
+        block = self._block
+        for begin in range(0, BLOCK_SAMPLES, SLICE_SAMPLES):
+            yield
+            for i in range(begin, min(begin + SLICE_SAMPLES, BLOCK_SAMPLES)):
+                n = noise[(noise_pos + i) & mask]
+
+                drone = (sine[int(p1) & mask] * 0.3 + sine[int(p2) & mask] * 0.2 +
+                         sine[int(p3) & mask] * 0.1 + n * 0.1)
+                drone *= 0.8 + 0.2 * sine[int(lfo) & mask]
+
+                index = int(beat_pos)
+                beat = heartbeat[index] if index < heartbeat_len else 0.0
+
+                b = sine[int(breath) & mask]
+                breath_val = b * 0.3 + n * 0.6 * (b if b > 0 else -b)
+
+                val = (drone * drone_gain * 0.3 + beat * heart_gain * 0.4 +
+                       breath_val * breath_gain * 0.4)
+                sample = int(val * 32767)
+                if sample > 32767:
+                    sample = 32767
+                elif sample < -32768:
+                    sample = -32768
+                block[2 * i] = sample
+                block[2 * i + 1] = sample
+
+                p1 += d1
+                p2 += d2
+                p3 += d3
+                lfo += lfo_step
+                beat_pos += 1
+                if beat_pos >= beat_period:
+                    beat_pos -= beat_period
+                breath += breath_step_phase
+                drone_gain += drone_step
+                heart_gain += heart_step
+                breath_gain += breath_step
+
+        self._drone_phase = [p1 % TABLE_SIZE, p2 % TABLE_SIZE, p3 % TABLE_SIZE]
+        self._lfo_phase = lfo % TABLE_SIZE
+        self._beat_pos = beat_pos
+        self._breath_phase = breath % TABLE_SIZE
+        self.blocks += 1
+
+    def _store_block(self):
+        """합성한 블록을 링 버퍼의 다음 Sound 에 담아 반환"""
+        if self._views is None:
+            return pygame.mixer.Sound(buffer=self._block)
+        index = self._ring_index
+        self._ring_index = (index + 1) % RING_SIZE
+        self._views[index][:] = self._block
+        return self._ring[index]
+
+    def _next_sound(self):
+        self._synthesize()
+        return self._store_block()
+
+    async def _next_sound_sliced(self, idle):
+        """조각마다 유휴 시간을 기다리며 합성"""
+        for _ in self._iter_synthesize():
+            await idle()
+        return self._store_block()
+
+    def pump(self):
+        """재생/대기열이 비었으면 다음 블록 채우기 (조용하면 합성 안 함)"""
+        if self.silent():
+            return
+        if not self.channel.get_busy():
+            self.channel.play(self._next_sound())
+        if self.channel.get_queue() is None:
+            self.channel.queue(self._next_sound())
+
+    async def pump_sliced(self, idle):
+        """pump 와 같지만 블록을 조각내어 조각 사이마다 idle() 을 기다림"""
+        if self.silent():
+            return
+        if not self.channel.get_busy():
+            self.channel.play(await self._next_sound_sliced(idle))
+        if self.channel.get_queue() is None:
+            self.channel.queue(await self._next_sound_sliced(idle))
+
+    def stop(self):
+        self.channel.stop()
+
+    async def run(self, idle=None):
+        """백그라운드 태스크 본체 (블록 길이의 절반마다 확인)
+
+        idle 을 주면 합성은 SLICE_SAMPLES 조각씩 프레임 유휴 시간에만 (블록 하나가 여러
+        프레임에 걸쳐도 대기열에 블록이 남아 있어 끊기지 않음)
+        """
+        while True:
+            if idle is None:
+                self.pump()
+            else:
+                await self.pump_sliced(idle)
+            await asyncio.sleep(BLOCK_SECONDS / 2)
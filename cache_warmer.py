@@ -0,0 +1,98 @@
+import asyncio
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from utils import IS_WEB
+
+# 웹에서 한 프레임에 캐시 워밍에 쓸 최대 시간 (ms)
+WARM_BUDGET_MS = 2.0
+# 데스크톱 워커 스레드 수 (게임 루프와 GIL 을 나눠 쓰므로 하나로 충분)
+WARM_WORKERS = 1
+
+
+class CacheWarmer:
+    """곧 필요할 캐시(스테이지 레이어, 게임오버 배경, 스프라이트)를 미리 렌더링
+
+    작업은 이터레이터를 돌려주는 함수이고, next() 한 번이 한 조각이다.
+    데스크톱은 스레드 풀에서 조각마다 GIL 을 양보하며 끝까지 돌리고
+    (pygame 의 draw/transform 은 대부분 GIL 을 놓고 실행됨),
+    웹은 스레드가 없으므로 async 루프에서 프레임당 budget_ms 만큼만 조각을 실행한다.
+    """
+
+    def __init__(self, budget_ms=WARM_BUDGET_MS, threaded=not IS_WEB):
+        self.budget_ms = budget_ms
+        self._executor = ThreadPoolExecutor(WARM_WORKERS, thread_name_prefix="warm") if threaded else None
+        self._queue = deque()   # 웹: (키, 이터레이터)
+        self._pending = set()   # 요청됐지만 아직 안 끝난 작업 키
+        self.completed = 0
+        self.main_ms = 0.0      # 메인 스레드(웹 조각 실행)에서 쓴 누적 시간
+        self.max_slice_ms = 0.0
+
+    def request(self, key, job):
+        """작업 요청 (같은 키 작업이 진행 중이면 무시, 요청됐으면 True)"""
+        if key in self._pending:
+            return False
+        self._pending.add(key)
+        if self._executor is not None:
+            self._executor.submit(self._run_job, key, job)
+        else:
+            self._queue.append((key, iter(job())))
+        return True
+
+    def _run_job(self, key, job):
+        """워커 스레드 본체"""
+        try:
+            for _ in job():
+                time.sleep(0)  # 조각 사이마다 게임 루프에 GIL 양보
+        except Exception as e:
+            print(f"[warm] {key} failed: {e}")
+        finally:
+            self._pending.discard(key)
+            self.completed += 1
+
+    def step(self):
+        """예산 안에서 대기 중인 조각 실행 (웹용, 조각 하나는 예산을 넘을 수 있음)"""
+        start = time.perf_counter()
+        elapsed = 0.0
+        while self._queue and elapsed < self.budget_ms:
+            key, job = self._queue[0]
+            slice_start = time.perf_counter()
+            try:
+                next(job)
+            except StopIteration:
+                self._queue.popleft()
+                self._pending.discard(key)
+                self.completed += 1
+            except Exception as e:
+                print(f"[warm] {key} failed: {e}")
+                self._queue.popleft()
+                self._pending.discard(key)
+            now = time.perf_counter()
+            self.max_slice_ms = max(self.max_slice_ms, (now - slice_start) * 1000)
+            elapsed = (now - start) * 1000
+        self.main_ms += elapsed
+
+    def busy(self):
+        return bool(self._pending)
+
+    async def run(self, idle=None):
+        """백그라운드 태스크 본체 (데스크톱은 스레드가 처리하므로 바로 끝남)
+
+        idle 은 조각 묶음 사이에 기다릴 코루틴 함수 (FramePacer.idle 이면 프레임 유휴 시간에만 실행)
+        """
+        if self._executor is not None:
+            return
+        while True:
+            if not self._queue:
+                await asyncio.sleep(0.1)
+                continue
+            if idle is not None:
+                await idle()
+            self.step()
+            await asyncio.sleep(0)
+
+    def shutdown(self):
+        """종료 (진행 중인 작업은 기다리지 않음)"""
+        self._queue.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,139 @@
+import weakref
+import pygame
+from surfaces import create_surface
+
+# 원본 서피스 -> (배율, 축소 사본): 블릿할 때마다 다시 줄이지 않도록
+_scaled = weakref.WeakKeyDictionary()
+
+
+class ScaledCanvas:
+    """논리 좌표로 그리면 배율만큼 작은 백킹 서피스에 래스터화되는 화면
+
+    그리기 코드는 이 모듈의 함수(canvas.circle(screen, ...) 등)와 blit/fill 로
+    논리 해상도 좌표를 그대로 쓰고, 픽셀은 축소된 백킹 서피스에만 찍힌다.
+    블릿 원본은 배율로 줄인 사본을 캐시하므로, 블릿한 뒤 내용을 다시 그리는
+    서피스는 changed() 로 알려야 한다.
+    """
+
+    def __init__(self, size, scale, owner="frame"):
+        self.size = (int(size[0]), int(size[1]))
+        self.scale = scale
+        self.surface = create_surface((int(size[0] * scale), int(size[1] * scale)), owner=owner)
+
+    def get_size(self):
+        return self.size
+
+    def get_width(self):
+        return self.size[0]
+
+    def get_height(self):
+        return self.size[1]
+
+    def get_rect(self):
+        return pygame.Rect((0, 0), self.size)
+
+    def get_bitsize(self):
+        return self.surface.get_bitsize()
+
+    def get_masks(self):
+        return self.surface.get_masks()
+
+    def point(self, pos):
+        return (pos[0] * self.scale, pos[1] * self.scale)
+
+    def rect(self, rect):
+        """논리 사각형 -> 백킹 서피스 사각형 (실수 좌표 유지)"""
+        if len(rect) == 2:
+            (x, y), (w, h) = rect
+        else:
+            x, y, w, h = rect
+        s = self.scale
+        return (x * s, y * s, w * s, h * s)
+
+    def length(self, value):
+        """선 두께/반지름 (0 은 그대로, 그 외에는 최소 1px)"""
+        return max(1, round(value * self.scale)) if value > 0 else value
+
+    def fill(self, color, rect=None):
+        if rect is not None:
+            x, y, w, h = self.rect(rect)
+            rect = pygame.Rect(round(x), round(y), round(w), round(h))
+        return self.surface.fill(color, rect)
+
+    def blit(self, source, dest, area=None, special_flags=0):
+        """원본을 배율만큼 줄인 사본으로 블릿 (dest, area 는 논리 좌표)"""
+        x, y = self.point(dest[:2])
+        if area is not None:
+            ax, ay, aw, ah = self.rect(area)
+            area = pygame.Rect(round(ax), round(ay), round(aw), round(ah))
+        return self.surface.blit(scaled_copy(source, self.scale), (round(x), round(y)), area, special_flags)
+
+
+def scaled_copy(source, scale):
+    """배율로 줄인 사본 (서피스 알파/컬러키는 원본을 따라감)"""
+    entry = _scaled.get(source)
+    if entry is None or entry[0] != scale:
+        width, height = source.get_size()
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        if source.get_colorkey() is None and source.get_bitsize() >= 24:
+            copy = pygame.transform.smoothscale(source, size)
+        else:
+            copy = pygame.transform.scale(source, size)  # 컬러키 경계가 번지지 않게
+            copy.set_colorkey(source.get_colorkey())
+        entry = (scale, copy)
+        _scaled[source] = entry
+    copy = entry[1]
+    alpha = source.get_alpha()
+    if alpha != copy.get_alpha():
+        copy.set_alpha(alpha, source.get_flags() & pygame.RLEACCEL)
+    return copy
+
+
+def changed(source):
+    """블릿한 적 있는 서피스에 다시 그렸을 때 호출 (축소 사본 폐기)"""
+    _scaled.pop(source, None)
+
+
+# pygame.draw 와 같은 인자, 대상이 ScaledCanvas 면 논리 좌표를 백킹 서피스 좌표로 변환
+
+def line(surface, color, start, end, width=1):
+    if type(surface) is not ScaledCanvas:
+        return pygame.draw.line(surface, color, start, end, width)
+    return pygame.draw.line(surface.surface, color, surface.point(start), surface.point(end),
+                            surface.length(width))
+
+
+def lines(surface, color, closed, points, width=1):
+    if type(surface) is not ScaledCanvas:
+        return pygame.draw.lines(surface, color, closed, points, width)
+    s = surface.scale
+    return pygame.draw.lines(surface.surface, color, closed, [(x * s, y * s) for x, y in points],
+                             surface.length(width))
+
+
+def polygon(surface, color, points, width=0):
+    if type(surface) is not ScaledCanvas:
+        return pygame.draw.polygon(surface, color, points, width)
+    s = surface.scale
+    return pygame.draw.polygon(surface.surface, color, [(x * s, y * s) for x, y in points],
+                               surface.length(width))
+
+
+def circle(surface, color, center, radius, width=0):
+    if type(surface) is not ScaledCanvas:
+        return pygame.draw.circle(surface, color, center, radius, width)
+    return pygame.draw.circle(surface.surface, color, surface.point(center), surface.length(radius),
+                              surface.length(width))
+
+
+def ellipse(surface, color, rect, width=0):
+    if type(surface) is not ScaledCanvas:
+        return pygame.draw.ellipse(surface, color, rect, width)
+    return pygame.draw.ellipse(surface.surface, color, surface.rect(rect), surface.length(width))
+
+
+def rect(surface, color, rect, width=0, border_radius=0):
+    if type(surface) is not ScaledCanvas:
+        return pygame.draw.rect(surface, color, rect, width, border_radius)
+    return pygame.draw.rect(surface.surface, color, surface.rect(rect), surface.length(width),
+                            surface.length(border_radius))
@@ -0,0 +1,155 @@
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+import pygame
+from utils import FPS, IS_WEB
+
+try:
+    from PIL import Image  # 애니메이션 GIF 저장용 (선택)
+except ImportError:
+    Image = None
+
+CAPTURE_DIR = "captures"
+CAPTURE_EVERY = 2    # 출력된 프레임 중 N 번째마다 저장
+CAPTURE_QUEUE = 32   # 인코더가 밀리면 이 이상은 버림 (게임 루프는 기다리지 않음)
+CAPTURE_FORMATS = ("png", "gif")
+PNG_LEVEL = 3        # zlib 압축 레벨 (녹화 중에는 속도 우선)
+# GIF 로 합칠 최대 프레임 수 (Pillow 가 모든 프레임을 메모리에 올리므로, 기본 간격이면 10초)
+GIF_MAX_FRAMES = 300
+
+
+def _png_chunk(kind, data):
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(surface):
+    """서피스를 PNG 바이트로 변환
+
+    pygame.image.save 는 압축하는 동안 GIL 을 잡고 있어서 게임 루프가 멈추지만,
+    zlib.compress 는 GIL 을 놓고 실행되므로 인코더 스레드에서는 이쪽을 쓴다.
+    """
+    width, height = surface.get_size()
+    data = pygame.image.tobytes(surface, "RGB")
+    stride = width * 3
+    # 각 행 앞에 필터 종류 0 (None)
+    raw = b"".join(b"\x00" + data[y * stride:(y + 1) * stride] for y in range(height))
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)  # 8비트 RGB
+    return (b"\x89PNG\r\n\x1a\n" + _png_chunk(b"IHDR", header) +
+            _png_chunk(b"IDAT", zlib.compress(raw, PNG_LEVEL)) + _png_chunk(b"IEND", b""))
+
+
+class FrameCapture:
+    """출력된 프레임을 복사해서 백그라운드 스레드로 PNG 시퀀스/GIF 로 저장
+
+    게임 루프는 캡처할 프레임마다 서피스 복사 한 번만 하고, 큐가 차 있으면
+    기다리지 않고 그 프레임을 버린다 (dropped 로 집계). 프레임은 항상 PNG 로
+    바로 디스크에 쓰고, GIF 는 녹화가 끝난 뒤 PNG 에서 합친다.
+    """
+
+    def __init__(self, every=CAPTURE_EVERY, fmt="png", out_dir=CAPTURE_DIR, queue_size=CAPTURE_QUEUE):
+        if fmt == "gif" and Image is None:
+            print("[capture] Pillow is not installed, saving a PNG sequence instead")
+            fmt = "png"
+        self.every = max(1, every)
+        self.fmt = fmt
+        self.out_dir = out_dir
+        self.queue_size = queue_size
+        self.active = False
+        self.captured = 0
+        self.dropped = 0
+        self._frames = 0
+        self._queue = None
+        self._threads = []  # 인코더 스레드 (이전 세션이 아직 인코딩 중일 수 있음)
+
+    def toggle(self):
+        if self.active:
+            self.stop()
+        else:
+            self.start()
+
+    def start(self):
+        if IS_WEB:
+            print("[capture] not available in the browser (no threads)")
+            return
+        # 이전 세션은 기다리지 않음 (세션마다 큐와 스레드가 따로 있음)
+        self._threads = [t for t in self._threads if t.is_alive()]
+        session = self._new_session_dir()
+        self._queue = queue.Queue(self.queue_size + 1)  # 마지막 한 칸은 종료 표시용 (stop 이 기다리지 않도록)
+        thread = threading.Thread(target=self._encode, args=(self._queue, session, self.fmt),
+                                  name="capture", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        self.active = True
+        self.captured = self.dropped = self._frames = 0
+        print(f"[capture] recording every {self.every} frame(s) to {session}")
+
+    def _new_session_dir(self):
+        """세션 폴더 생성 (같은 초에 다시 시작하면 -2, -3 ... 을 붙임)"""
+        base = os.path.join(self.out_dir, time.strftime("%Y%m%d-%H%M%S"))
+        session, n = base, 1
+        while True:
+            try:
+                os.makedirs(session)
+                return session
+            except FileExistsError:
+                n += 1
+                session = f"{base}-{n}"
+
+    def stop(self, wait=False):
+        """캡처 중지 (wait=True 면 남은 프레임 인코딩이 끝날 때까지 대기)"""
+        if self.active:
+            self.active = False
+            self._queue.put(None)  # 인코더가 큐를 비우면서 받음
+            print(f"[capture] stopped: {self.captured} frames queued, {self.dropped} dropped")
+        if wait:
+            for thread in self._threads:
+                thread.join()
+            self._threads.clear()
+
+    def frame(self, surface):
+        """출력된 프레임마다 호출"""
+        if not self.active:
+            return
+        self._frames += 1
+        if self._frames % self.every:
+            return
+        if self._queue.qsize() >= self.queue_size:
+            self.dropped += 1
+            return
+        self._queue.put_nowait(surface.copy())
+        self.captured += 1
+
+    def _encode(self, frames, session, fmt):
+        """인코더 스레드 본체"""
+        paths = []
+        while True:
+            surface = frames.get()
+            if surface is None:
+                break
+            path = os.path.join(session, f"frame_{len(paths):05d}.png")
+            with open(path, "wb") as f:
+                f.write(encode_png(surface))
+            paths.append(path)
+
+        if not paths:
+            os.rmdir(session)  # 저장한 프레임이 없으면 빈 폴더를 남기지 않음
+            return
+        if fmt == "gif":
+            self._write_gif(session, paths)
+        print(f"[capture] saved {len(paths)} frames to {session}")
+
+    def _write_gif(self, session, paths):
+        """녹화한 PNG 시퀀스를 capture.gif 로 합침 (앞에서부터 GIF_MAX_FRAMES 프레임)"""
+        if len(paths) > GIF_MAX_FRAMES:
+            print(f"[capture] GIF keeps the first {GIF_MAX_FRAMES} of {len(paths)} frames "
+                  f"(all frames are in the PNG sequence)")
+            paths = paths[:GIF_MAX_FRAMES]
+        images = []
+        for path in paths:
+            with Image.open(path) as image:
+                images.append(image.convert("P", palette=Image.ADAPTIVE))
+        images[0].save(os.path.join(session, "capture.gif"), save_all=True, append_images=images[1:],
+                       duration=int(1000 / FPS * self.every), loop=0)
@@ -0,0 +1,78 @@
+import pygame
+from utils import WHITE, BLACK, SCREEN_WIDTH, SCREEN_HEIGHT
+from surfaces import create_surface, blit
+from canvas import ScaledCanvas
+
+# 그리기 순서 (뒤 -> 앞)
+LAYERS = ("background", "trail", "entities", "hud", "post")
+
+# 선택 가능한 출력 배율 (논리 해상도는 항상 SCREEN_WIDTH x SCREEN_HEIGHT)
+RENDER_SCALES = (1.0, 0.75, 0.5)
+
+
+def create_display(render_scale=1.0):
+    """배율에 맞는 크기로 화면 생성"""
+    size = (int(SCREEN_WIDTH * render_scale), int(SCREEN_HEIGHT * render_scale))
+    return pygame.display.set_mode(size)
+
+
+class Compositor:
+    """오프스크린 프레임에 레이어 순서대로 그린 뒤 한 번의 블릿으로 화면에 출력
+
+    그리기 코드는 항상 논리 해상도 좌표를 쓴다. render_scale 이 1보다 작으면
+    프레임은 화면과 같은 크기의 백킹 서피스를 가진 canvas.ScaledCanvas 라서
+    픽셀은 줄어든 크기로만 래스터화되고, 출력도 축소 없이 블릿 한 번이다.
+    """
+
+    def __init__(self, render_scale=1.0, clear_color=WHITE):
+        self.clear_color = clear_color
+        self.offset = (0, 0)  # 화면 흔들림 오프셋 (논리 좌표)
+        self._passes = {name: [] for name in LAYERS}
+        self.render_scale = None
+        self.set_render_scale(render_scale)
+
+    def set_render_scale(self, render_scale):
+        """출력 배율 변경 (화면/프레임 재생성, 바뀌었으면 True)"""
+        if render_scale == self.render_scale:
+            return False
+        self.render_scale = render_scale
+        self.display = create_display(render_scale)
+        if render_scale == 1.0:
+            self.frame = create_surface((SCREEN_WIDTH, SCREEN_HEIGHT), owner="frame")
+        else:
+            self.frame = ScaledCanvas((SCREEN_WIDTH, SCREEN_HEIGHT), render_scale, owner="frame")
+        return True
+
+    def to_logical(self, pos):
+        """화면 좌표를 논리 좌표로 변환 (마우스 입력용)"""
+        if self.render_scale == 1.0:
+            return pos
+        return (int(pos[0] / self.render_scale), int(pos[1] / self.render_scale))
+
+    def add(self, layer, draw_fn, *args):
+        """이번 프레임에 그릴 작업 등록"""
+        self._passes[layer].append((draw_fn, args))
+
+    def render(self):
+        """등록된 작업을 레이어 순서대로 오프스크린 프레임에 그리기"""
+        self.offset = (0, 0)
+        self.frame.fill(self.clear_color)
+        for name in LAYERS:
+            passes = self._passes[name]
+            for draw_fn, args in passes:
+                draw_fn(*args)
+            passes.clear()
+        return self.frame
+
+    def present(self):
+        """프레임을 오프셋만큼 밀어서 화면에 출력"""
+        if self.offset != (0, 0):
+            # 흔들림으로 드러나는 가장자리
+            self.display.fill(BLACK)
+
+        if self.render_scale == 1.0:
+            blit(self.display, self.frame, self.offset, "frame")
+        else:
+            blit(self.display, self.frame.surface, (int(self.offset[0] * self.render_scale),
+                                                    int(self.offset[1] * self.render_scale)), "frame")
+        pygame.display.flip()
@@ -0,0 +1,107 @@
+class EffectComponent:
+    """스케줄러에 등록되는 효과 하나
+
+    update_every : 몇 프레임마다 update 할지
+    min_level    : 이 글리치 레벨부터 활성화
+    cost         : 그리기 비용 추정 (ms, 최고 품질 기준)
+    essential    : True 면 비용 예산과 관계없이 항상 그림 (게임플레이에 영향)
+    label        : 상태 표시용 라벨 (빈 문자열이면 표시 안 함)
+    status_order : 상태 라벨 표시 순서 (작을수록 앞, 그리기 순서와 별개)
+    """
+
+    name = ""
+    update_every = 1
+    min_level = 1
+    cost = 0.0
+    essential = False
+    label = ""
+    status_order = 0
+
+    def __init__(self, owner):
+        self.owner = owner
+        self.visible = False  # update 에서 정하고 draw 에서 사용
+        self.last_update = 0
+
+    def enabled(self):
+        """효과가 켜져 있는지 (owner 상태로 판단)"""
+        return True
+
+    def is_active(self):
+        return self.owner.glitch_level >= self.min_level and self.enabled()
+
+    def update(self, frames):
+        """시뮬레이션 (frames = 지난 update 이후 지난 프레임 수)"""
+
+    def draw(self, screen):
+        """그리기 (update 가 정한 상태만 사용)"""
+
+    def status(self):
+        """상태 표시 라벨 목록"""
+        return (self.label,) if self.label else ()
+
+    def iter_warm(self):
+        """그리기에 쓸 서피스를 미리 만드는 이터레이터 (캐시 워머용)"""
+        return iter(())
+
+    def reset(self):
+        self.visible = False
+        self.last_update = 0
+
+
+class EffectScheduler:
+    """효과 컴포넌트를 각자의 주기로 업데이트하고, 활성 효과만 그림
+
+    비활성 효과는 is_active() 확인 외에는 아무 비용이 들지 않는다.
+    """
+
+    def __init__(self):
+        self.components = []
+        self._status_components = []  # status_order 순 (같으면 등록 순)
+        self.frame = 0
+
+    def register(self, component):
+        """컴포넌트 등록 (등록 순서 = 그리기 순서)"""
+        self.components.append(component)
+        self._status_components = sorted(self.components, key=lambda c: c.status_order)
+        return component
+
+    def update(self):
+        """한 프레임 진행 (주기가 된 활성 컴포넌트만 update)"""
+        self.frame += 1
+        for component in self.components:
+            if not component.is_active():
+                component.visible = False
+                continue
+            elapsed = self.frame - component.last_update
+            if elapsed >= component.update_every:
+                component.update(min(elapsed, component.update_every))
+                component.last_update = self.frame
+
+    def draw(self, screen, budget_ms=None):
+        """보이는 컴포넌트 그리기 (budget_ms 를 넘는 부가 효과는 생략)"""
+        spent = 0.0
+        for component in self.components:
+            if not component.visible or not component.is_active():
+                continue
+            if not component.essential and budget_ms is not None:
+                if spent + component.cost > budget_ms:
+                    continue
+                spent += component.cost
+            component.draw(screen)
+
+    def status(self):
+        """활성 효과의 상태 라벨 목록 (status_order 순)"""
+        labels = []
+        for component in self._status_components:
+            if component.is_active():
+                labels.extend(component.status())
+        return labels
+
+    def estimated_cost(self):
+        """이번 프레임 활성 효과의 그리기 비용 추정 합 (ms)"""
+        return sum(c.cost for c in self.components if c.visible and c.is_active())
+
+    def reset(self):
+        self.frame = 0
+        for component in self.components:
+            component.reset()
@@ -2,6 +2,14 @@ import pygame
 import random
 import math
 import os
+from quality import governor
+from utils import SCREEN_WIDTH, SCREEN_HEIGHT
+from surfaces import create_surface, create_overlay, blit, render_text
+import canvas
+from ambient_audio import AmbientStream, LAYERS as AMBIENT_LAYERS
+from effect_scheduler import EffectComponent, EffectScheduler
+from sound_bank import load_bank
+from spatial_hash import SpatialHash
 
 # 기본 폰트 사용
 def get_korean_font(size=48):
@@ -29,47 +37,131 @@ CREEPY_MESSAGES = [
 ]
 
 
+# 사운드별 재생 정책: (카테고리, 우선순위, 쿨다운 ms, 최대 동시 재생 수)
+SOUND_PROFILES = {
+    'jumpscare': ('scare', 3, 0, 1),
+    'scream': ('scare', 2, 500, 1),
+    'scare': ('scare', 2, 300, 1),
+    'enemy_near': ('ambient', 1, 1500, 1),
+    'footsteps': ('ambient', 1, 1000, 1),
+    'whisper': ('ambient', 1, 800, 1),
+    'static': ('ambient', 1, 600, 1),
+}
+DEFAULT_PROFILE = ('ambient', 1, 0, 1)
+
+SAMPLE_RATE = 22050
+SOUND_NAMES = ('scare', 'whisper', 'scream', 'static', 'footsteps', 'jumpscare', 'enemy_near')
+
+# 카테고리별 예약 채널 수 (나머지 채널은 Sound.play() 직접 재생용)
+# stream 채널은 AmbientStream 전용 (drone/heartbeat/breathing 을 이어서 합성)
+CHANNEL_LAYOUT = [('scare', 2), ('ambient', 4), ('stream', 1)]
+
+# 적이 이 거리 안에 들어오면 심박/숨소리가 빨라짐
+AMBIENT_PROXIMITY = 300
+FREE_CHANNELS = 2
+
+
+class ChannelManager:
+    """카테고리별 예약 채널, 쿨다운, 동시 재생 제한, 우선순위 스틸"""
+
+    def __init__(self, layout=CHANNEL_LAYOUT, profiles=SOUND_PROFILES):
+        self.profiles = profiles
+        reserved = sum(count for _, count in layout)
+        pygame.mixer.set_num_channels(reserved + FREE_CHANNELS)
+        pygame.mixer.set_reserved(reserved)
+
+        self.channels = {}  # 카테고리 -> [Channel]
+        index = 0
+        for category, count in layout:
+            self.channels[category] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+
+        self.playing = {}    # (카테고리, 슬롯) -> (사운드 이름, 우선순위, 시작 시각)
+        self.last_played = {}  # 사운드 이름 -> 마지막 재생 시각
+        self.dropped = 0
+
+    def _profile(self, sound_name):
+        return self.profiles.get(sound_name, DEFAULT_PROFILE)
+
+    def _slot_info(self, category, slot):
+        return self.playing.get((category, slot), (None, 0, 0))
+
+    def play(self, sound_name, sound, volume):
+        """정책에 따라 채널을 골라 재생 (재생 못하면 False)"""
+        category, priority, cooldown, max_instances = self._profile(sound_name)
+        now = pygame.time.get_ticks()
+
+        last = self.last_played.get(sound_name)
+        if last is not None and now - last < cooldown:
+            self.dropped += 1
+            return False
+
+        channels = self.channels[category]
+        busy = [i for i, ch in enumerate(channels) if ch.get_busy()]
+        instances = sum(1 for i in busy if self._slot_info(category, i)[0] == sound_name)
+        if instances >= max_instances:
+            self.dropped += 1
+            return False
+
+        slot = next((i for i, ch in enumerate(channels) if not ch.get_busy()), None)
+        if slot is None:
+            # 우선순위가 가장 낮고 가장 오래된 채널을 빼앗음
+            slot = min(busy, key=lambda i: self._slot_info(category, i)[1:])
+            if self._slot_info(category, slot)[1] >= priority:
+                self.dropped += 1
+                return False
+            channels[slot].stop()
+
+        channel = channels[slot]
+        channel.set_volume(volume)
+        channel.play(sound)
+        self.playing[(category, slot)] = (sound_name, priority, now)
+        self.last_played[sound_name] = now
+        return True
+
+    def stop_all(self):
+        """예약 채널 모두 정지"""
+        for channels in self.channels.values():
+            for channel in channels:
+                channel.stop()
+        self.playing.clear()
+
+
 class SoundManager:
     """사운드 관리 클래스"""
 
     def __init__(self):
-        pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
+        pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
         self.sounds = {}
         self._generate_sounds()
+        self.channels = ChannelManager()
+        self.ambient = AmbientStream(self.channels.channels['stream'][0])
 
     def _generate_sounds(self):
-        """프로시저럴 사운드 생성"""
-        self.sounds['drone'] = self._create_drone_sound()
-        self.sounds['scare'] = self._create_scare_sound()
-        self.sounds['whisper'] = self._create_whisper_sound()
-        self.sounds['heartbeat'] = self._create_heartbeat_sound()
-        self.sounds['scream'] = self._create_scream_sound()
-        self.sounds['static'] = self._create_static_sound()
-        self.sounds['breathing'] = self._create_breathing_sound()
-        self.sounds['footsteps'] = self._create_footsteps_sound()
-        self.sounds['jumpscare'] = self._create_jumpscare_sound()
-        self.sounds['enemy_near'] = self._create_enemy_near_sound()
-
-    def _create_drone_sound(self):
-        """저주파 드론 사운드"""
-        sample_rate = 22050
-        duration = 2.0
-        samples = int(sample_rate * duration)
-
-        sound_array = []
-        for i in range(samples):
-            t = i / sample_rate
-            val = (math.sin(2 * math.pi * 50 * t) * 0.3 +
-                   math.sin(2 * math.pi * 75 * t) * 0.2 +
-                   math.sin(2 * math.pi * 100 * t) * 0.1 +
-                   random.uniform(-0.1, 0.1))
-            sound_array.append(int(val * 32767 * 0.3))
-
-        return self._array_to_sound(sound_array, sample_rate)
-
-    def _create_scare_sound(self):
+        """효과음 준비 (미리 구운 sounds.bin 이 있으면 사용, 없으면 합성)"""
+        samples = load_bank(SAMPLE_RATE)
+        if samples is None or any(name not in samples for name in SOUND_NAMES):
+            samples = self.synthesize()
+        for name in SOUND_NAMES:
+            self.sounds[name] = self._array_to_sound(samples[name], SAMPLE_RATE)
+
+    @classmethod
+    def synthesize(cls):
+        """프로시저럴 효과음 합성 ({이름: 모노 샘플})"""
+        return {
+            'scare': cls._create_scare_sound(),
+            'whisper': cls._create_whisper_sound(),
+            'scream': cls._create_scream_sound(),
+            'static': cls._create_static_sound(),
+            'footsteps': cls._create_footsteps_sound(),
+            'jumpscare': cls._create_jumpscare_sound(),
+            'enemy_near': cls._create_enemy_near_sound(),
+        }
+
+    @staticmethod
+    def _create_scare_sound():
         """갑작스러운 공포 사운드"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 0.5
         samples = int(sample_rate * duration)
 
@@ -82,11 +174,12 @@ class SoundManager:
                    random.uniform(-0.3, 0.3)) * envelope
             sound_array.append(int(val * 32767 * 0.5))
 
-        return self._array_to_sound(sound_array, sample_rate)
+        return sound_array
 
-    def _create_whisper_sound(self):
+    @staticmethod
+    def _create_whisper_sound():
         """속삭이는 노이즈"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 1.5
         samples = int(sample_rate * duration)
 
@@ -97,27 +190,12 @@ class SoundManager:
             val *= (0.5 + 0.5 * math.sin(2 * math.pi * 3 * t))
             sound_array.append(int(val * 32767 * 0.3))
 
-        return self._array_to_sound(sound_array, sample_rate)
-
-    def _create_heartbeat_sound(self):
-        """심장박동 사운드"""
-        sample_rate = 22050
-        duration = 1.0
-        samples = int(sample_rate * duration)
-
-        sound_array = []
-        for i in range(samples):
-            t = i / sample_rate
-            pulse1 = math.exp(-((t - 0.1) ** 2) * 500) * math.sin(2 * math.pi * 60 * t)
-            pulse2 = math.exp(-((t - 0.25) ** 2) * 500) * math.sin(2 * math.pi * 50 * t) * 0.7
-            val = (pulse1 + pulse2) * 0.8
-            sound_array.append(int(val * 32767 * 0.4))
-
-        return self._array_to_sound(sound_array, sample_rate)
+        return sound_array
 
-    def _create_scream_sound(self):
+    @staticmethod
+    def _create_scream_sound():
         """비명 사운드"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 0.8
         samples = int(sample_rate * duration)
 
@@ -130,11 +208,12 @@ class SoundManager:
             val += random.uniform(-0.2, 0.2) * envelope
             sound_array.append(int(val * 32767 * 0.6))
 
-        return self._array_to_sound(sound_array, sample_rate)
+        return sound_array
 
-    def _create_static_sound(self):
+    @staticmethod
+    def _create_static_sound():
         """TV 정적 노이즈"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 1.0
         samples = int(sample_rate * duration)
 
@@ -143,27 +222,12 @@ class SoundManager:
             val = random.uniform(-0.5, 0.5)
             sound_array.append(int(val * 32767 * 0.3))
 
-        return self._array_to_sound(sound_array, sample_rate)
-
-    def _create_breathing_sound(self):
-        """거친 숨소리"""
-        sample_rate = 22050
-        duration = 2.0
-        samples = int(sample_rate * duration)
-
-        sound_array = []
-        for i in range(samples):
-            t = i / sample_rate
-            breath = math.sin(2 * math.pi * 0.5 * t)
-            noise = random.uniform(-0.3, 0.3)
-            val = (breath * 0.3 + noise * abs(breath)) * 0.5
-            sound_array.append(int(val * 32767 * 0.4))
+        return sound_array
 
-        return self._array_to_sound(sound_array, sample_rate)
-
-    def _create_footsteps_sound(self):
+    @staticmethod
+    def _create_footsteps_sound():
         """발소리"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 1.5
         samples = int(sample_rate * duration)
 
@@ -178,11 +242,12 @@ class SoundManager:
             val += random.uniform(-0.05, 0.05)
             sound_array.append(int(val * 32767 * 0.5))
 
-        return self._array_to_sound(sound_array, sample_rate)
+        return sound_array
 
-    def _create_jumpscare_sound(self):
+    @staticmethod
+    def _create_jumpscare_sound():
         """점프스케어 사운드"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 0.3
         samples = int(sample_rate * duration)
 
@@ -196,11 +261,12 @@ class SoundManager:
                    random.uniform(-0.5, 0.5)) * envelope
             sound_array.append(int(val * 32767 * 0.8))
 
-        return self._array_to_sound(sound_array, sample_rate)
+        return sound_array
 
-    def _create_enemy_near_sound(self):
+    @staticmethod
+    def _create_enemy_near_sound():
         """적 근접 경고음"""
-        sample_rate = 22050
+        sample_rate = SAMPLE_RATE
         duration = 1.0
         samples = int(sample_rate * duration)
 
@@ -212,24 +278,28 @@ class SoundManager:
             val += random.uniform(-0.1, 0.1)
             sound_array.append(int(val * 32767 * 0.5))
 
-        return self._array_to_sound(sound_array, sample_rate)
+        return sound_array
 
     def _array_to_sound(self, array, sample_rate):
-        """배열을 pygame Sound로 변환"""
+        """모노 샘플을 스테레오 pygame Sound로 변환"""
         import array as arr
-        stereo = []
-        for val in array:
-            stereo.extend([val, val])
+        if not isinstance(array, arr.array):
+            # 16비트 범위로 클리핑 (넘치면 Sound 생성 자체가 실패함)
+            array = arr.array('h', (max(-32768, min(32767, val)) for val in array))
 
-        sound_buffer = arr.array('h', stereo)
+        sound_buffer = arr.array('h', bytes(4 * len(array)))
+        sound_buffer[0::2] = array
+        sound_buffer[1::2] = array
         sound = pygame.mixer.Sound(buffer=sound_buffer)
         return sound
 
     def play(self, sound_name, volume=0.5):
-        """사운드 재생"""
-        if sound_name in self.sounds:
-            self.sounds[sound_name].set_volume(volume)
-            self.sounds[sound_name].play()
+        """사운드 재생 (앰비언트 레이어 이름이면 스트림에서 잠깐 강조)"""
+        if sound_name in AMBIENT_LAYERS:
+            self.ambient.swell(sound_name, volume)
+        elif sound_name in self.sounds:
+            # 공유 Sound 의 볼륨은 건드리지 않고 채널 볼륨으로 재생
+            self.channels.play(sound_name, self.sounds[sound_name], volume)
 
     def play_random_creepy(self):
         """랜덤 무서운 소리 재생"""
@@ -238,14 +308,48 @@ class SoundManager:
         self.play(sound_name, random.uniform(0.3, 0.7))
 
 
+# 반납된 적 슬롯을 보관할 최대 수 (clear_enemies 때 반납)
+ENEMY_POOL_SIZE = 16
+# 적끼리 이 거리 안이면 서로 밀어냄 (겹쳐 쌓이지 않도록), 한 프레임에 밀리는 최대 거리
+ENEMY_SEPARATION = 50
+SEPARATION_PUSH = 1.0
+# 플레이어 이 거리 안의 적은 가끔 경고음
+ENEMY_NEAR_RADIUS = 150
+
+_demon_shadow = None  # 악마 그림자 서피스 (모양이 고정이라 하나만 만듦)
+_ghost_surface = None  # 유령 그리기용 작업 서피스 (적을 순서대로 그리므로 하나를 같이 씀)
+
+
+def _get_demon_shadow():
+    global _demon_shadow
+    if _demon_shadow is None:
+        shadow = create_surface((80, 80), alpha=True, owner="enemies")
+        pygame.draw.circle(shadow, (0, 0, 0, 50), (40, 50), 35)
+        _demon_shadow = shadow
+    return _demon_shadow
+
+
+def _get_ghost_surface():
+    global _ghost_surface
+    if _ghost_surface is None:
+        _ghost_surface = create_surface((100, 120), alpha=True, owner="enemies")
+    return _ghost_surface
+
+
 class Enemy:
     """무서운 적 클래스"""
 
+    SIZE = 40
+
     def __init__(self, x, y, speed=1.5):
+        self.size = self.SIZE
+        self.reset(x, y, speed)
+
+    def reset(self, x, y, speed=1.5):
+        """슬롯 재사용을 위한 초기화"""
         self.x = x
         self.y = y
         self.speed = speed
-        self.size = 40
         self.animation_timer = 0
         self.visible = True
         self.flicker_timer = 0
@@ -302,23 +406,24 @@ class Enemy:
         # 불규칙한 검은 형체
         color = (20, 0, 20)
 
-        # 메인 바디
+        # 메인 바디 (디테일이 낮으면 꼭짓점 수 감소)
         points = []
-        for i in range(8):
-            angle = 2 * math.pi * i / 8 + self.animation_timer * 0.05
+        corners = 8 if governor.get('sprite_detail') >= 1 else 5
+        for i in range(corners):
+            angle = 2 * math.pi * i / corners + self.animation_timer * 0.05
             r = self.size + random.randint(-5, 10) + 5 * math.sin(self.animation_timer * 0.1 + i)
             px = x + r * math.cos(angle)
             py = y + r * math.sin(angle)
             points.append((px, py))
-        pygame.draw.polygon(screen, color, points)
+        canvas.polygon(screen, color, points)
 
         # 빨간 눈
         eye_y = y - 5 + 3 * math.sin(self.animation_timer * 0.1)
-        pygame.draw.circle(screen, (255, 0, 0), (x - 10, int(eye_y)), 5)
-        pygame.draw.circle(screen, (255, 0, 0), (x + 10, int(eye_y)), 5)
+        canvas.circle(screen, (255, 0, 0), (x - 10, int(eye_y)), 5)
+        canvas.circle(screen, (255, 0, 0), (x + 10, int(eye_y)), 5)
         # 눈 하이라이트
-        pygame.draw.circle(screen, (255, 255, 255), (x - 8, int(eye_y) - 2), 2)
-        pygame.draw.circle(screen, (255, 255, 255), (x + 12, int(eye_y) - 2), 2)
+        canvas.circle(screen, (255, 255, 255), (x - 8, int(eye_y) - 2), 2)
+        canvas.circle(screen, (255, 255, 255), (x + 12, int(eye_y) - 2), 2)
 
     def _draw_crawler(self, screen, x, y):
         """기어다니는 형태의 적"""
@@ -326,30 +431,33 @@ class Enemy:
 
         # 몸통
         body_y = y + 5 * math.sin(self.animation_timer * 0.2)
-        pygame.draw.ellipse(screen, color, (x - 30, body_y - 15, 60, 30))
+        canvas.ellipse(screen, color, (x - 30, body_y - 15, 60, 30))
 
         # 다리들 (여러개, 움직임)
         for i in range(6):
             leg_x = x - 25 + i * 10
             leg_phase = self.animation_timer * 0.3 + i * 0.5
             leg_y = y + 15 + 10 * abs(math.sin(leg_phase))
-            pygame.draw.line(screen, color, (leg_x, int(body_y) + 10),
-                           (leg_x, int(leg_y)), 3)
+            canvas.line(screen, color, (leg_x, int(body_y) + 10),
+                      (leg_x, int(leg_y)), 3)
 
         # 머리
-        pygame.draw.circle(screen, color, (x, int(body_y) - 10), 15)
+        canvas.circle(screen, color, (x, int(body_y) - 10), 15)
 
         # 여러 개의 눈
         for i in range(4):
             ex = x - 10 + i * 7
             ey = body_y - 12
-            pygame.draw.circle(screen, (200, 0, 0), (ex, int(ey)), 3)
-            pygame.draw.circle(screen, (255, 100, 100), (ex, int(ey)), 1)
+            canvas.circle(screen, (200, 0, 0), (ex, int(ey)), 3)
+            if governor.get('sprite_detail') >= 1:
+                canvas.circle(screen, (255, 100, 100), (ex, int(ey)), 1)
 
     def _draw_ghost(self, screen, x, y):
         """유령 형태의 적"""
-        # 반투명 효과를 위한 서페이스
-        ghost_surface = pygame.Surface((100, 120), pygame.SRCALPHA)
+        # 반투명 효과를 위한 서페이스 (매 프레임 지우고 다시 그림)
+        ghost_surface = _get_ghost_surface()
+        ghost_surface.fill((0, 0, 0, 0))
+        canvas.changed(ghost_surface)
 
         # 유령 몸체
         color = (150, 150, 150, 180)
@@ -374,23 +482,23 @@ class Enemy:
         # 입 (벌어진)
         pygame.draw.ellipse(ghost_surface, (0, 0, 0), (40, 55 + wave, 20, 15))
 
-        screen.blit(ghost_surface, (x - 50, y - 60))
+        blit(screen, ghost_surface, (x - 50, y - 60), "ghost")
 
     def _draw_demon(self, screen, x, y):
         """악마 형태의 적"""
         color = (80, 0, 0)
 
         # 머리
-        pygame.draw.circle(screen, color, (x, y), 25)
+        canvas.circle(screen, color, (x, y), 25)
 
         # 뿔
         horn_wave = 3 * math.sin(self.animation_timer * 0.1)
-        pygame.draw.polygon(screen, (40, 0, 0), [
+        canvas.polygon(screen, (40, 0, 0), [
             (x - 20, y - 15),
             (x - 30 + horn_wave, y - 45),
             (x - 10, y - 20)
         ])
-        pygame.draw.polygon(screen, (40, 0, 0), [
+        canvas.polygon(screen, (40, 0, 0), [
             (x + 20, y - 15),
             (x + 30 - horn_wave, y - 45),
             (x + 10, y - 20)
@@ -398,290 +506,216 @@ class Enemy:
 
         # 눈 (노란색, 빛남)
         glow = 155 + int(100 * abs(math.sin(self.animation_timer * 0.2)))
-        pygame.draw.circle(screen, (glow, glow, 0), (x - 10, y - 5), 8)
-        pygame.draw.circle(screen, (glow, glow, 0), (x + 10, y - 5), 8)
-        pygame.draw.circle(screen, (0, 0, 0), (x - 10, y - 5), 4)
-        pygame.draw.circle(screen, (0, 0, 0), (x + 10, y - 5), 4)
+        canvas.circle(screen, (glow, glow, 0), (x - 10, y - 5), 8)
+        canvas.circle(screen, (glow, glow, 0), (x + 10, y - 5), 8)
+        canvas.circle(screen, (0, 0, 0), (x - 10, y - 5), 4)
+        canvas.circle(screen, (0, 0, 0), (x + 10, y - 5), 4)
 
         # 이빨
         for i in range(5):
             tx = x - 12 + i * 6
-            pygame.draw.polygon(screen, (200, 200, 200), [
+            canvas.polygon(screen, (200, 200, 200), [
                 (tx, y + 15),
                 (tx + 3, y + 25),
                 (tx + 6, y + 15)
             ])
 
         # 그림자 효과
-        shadow_surface = pygame.Surface((80, 80), pygame.SRCALPHA)
-        pygame.draw.circle(shadow_surface, (0, 0, 0, 50), (40, 50), 35)
-        screen.blit(shadow_surface, (x - 40, y - 20))
+        if governor.get('sprite_detail') >= 1:
+            blit(screen, _get_demon_shadow(), (x - 40, y - 20), "demon_shadow")
 
 
-class GlitchEffect:
-    """글리치 효과 관리 클래스"""
+class EnemyPool:
+    """적 객체 풀 (게임을 다시 시작할 때 비운 적 슬롯을 다시 사용)"""
 
-    def __init__(self):
-        self.glitch_level = 0
-        self.control_inverted_h = False
-        self.control_inverted_v = False
-        self.screen_shake = 0
-        self.color_shift = 0
-        self.flicker_timer = 0
-        self.random_effects = []
+    def __init__(self, capacity=ENEMY_POOL_SIZE):
+        self.capacity = capacity
+        self.free = []
+        self.created = 0  # 지금까지 새로 만든 적 수
 
-        # 무서운 효과들
-        self.darkness_level = 0
-        self.show_skull = False
-        self.skull_timer = 0
-        self.skull_pos = (0, 0)
-        self.skull_scale = 1.0
-        self.bloody_screen = False
-        self.static_noise = False
-        self.creepy_text = ""
-        self.creepy_text_timer = 0
-        self.font = None
+    def acquire(self, x, y, speed):
+        """빈 슬롯이 있으면 재사용, 없으면 새로 생성"""
+        if self.free:
+            enemy = self.free.pop()
+            enemy.reset(x, y, speed)
+            return enemy
+        self.created += 1
+        return Enemy(x, y, speed)
 
-        # 사운드 매니저
-        try:
-            self.sound_manager = SoundManager()
-        except:
-            self.sound_manager = None
+    def release(self, enemy):
+        """적 슬롯 반납"""
+        if len(self.free) < self.capacity:
+            self.free.append(enemy)
 
-        # 적 리스트
-        self.enemies = []
-        self.enemy_spawn_timer = 0
 
-    def add_glitch(self):
-        """글리치 레벨 증가"""
-        self.glitch_level += 1
-        self._apply_random_effect()
+class ScreenShake(EffectComponent):
+    """화면 흔들림 (출력 오프셋으로 적용)"""
 
-        # 소리 재생
-        if self.sound_manager:
-            self.sound_manager.play_random_creepy()
+    name = 'shake'
 
-    def spawn_enemy(self, screen_width, screen_height, player_x, player_y):
-        """적 생성"""
-        # 플레이어와 멀리서 스폰
-        side = random.choice(['top', 'bottom', 'left', 'right'])
-        if side == 'top':
-            x = random.randint(50, screen_width - 50)
-            y = -50
-        elif side == 'bottom':
-            x = random.randint(50, screen_width - 50)
-            y = screen_height + 50
-        elif side == 'left':
-            x = -50
-            y = random.randint(50, screen_height - 50)
-        else:
-            x = screen_width + 50
-            y = random.randint(50, screen_height - 50)
+    def enabled(self):
+        return self.owner.screen_shake > 0
 
-        speed = 1.0 + self.glitch_level * 0.3
-        enemy = Enemy(x, y, speed)
-        self.enemies.append(enemy)
+    def update(self, frames):
+        shake = self.owner.screen_shake
+        self.visible = True  # 매 프레임 오프셋이 바뀌므로 항상 다시 그려야 함
+        self.owner.shake_offset = (random.randint(-shake, shake), random.randint(-shake, shake))
 
-        if self.sound_manager:
-            self.sound_manager.play('footsteps', 0.3)
 
-    def update_enemies(self, player_x, player_y, screen_width, screen_height):
-        """적들 업데이트"""
-        if self.glitch_level == 0:
-            return False
+class ControlGlitch(EffectComponent):
+    """조작 반전 (상태 표시만, 실제 반전은 apply_control_glitch)"""
 
-        # 적 스폰
-        self.enemy_spawn_timer += 1
-        spawn_interval = max(300 - self.glitch_level * 30, 120)  # 글리치 레벨에 따라 빨라짐
+    name = 'controls'
+    status_order = 0
 
-        if self.enemy_spawn_timer >= spawn_interval and len(self.enemies) < self.glitch_level + 1:
-            self.spawn_enemy(screen_width, screen_height, player_x, player_y)
-            self.enemy_spawn_timer = 0
+    def enabled(self):
+        return self.owner.control_inverted_h or self.owner.control_inverted_v
 
-        # 적 업데이트 및 충돌 체크
-        for enemy in self.enemies:
-            enemy.update(player_x, player_y)
+    def status(self):
+        return ("???",) * (self.owner.control_inverted_h + self.owner.control_inverted_v)
 
-            # 가까이 오면 경고음
-            dist = math.sqrt((enemy.x - player_x)**2 + (enemy.y - player_y)**2)
-            if dist < 150 and random.random() < 0.02:
-                if self.sound_manager:
-                    self.sound_manager.play('enemy_near', 0.3)
 
-            if enemy.check_collision(player_x, player_y):
-                if self.sound_manager:
-                    self.sound_manager.play('jumpscare', 0.8)
-                return True  # 충돌!
+class StaticNoise(EffectComponent):
+    """TV 정적 노이즈 (30fps 로 패턴 갱신)"""
 
-        return False
+    name = 'static'
+    update_every = 2
 
-    def draw_enemies(self, screen):
-        """적들 그리기"""
-        for enemy in self.enemies:
-            enemy.draw(screen)
+    def __init__(self, owner):
+        super().__init__(owner)
+        self.count = 0
+        self._rects = []  # 노이즈 점 (Rect 재사용)
+        self._grays = []
 
-    def _apply_random_effect(self):
-        """랜덤한 글리치 효과 적용"""
-        effects = [
-            'invert_horizontal',
-            'invert_vertical',
-            'screen_shake',
-            'darkness',
-            'skull',
-            'bloody',
-            'static',
-            'slow_controls',
-            'fast_controls',
-        ]
-
-        num_effects = min(self.glitch_level + 1, 4)
-        chosen = random.sample(effects, num_effects)
+    def enabled(self):
+        return self.owner.static_noise
 
-        for effect in chosen:
-            if effect == 'invert_horizontal':
-                self.control_inverted_h = not self.control_inverted_h
-            elif effect == 'invert_vertical':
-                self.control_inverted_v = not self.control_inverted_v
-            elif effect == 'screen_shake':
-                self.screen_shake = min(self.screen_shake + 5, 20)
-            elif effect == 'darkness':
-                self.darkness_level = min(self.darkness_level + 50, 180)
-            elif effect == 'skull':
-                self.show_skull = True
-            elif effect == 'bloody':
-                self.bloody_screen = True
-            elif effect == 'static':
-                self.static_noise = True
-            elif effect not in self.random_effects:
-                self.random_effects.append(effect)
-
-    def apply_control_glitch(self, dx, dy):
-        """조작에 글리치 적용"""
-        if self.glitch_level == 0:
-            return dx, dy
-
-        new_dx, new_dy = dx, dy
-
-        if self.control_inverted_h:
-            new_dx = -dx
-        if self.control_inverted_v:
-            new_dy = -dy
-
-        if 'slow_controls' in self.random_effects:
-            new_dx *= 0.5
-            new_dy *= 0.5
-        if 'fast_controls' in self.random_effects:
-            new_dx *= 1.5
-            new_dy *= 1.5
+    def update(self, frames):
+        self.visible = random.random() < 0.3
+        if not self.visible:
+            return
 
-        return new_dx, new_dy
+        width, height = self.owner.size
+        count = int(100 * self.owner.glitch_level * governor.get('noise_density'))
+        rects, grays = self._rects, self._grays
+        while len(rects) < count:
+            rects.append(pygame.Rect(0, 0, 1, 1))
+            grays.append(0)
+        for i in range(count):
+            rects[i].update(random.randint(0, width - 3), random.randint(0, height - 3),
+                            random.randint(1, 5), random.randint(1, 5))
+            grays[i] = random.randint(0, 255)
+        self.count = count
+        self.cost = count * 0.002
+
+        if random.random() < 0.1 and self.owner.sound_manager:
+            self.owner.sound_manager.play('static', 0.2)
 
-    def apply_visual_glitch(self, screen):
-        """화면에 시각적 글리치 적용"""
-        if self.glitch_level == 0:
-            return (0, 0)
+    def draw(self, screen):
+        rects, grays = self._rects, self._grays
+        for i in range(self.count):
+            gray = grays[i]
+            canvas.rect(screen, (gray, gray, gray), rects[i])
 
-        offset_x, offset_y = 0, 0
-        width, height = screen.get_size()
 
-        if self.font is None:
-            self.font = get_korean_font(48)
+class BloodSplatter(EffectComponent):
+    """흘러내리는 핏자국 (가끔 깜빡 사라짐)"""
 
-        # 화면 흔들림
-        if self.screen_shake > 0:
-            offset_x = random.randint(-self.screen_shake, self.screen_shake)
-            offset_y = random.randint(-self.screen_shake, self.screen_shake)
-
-        # TV 정적 노이즈
-        if self.static_noise and random.random() < 0.3:
-            for _ in range(100 * self.glitch_level):
-                x = random.randint(0, width - 3)
-                y = random.randint(0, height - 3)
-                gray = random.randint(0, 255)
-                pygame.draw.rect(screen, (gray, gray, gray),
-                                 (x, y, random.randint(1, 5), random.randint(1, 5)))
-            if random.random() < 0.1 and self.sound_manager:
-                self.sound_manager.play('static', 0.2)
-
-        # 핏자국 효과
-        if self.bloody_screen:
-            self._draw_blood(screen)
-
-        # 해골 표시
-        if self.show_skull:
-            self.skull_timer += 1
-            if self.skull_timer % 90 < 60:
-                if random.random() < 0.01:
-                    self.skull_pos = (random.randint(50, width - 200),
-                                      random.randint(50, height - 250))
-                    self.skull_scale = random.uniform(0.8, 1.5)
-                    # 5% 확률로 샌즈 (이스터에그)
-                    self.is_sans = random.random() < 0.05
-                    if self.sound_manager:
-                        self.sound_manager.play('scare', 0.5)
-                if hasattr(self, 'is_sans') and self.is_sans:
-                    self._draw_sans(screen, self.skull_pos[0], self.skull_pos[1], self.skull_scale)
-                else:
-                    self._draw_realistic_skull(screen, self.skull_pos[0], self.skull_pos[1], self.skull_scale)
-
-        # 화면 어둡게
-        if self.darkness_level > 0:
-            dark_overlay = pygame.Surface((width, height))
-            dark_overlay.fill((0, 0, 0))
-            dark_overlay.set_alpha(self.darkness_level)
-            screen.blit(dark_overlay, (0, 0))
-
-        # 무서운 텍스트 랜덤 표시
-        if self.creepy_text_timer > 0:
-            self.creepy_text_timer -= 1
-            text_surface = self.font.render(self.creepy_text, True, (150, 0, 0))
-            text_x = width // 2 - text_surface.get_width() // 2
-            text_y = random.randint(100, height - 100)
-            screen.blit(text_surface, (text_x + random.randint(-3, 3),
-                                       text_y + random.randint(-3, 3)))
-        elif random.random() < 0.005 * self.glitch_level:
-            self.creepy_text = random.choice(CREEPY_MESSAGES)
-            self.creepy_text_timer = 90
-            if self.sound_manager:
-                self.sound_manager.play('whisper', 0.4)
-
-        # 깜빡임
-        if random.random() < 0.02 * self.glitch_level:
-            flash = pygame.Surface((width, height))
-            flash.fill((255, 255, 255) if random.random() < 0.5 else (255, 0, 0))
-            flash.set_alpha(random.randint(30, 100))
-            screen.blit(flash, (0, 0))
-
-        # 랜덤 소리
-        if random.random() < 0.003 * self.glitch_level and self.sound_manager:
-            self.sound_manager.play_random_creepy()
+    name = 'blood'
+    label = "BLOOD"
+    status_order = 3
+    update_every = 2
+    cost = 0.5
 
-        return (offset_x, offset_y)
+    def enabled(self):
+        return self.owner.bloody_screen
 
-    def _draw_blood(self, screen):
-        """핏자국 그리기"""
-        if random.random() < 0.1:
-            return
+    def update(self, frames):
+        self.visible = random.random() >= 0.1
 
+    def draw(self, screen):
         width, height = screen.get_size()
+        particles = governor.get('particles')
 
         # 흘러내리는 핏자국
-        for _ in range(3):
+        for _ in range(max(1, round(3 * particles))):
             x = random.randint(0, width)
             blood_color = (random.randint(100, 180), 0, 0)
 
             for y in range(0, random.randint(50, 200), 5):
                 x += random.randint(-2, 2)
-                pygame.draw.circle(screen, blood_color, (x, y), random.randint(2, 5))
+                canvas.circle(screen, blood_color, (x, y), random.randint(2, 5))
 
         # 구석에 핏자국 얼룩
         for _ in range(2):
             bx = random.choice([random.randint(0, 100), random.randint(width - 100, width)])
             by = random.choice([random.randint(0, 100), random.randint(height - 100, height)])
-            for _ in range(10):
-                pygame.draw.circle(screen, (120, 0, 0),
-                                   (bx + random.randint(-30, 30), by + random.randint(-30, 30)),
-                                   random.randint(3, 15))
+            for _ in range(max(1, round(10 * particles))):
+                canvas.circle(screen, (120, 0, 0),
+                              (bx + random.randint(-30, 30), by + random.randint(-30, 30)),
+                              random.randint(3, 15))
+
+
+
+class SkullApparition(EffectComponent):
+    """가끔 위치를 바꾸며 나타나는 해골 (5% 확률로 샌즈)"""
+
+    name = 'skull'
+    label = "..."
+    status_order = 2
+    cost = 0.4
+    essential = True
+    glow_sizes = range(24, 61)  # int(30*scale), int(40*scale), scale 0.8~1.5
+
+    def __init__(self, owner):
+        super().__init__(owner)
+        self._glow_surfaces = {}  # 크기 -> 글로우 서피스 (재사용)
+        self.reset()
+
+    def enabled(self):
+        return self.owner.show_skull
+
+    def update(self, frames):
+        self.timer += frames
+        self.visible = self.timer % 90 < 60
+        if self.visible and random.random() < 0.01 * frames:
+            width, height = self.owner.size
+            self.pos = (random.randint(50, width - 200), random.randint(50, height - 250))
+            self.scale = random.uniform(0.8, 1.5)
+            # 5% 확률로 샌즈 (이스터에그)
+            self.is_sans = random.random() < 0.05
+            if self.owner.sound_manager:
+                self.owner.sound_manager.play('scare', 0.5)
+
+    def draw(self, screen):
+        if self.is_sans:
+            self._draw_sans(screen, self.pos[0], self.pos[1], self.scale)
+        else:
+            self._draw_realistic_skull(screen, self.pos[0], self.pos[1], self.scale)
+
+    def reset(self):
+        super().reset()
+        self.timer = 0
+        self.pos = (0, 0)
+        self.scale = 1.0
+        self.is_sans = False
+
+    def iter_warm(self):
+        for size in self.glow_sizes:
+            if size not in self._glow_surfaces:
+                self._glow_surfaces[size] = create_surface((size, size), alpha=True, owner="glitch")
+            yield
+
+    def _get_glow(self, size):
+        """글로우용 알파 서피스 (크기별로 하나씩 재사용, 투명하게 지워서 반환)"""
+        glow = self._glow_surfaces.get(size)
+        if glow is None:
+            glow = create_surface((size, size), alpha=True, owner="glitch")
+            self._glow_surfaces[size] = glow
+        else:
+            glow.fill((0, 0, 0, 0))
+            canvas.changed(glow)
+        return glow
 
     def _draw_realistic_skull(self, screen, x, y, scale=1.0):
         """리얼한 해골 그리기"""
@@ -698,24 +732,24 @@ class GlitchEffect:
         skull_height = int(180 * s)
 
         # 두개골 상단 (둥근 부분)
-        pygame.draw.ellipse(screen, bone_color,
-                           (x, y, skull_width, int(skull_height * 0.7)))
+        canvas.ellipse(screen, bone_color,
+                      (x, y, skull_width, int(skull_height * 0.7)))
 
         # 하이라이트
-        pygame.draw.ellipse(screen, bone_highlight,
-                           (x + int(20*s), y + int(10*s), int(40*s), int(30*s)))
+        canvas.ellipse(screen, bone_highlight,
+                      (x + int(20*s), y + int(10*s), int(40*s), int(30*s)))
 
         # 그림자
-        pygame.draw.ellipse(screen, bone_shadow,
-                           (x + int(10*s), y + int(skull_height * 0.5),
-                            int(skull_width - 20*s), int(40*s)))
+        canvas.ellipse(screen, bone_shadow,
+                      (x + int(10*s), y + int(skull_height * 0.5),
+                       int(skull_width - 20*s), int(40*s)))
 
         # 광대뼈
         cheek_y = y + int(90 * s)
-        pygame.draw.ellipse(screen, bone_color,
-                           (x - int(5*s), cheek_y, int(50*s), int(40*s)))
-        pygame.draw.ellipse(screen, bone_color,
-                           (x + skull_width - int(45*s), cheek_y, int(50*s), int(40*s)))
+        canvas.ellipse(screen, bone_color,
+                      (x - int(5*s), cheek_y, int(50*s), int(40*s)))
+        canvas.ellipse(screen, bone_color,
+                      (x + skull_width - int(45*s), cheek_y, int(50*s), int(40*s)))
 
         # 눈구멍 (더 크고 깊게)
         eye_y = y + int(50 * s)
@@ -725,49 +759,50 @@ class GlitchEffect:
         eye_height = int(45 * s)
 
         # 눈구멍 그림자
-        pygame.draw.ellipse(screen, (10, 5, 5),
-                           (left_eye_x - 3, eye_y - 3, eye_width + 6, eye_height + 6))
-        pygame.draw.ellipse(screen, (10, 5, 5),
-                           (right_eye_x - 3, eye_y - 3, eye_width + 6, eye_height + 6))
+        canvas.ellipse(screen, (10, 5, 5),
+                      (left_eye_x - 3, eye_y - 3, eye_width + 6, eye_height + 6))
+        canvas.ellipse(screen, (10, 5, 5),
+                      (right_eye_x - 3, eye_y - 3, eye_width + 6, eye_height + 6))
 
         # 눈구멍
-        pygame.draw.ellipse(screen, eye_socket,
-                           (left_eye_x, eye_y, eye_width, eye_height))
-        pygame.draw.ellipse(screen, eye_socket,
-                           (right_eye_x, eye_y, eye_width, eye_height))
+        canvas.ellipse(screen, eye_socket,
+                      (left_eye_x, eye_y, eye_width, eye_height))
+        canvas.ellipse(screen, eye_socket,
+                      (right_eye_x, eye_y, eye_width, eye_height))
 
         # 눈 안에 빨간 빛 (깜빡임)
         if random.random() < 0.4:
             glow_intensity = random.randint(150, 255)
-            pygame.draw.circle(screen, (glow_intensity, 0, 0),
-                             (left_eye_x + int(eye_width/2), eye_y + int(eye_height/2)),
-                             int(8*s))
-            pygame.draw.circle(screen, (glow_intensity, 0, 0),
-                             (right_eye_x + int(eye_width/2), eye_y + int(eye_height/2)),
-                             int(8*s))
+            canvas.circle(screen, (glow_intensity, 0, 0),
+                        (left_eye_x + int(eye_width/2), eye_y + int(eye_height/2)),
+                        int(8*s))
+            canvas.circle(screen, (glow_intensity, 0, 0),
+                        (right_eye_x + int(eye_width/2), eye_y + int(eye_height/2)),
+                        int(8*s))
             # 글로우 효과
-            glow_surface = pygame.Surface((int(30*s), int(30*s)), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surface, (glow_intensity, 0, 0, 100),
-                             (int(15*s), int(15*s)), int(15*s))
-            screen.blit(glow_surface,
-                       (left_eye_x + int(eye_width/2) - int(15*s),
-                        eye_y + int(eye_height/2) - int(15*s)))
-            screen.blit(glow_surface,
-                       (right_eye_x + int(eye_width/2) - int(15*s),
-                        eye_y + int(eye_height/2) - int(15*s)))
+            if governor.get('sprite_detail') >= 1:
+                glow_surface = self._get_glow(int(30*s))
+                pygame.draw.circle(glow_surface, (glow_intensity, 0, 0, 100),
+                                 (int(15*s), int(15*s)), int(15*s))
+                blit(screen, glow_surface,
+                     (left_eye_x + int(eye_width/2) - int(15*s),
+                      eye_y + int(eye_height/2) - int(15*s)), "skull_glow")
+                blit(screen, glow_surface,
+                     (right_eye_x + int(eye_width/2) - int(15*s),
+                      eye_y + int(eye_height/2) - int(15*s)), "skull_glow")
 
         # 코 구멍 (하트 모양 역삼각형)
         nose_y = y + int(110 * s)
         nose_x = x + int(skull_width / 2)
-        pygame.draw.polygon(screen, eye_socket, [
+        canvas.polygon(screen, eye_socket, [
             (nose_x, nose_y),
             (nose_x - int(15*s), nose_y + int(25*s)),
             (nose_x + int(15*s), nose_y + int(25*s))
         ])
         # 코 구멍 내부 디테일
-        pygame.draw.line(screen, bone_shadow,
-                        (nose_x, nose_y + int(5*s)),
-                        (nose_x, nose_y + int(20*s)), int(2*s))
+        canvas.line(screen, bone_shadow,
+                   (nose_x, nose_y + int(5*s)),
+                   (nose_x, nose_y + int(20*s)), int(2*s))
 
         # 이빨 (위턱)
         teeth_y = y + int(145 * s)
@@ -778,23 +813,23 @@ class GlitchEffect:
         for i in range(8):
             tx = teeth_start_x + i * int(tooth_width * 0.95)
             # 이빨 본체
-            pygame.draw.rect(screen, bone_highlight,
-                           (tx, teeth_y, tooth_width - int(2*s), tooth_height))
+            canvas.rect(screen, bone_highlight,
+                      (tx, teeth_y, tooth_width - int(2*s), tooth_height))
             # 이빨 사이 선
-            pygame.draw.line(screen, bone_shadow,
-                           (tx, teeth_y), (tx, teeth_y + tooth_height), 1)
+            canvas.line(screen, bone_shadow,
+                      (tx, teeth_y), (tx, teeth_y + tooth_height), 1)
             # 이빨 하단 둥글게
-            pygame.draw.ellipse(screen, bone_highlight,
-                              (tx, teeth_y + tooth_height - int(5*s),
-                               tooth_width - int(2*s), int(10*s)))
+            canvas.ellipse(screen, bone_highlight,
+                         (tx, teeth_y + tooth_height - int(5*s),
+                          tooth_width - int(2*s), int(10*s)))
 
         # 턱뼈
         jaw_y = y + int(165 * s)
-        pygame.draw.ellipse(screen, bone_color,
-                           (x + int(15*s), jaw_y, skull_width - int(30*s), int(25*s)))
+        canvas.ellipse(screen, bone_color,
+                      (x + int(15*s), jaw_y, skull_width - int(30*s), int(25*s)))
 
         # 금이 간 효과 (랜덤)
-        if random.random() < 0.3:
+        if governor.get('sprite_detail') >= 2 and random.random() < 0.3:
             crack_x = x + random.randint(int(30*s), int(100*s))
             crack_y = y + random.randint(int(20*s), int(60*s))
             points = [(crack_x, crack_y)]
@@ -802,7 +837,7 @@ class GlitchEffect:
                 crack_x += random.randint(-int(10*s), int(10*s))
                 crack_y += random.randint(int(5*s), int(15*s))
                 points.append((crack_x, crack_y))
-            pygame.draw.lines(screen, (50, 40, 30), False, points, int(2*s))
+            canvas.lines(screen, (50, 40, 30), False, points, int(2*s))
 
     def _draw_sans(self, screen, x, y, scale=1.0):
         """샌즈 (언더테일) 그리기 - 이스터에그"""
@@ -812,8 +847,8 @@ class GlitchEffect:
         skull_color = (255, 255, 255)
 
         # 둥근 머리
-        pygame.draw.ellipse(screen, skull_color,
-                           (x, y, int(120*s), int(100*s)))
+        canvas.ellipse(screen, skull_color,
+                      (x, y, int(120*s), int(100*s)))
 
         # 큰 눈구멍
         left_eye_x = x + int(20*s)
@@ -822,70 +857,437 @@ class GlitchEffect:
         eye_size = int(30*s)
 
         # 검은 눈구멍
-        pygame.draw.ellipse(screen, (0, 0, 0),
-                           (left_eye_x, eye_y, eye_size, eye_size))
-        pygame.draw.ellipse(screen, (0, 0, 0),
-                           (right_eye_x, eye_y, eye_size, eye_size))
+        canvas.ellipse(screen, (0, 0, 0),
+                      (left_eye_x, eye_y, eye_size, eye_size))
+        canvas.ellipse(screen, (0, 0, 0),
+                      (right_eye_x, eye_y, eye_size, eye_size))
 
         # 왼쪽 눈 - 파란 빛 (샌즈 특유)
-        glow_timer = self.skull_timer * 0.1
+        glow_timer = self.timer * 0.1
         if math.sin(glow_timer) > 0:
             # 파란 눈 (샌즈 시그니처)
-            pygame.draw.circle(screen, (0, 191, 255),
-                             (left_eye_x + int(15*s), eye_y + int(15*s)), int(8*s))
+            canvas.circle(screen, (0, 191, 255),
+                        (left_eye_x + int(15*s), eye_y + int(15*s)), int(8*s))
             # 글로우 효과
-            glow = pygame.Surface((int(40*s), int(40*s)), pygame.SRCALPHA)
-            pygame.draw.circle(glow, (0, 191, 255, 100), (int(20*s), int(20*s)), int(20*s))
-            screen.blit(glow, (left_eye_x - int(5*s), eye_y - int(5*s)))
+            if governor.get('sprite_detail') >= 1:
+                glow = self._get_glow(int(40*s))
+                pygame.draw.circle(glow, (0, 191, 255, 100), (int(20*s), int(20*s)), int(20*s))
+                blit(screen, glow, (left_eye_x - int(5*s), eye_y - int(5*s)), "sans_glow")
 
         # 오른쪽 눈 - 흰 점
-        pygame.draw.circle(screen, (255, 255, 255),
-                          (right_eye_x + int(15*s), eye_y + int(15*s)), int(5*s))
+        canvas.circle(screen, (255, 255, 255),
+                     (right_eye_x + int(15*s), eye_y + int(15*s)), int(5*s))
 
         # 코 (작은 구멍)
         nose_x = x + int(55*s)
         nose_y = y + int(60*s)
-        pygame.draw.ellipse(screen, (200, 200, 200),
-                           (nose_x, nose_y, int(10*s), int(8*s)))
+        canvas.ellipse(screen, (200, 200, 200),
+                      (nose_x, nose_y, int(10*s), int(8*s)))
 
         # 입 - 샌즈 특유의 넓은 미소
         smile_y = y + int(72*s)
-        pygame.draw.ellipse(screen, (0, 0, 0),
-                           (x + int(25*s), smile_y, int(70*s), int(20*s)))
+        canvas.ellipse(screen, (0, 0, 0),
+                      (x + int(25*s), smile_y, int(70*s), int(20*s)))
 
         # 이빨 (일렬)
         for i in range(7):
             tooth_x = x + int(30*s) + i * int(8*s)
-            pygame.draw.rect(screen, skull_color,
-                           (tooth_x, smile_y + int(2*s), int(7*s), int(12*s)))
+            canvas.rect(screen, skull_color,
+                      (tooth_x, smile_y + int(2*s), int(7*s), int(12*s)))
 
         # "나쁜 시간을 보내게 될 거야" 텍스트 (가끔)
         if random.random() < 0.1:
-            if self.font is None:
-                self.font = get_korean_font(36)
-            sans_text = self.font.render("* You're gonna have a bad time.", True, (255, 255, 255))
+            sans_text = render_text(self.owner.get_font(), "* You're gonna have a bad time.", (255, 255, 255))
             screen.blit(sans_text, (x - int(50*s), y + int(110*s)))
 
-    def get_status_text(self):
-        """Get current glitch status text"""
+
+class Darkness(EffectComponent):
+    """화면 어둡게"""
+
+    name = 'darkness'
+    label = "DARKNESS"
+    status_order = 1
+    update_every = 30
+    cost = 0.3
+    essential = True
+
+    def __init__(self, owner):
+        super().__init__(owner)
+        self._overlay = None  # ((크기, 어둠 단계), 서피스)
+
+    def enabled(self):
+        return self.owner.darkness_level > 0
+
+    def update(self, frames):
+        self.visible = True
+
+    def draw(self, screen):
+        blit(screen, self._get_overlay(screen), (0, 0), "darkness")
+
+    def _get_overlay(self, screen):
+        """어둠 오버레이 (어둠 단계가 바뀔 때만 새로 만듦, RLE 가속)"""
+        key = (screen.get_size(), self.owner.darkness_level)
+        if self._overlay is None or self._overlay[0] != key:
+            overlay = create_overlay(screen.get_size(), (0, 0, 0), self.owner.darkness_level, owner="glitch")
+            self._overlay = (key, overlay)
+        return self._overlay[1]
+
+
+class CreepyText(EffectComponent):
+    """무서운 문구를 잠깐 떨리게 표시"""
+
+    name = 'creepy_text'
+    cost = 0.05
+
+    def __init__(self, owner):
+        super().__init__(owner)
+        self.reset()
+
+    def update(self, frames):
+        if self.timer > 0:
+            self.timer -= frames
+            self.visible = True
+            self.y = random.randint(100, self.owner.size[1] - 100)
+            self.jitter = (random.randint(-3, 3), random.randint(-3, 3))
+        else:
+            self.visible = False
+            if random.random() < 0.005 * self.owner.glitch_level * frames:
+                self.text = random.choice(CREEPY_MESSAGES)
+                self.timer = 90
+                if self.owner.sound_manager:
+                    self.owner.sound_manager.play('whisper', 0.4)
+
+    def draw(self, screen):
+        text_surface = render_text(self.owner.get_font(), self.text, (150, 0, 0))
+        text_x = screen.get_width() // 2 - text_surface.get_width() // 2
+        screen.blit(text_surface, (text_x + self.jitter[0], self.y + self.jitter[1]))
+
+    def reset(self):
+        super().reset()
+        self.text = ""
+        self.timer = 0
+        self.y = 0
+        self.jitter = (0, 0)
+
+
+class ScreenFlash(EffectComponent):
+    """흰색/빨간색 깜빡임"""
+
+    name = 'flash'
+    cost = 0.4
+
+    def __init__(self, owner):
+        super().__init__(owner)
+        self.color = (255, 255, 255)
+        self.alpha = 0
+        self._overlay = None  # 전체 화면 서피스 (재사용)
+        self._overlay_color = None
+
+    def update(self, frames):
+        self.visible = random.random() < 0.02 * self.owner.glitch_level
+        if self.visible:
+            self.color = (255, 255, 255) if random.random() < 0.5 else (255, 0, 0)
+            self.alpha = random.randint(30, 100)
+
+    def draw(self, screen):
+        if self._overlay is None or self._overlay.get_size() != screen.get_size():
+            self._overlay = create_surface(screen.get_size(), owner="glitch")
+            self._overlay_color = None
+        if self._overlay_color != self.color:
+            # 색이 바뀔 때만 다시 채움 (축소 화면의 축소 사본도 그때만 다시 만듦)
+            self._overlay.fill(self.color)
+            canvas.changed(self._overlay)
+            self._overlay_color = self.color
+        self._overlay.set_alpha(self.alpha)
+        blit(screen, self._overlay, (0, 0), "flash")
+
+
+class CreepySounds(EffectComponent):
+    """랜덤 무서운 소리 (그리기 없음)"""
+
+    name = 'sounds'
+    update_every = 10
+
+    def update(self, frames):
+        if random.random() < 0.003 * self.owner.glitch_level * frames and self.owner.sound_manager:
+            self.owner.sound_manager.play_random_creepy()
+
+
+class EnemyPresence(EffectComponent):
+    """적 존재 표시 (상태 표시만, 적은 update_enemies 에서 처리)"""
+
+    name = 'enemies'
+    label = "THEY'RE COMING"
+    status_order = 4
+
+    def enabled(self):
+        return bool(self.owner.enemies)
+
+
+class GlitchEffect:
+    """글리치 효과 관리 클래스"""
+
+    def __init__(self):
+        self.glitch_level = 0
+        self.control_inverted_h = False
+        self.control_inverted_v = False
+        self.screen_shake = 0
+        self.color_shift = 0
+        self.flicker_timer = 0
+        self.random_effects = []
+
+        # 무서운 효과들
+        self.darkness_level = 0
+        self.show_skull = False
+        self.bloody_screen = False
+        self.static_noise = False
+        self.font = None
+        self.size = (SCREEN_WIDTH, SCREEN_HEIGHT)  # 효과가 쓰는 화면 크기 (update 에서 갱신)
+        self.shake_offset = (0, 0)
+
+        # 사운드 매니저
+        try:
+            self.sound_manager = SoundManager()
+        except:
+            self.sound_manager = None
+
+        # 적 리스트 (사라진 적은 풀로 반납)
+        self.enemy_pool = EnemyPool()
+        self.enemies = []
+        self.enemy_grid = SpatialHash()  # 매 프레임 적 위치로 다시 채움
+        self.enemy_spawn_timer = 0
+
+        # 효과 컴포넌트 (등록 순서 = 그리기 순서, HUD 라벨은 status_order 순)
+        self.scheduler = EffectScheduler()
+        for component in (ScreenShake, ControlGlitch, StaticNoise, BloodSplatter, SkullApparition,
+                          Darkness, CreepyText, ScreenFlash, CreepySounds, EnemyPresence):
+            self.scheduler.register(component(self))
+
+    def add_glitch(self):
+        """글리치 레벨 증가"""
+        self.glitch_level += 1
+        self._apply_random_effect()
+
+        # 소리 재생
+        if self.sound_manager:
+            self.sound_manager.play_random_creepy()
+
+    def force_level(self, level):
+        """글리치 레벨을 고정하고 모든 시각 효과를 최대로 켬 (--stress)"""
+        self.glitch_level = level
+        self.screen_shake = 20
+        self.darkness_level = 180
+        self.show_skull = True
+        self.bloody_screen = True
+        self.static_noise = True
+
+    def spawn_enemy(self, screen_width, screen_height, player_x, player_y):
+        """적 생성"""
+        # 플레이어와 멀리서 스폰
+        side = random.choice(['top', 'bottom', 'left', 'right'])
+        if side == 'top':
+            x = random.randint(50, screen_width - 50)
+            y = -50
+        elif side == 'bottom':
+            x = random.randint(50, screen_width - 50)
+            y = screen_height + 50
+        elif side == 'left':
+            x = -50
+            y = random.randint(50, screen_height - 50)
+        else:
+            x = screen_width + 50
+            y = random.randint(50, screen_height - 50)
+
+        speed = 1.0 + self.glitch_level * 0.3
+        enemy = self.enemy_pool.acquire(x, y, speed)
+        self.enemies.append(enemy)
+
+        if self.sound_manager:
+            self.sound_manager.play('footsteps', 0.3)
+
+    def update_enemies(self, player_x, player_y, screen_width, screen_height):
+        """적들 업데이트"""
         if self.glitch_level == 0:
-            return ""
+            return False
+
+        # 적 스폰
+        self.enemy_spawn_timer += 1
+        spawn_interval = max(300 - self.glitch_level * 30, 120)  # 글리치 레벨에 따라 빨라짐
+
+        if self.enemy_spawn_timer >= spawn_interval and len(self.enemies) < self.glitch_level + 1:
+            self.spawn_enemy(screen_width, screen_height, player_x, player_y)
+            self.enemy_spawn_timer = 0
+
+        # 적 업데이트 (적은 플레이어를 쫓으므로 clear_enemies 전까지 계속 남음)
+        for enemy in self.enemies:
+            enemy.update(player_x, player_y)
+
+        grid = self.enemy_grid
+        grid.rebuild(self.enemies)
+        if len(self.enemies) > 1:
+            self._separate_enemies()
+            grid.rebuild(self.enemies)
+
+        # 가까이 오면 경고음
+        for _ in grid.query(player_x, player_y, ENEMY_NEAR_RADIUS):
+            if random.random() < 0.02 and self.sound_manager:
+                self.sound_manager.play('enemy_near', 0.3)
+
+        # 충돌 체크 (플레이어 근처 적만)
+        for enemy in grid.query(player_x, player_y, Enemy.SIZE):
+            if enemy.check_collision(player_x, player_y):
+                if self.sound_manager:
+                    self.sound_manager.play('jumpscare', 0.8)
+                return True  # 충돌!
+        return False
+
+    def _separate_enemies(self):
+        """가까운 적끼리 서로 밀어냄 (이웃은 공간 해시로 찾음)"""
+        pushes = []
+        for enemy in self.enemies:
+            px = py = 0.0
+            for other in self.enemy_grid.query(enemy.x, enemy.y, ENEMY_SEPARATION, exclude=enemy):
+                dx = enemy.x - other.x
+                dy = enemy.y - other.y
+                dist = math.sqrt(dx * dx + dy * dy)
+                if dist == 0:
+                    # 완전히 겹치면 임의 방향으로
+                    angle = random.uniform(0, 2 * math.pi)
+                    dx, dy, dist = math.cos(angle), math.sin(angle), 1.0
+                strength = (ENEMY_SEPARATION - dist) / ENEMY_SEPARATION
+                px += dx / dist * strength
+                py += dy / dist * strength
+            pushes.append((px, py))
+
+        # 모두 계산한 뒤 적용 (순서에 따라 결과가 달라지지 않도록)
+        for enemy, (px, py) in zip(self.enemies, pushes):
+            length = math.sqrt(px * px + py * py)
+            if length > SEPARATION_PUSH:
+                px, py = px / length * SEPARATION_PUSH, py / length * SEPARATION_PUSH
+            enemy.x += px
+            enemy.y += py
+
+    def clear_enemies(self):
+        """모든 적 제거 (슬롯은 풀로 반납, reset 때)"""
+        for enemy in self.enemies:
+            self.enemy_pool.release(enemy)
+        self.enemies.clear()
+        self.enemy_grid.clear()
+
+    def update_ambient(self, player_pos):
+        """앰비언트 스트림 파라미터 갱신 (player_pos 가 None 이면 조용히)"""
+        if not self.sound_manager:
+            return
+        if player_pos is None:
+            self.sound_manager.ambient.set_params(0, 0)
+            return
+
+        proximity = 0.0
+        for enemy in self.enemies:
+            dist = math.sqrt((enemy.x - player_pos[0])**2 + (enemy.y - player_pos[1])**2)
+            proximity = max(proximity, 1 - dist / AMBIENT_PROXIMITY)
+        self.sound_manager.ambient.set_params(self.glitch_level, proximity)
+
+    def iter_warm_sprites(self):
+        """적/효과 스프라이트 서피스를 미리 만드는 이터레이터 (캐시 워머용, 있으면 건너뜀)"""
+        _get_demon_shadow()
+        yield
+        _get_ghost_surface()
+        yield
+        for component in self.scheduler.components:
+            yield from component.iter_warm()
+
+    def is_quiet(self):
+        """켜진 효과도 적도 없음 (update 를 건너뛰어도 결과가 같음)"""
+        return not self.enemies and not any(c.is_active() for c in self.scheduler.components)
+
+    def is_static(self):
+        """이번 프레임 보이는 효과/흔들림/적이 없음 (그리기를 건너뛰어도 화면이 같음)"""
+        if self.enemies or self.shake_offset != (0, 0):
+            return False
+        return not any(c.visible and c.is_active() for c in self.scheduler.components)
+
+    def draw_enemies(self, screen):
+        """적들 그리기"""
+        for enemy in self.enemies:
+            enemy.draw(screen)
+
+    def _apply_random_effect(self):
+        """랜덤한 글리치 효과 적용"""
+        effects = [
+            'invert_horizontal',
+            'invert_vertical',
+            'screen_shake',
+            'darkness',
+            'skull',
+            'bloody',
+            'static',
+            'slow_controls',
+            'fast_controls',
+        ]
+
+        num_effects = min(self.glitch_level + 1, 4)
+        chosen = random.sample(effects, num_effects)
+
+        for effect in chosen:
+            if effect == 'invert_horizontal':
+                self.control_inverted_h = not self.control_inverted_h
+            elif effect == 'invert_vertical':
+                self.control_inverted_v = not self.control_inverted_v
+            elif effect == 'screen_shake':
+                self.screen_shake = min(self.screen_shake + 5, 20)
+            elif effect == 'darkness':
+                self.darkness_level = min(self.darkness_level + 50, 180)
+            elif effect == 'skull':
+                self.show_skull = True
+            elif effect == 'bloody':
+                self.bloody_screen = True
+            elif effect == 'static':
+                self.static_noise = True
+            elif effect not in self.random_effects:
+                self.random_effects.append(effect)
+
+    def apply_control_glitch(self, dx, dy):
+        """조작에 글리치 적용"""
+        if self.glitch_level == 0:
+            return dx, dy
+
+        new_dx, new_dy = dx, dy
 
-        effects = []
         if self.control_inverted_h:
-            effects.append("???")
+            new_dx = -dx
         if self.control_inverted_v:
-            effects.append("???")
-        if self.darkness_level > 0:
-            effects.append("DARKNESS")
-        if self.show_skull:
-            effects.append("...")
-        if self.bloody_screen:
-            effects.append("BLOOD")
-        if len(self.enemies) > 0:
-            effects.append("THEY'RE COMING")
-
-        return " | ".join(effects) if effects else "Something's wrong..."
+            new_dy = -dy
+
+        if 'slow_controls' in self.random_effects:
+            new_dx *= 0.5
+            new_dy *= 0.5
+        if 'fast_controls' in self.random_effects:
+            new_dx *= 1.5
+            new_dy *= 1.5
+
+        return new_dx, new_dy
+
+    def get_font(self):
+        """효과 텍스트용 폰트 (처음 쓸 때 생성)"""
+        if self.font is None:
+            self.font = get_korean_font(48)
+        return self.font
+
+    def update(self, width, height):
+        """효과 시뮬레이션 한 프레임 (타이머, 확률 판정, 소리) - 화면 없이도 동작"""
+        self.size = (width, height)
+        self.scheduler.update()
+
+    def draw(self, screen):
+        """활성 효과 그리기 (품질 단계의 효과 예산을 넘는 부가 효과는 생략)"""
+        self.scheduler.draw(screen, governor.get('effect_budget_ms'))
+
+    def status(self):
+        """상태 표시 라벨 목록 (글리치가 없으면 빈 리스트)"""
+        if self.glitch_level == 0:
+            return []
+        return self.scheduler.status()
 
     def reset(self):
         """글리치 효과 초기화"""
@@ -898,13 +1300,12 @@ class GlitchEffect:
         self.random_effects = []
         self.darkness_level = 0
         self.show_skull = False
-        self.skull_timer = 0
         self.bloody_screen = False
         self.static_noise = False
-        self.creepy_text = ""
-        self.creepy_text_timer = 0
-        self.enemies = []
+        self.shake_offset = (0, 0)
+        self.clear_enemies()
         self.enemy_spawn_timer = 0
+        self.scheduler.reset()
 
 
 def generate_help_path(center_x, center_y, scale=1.0):
@@ -0,0 +1,149 @@
+import asyncio
+import os
+import time
+from collections import deque
+from utils import FPS, IS_WEB
+
+# KSH_DEBUG_FRAMES=1 이면 프레임 간격 지터 통계를 주기적으로 출력
+DEBUG_FRAMES = bool(os.environ.get("KSH_DEBUG_FRAMES"))
+REPORT_FRAMES = 300   # 이 프레임 수마다 통계 출력
+HISTORY = 600         # 통계에 쓰는 최근 프레임 수
+IDLE_MARGIN_MS = 1.0  # 마감 직전 이 시간은 백그라운드 작업에 주지 않음
+# 데스크톱: 마감 직전 이 시간은 sleep 대신 양보하며 기다림 (타이머 오차 보정)
+# 웹: 브라우저(requestAnimationFrame)가 루프를 돌리므로 보정하지 않음
+SPIN_MS = 0.0 if IS_WEB else 2.0
+
+
+def percentile(values, p):
+    """정렬된 목록의 백분위 값 (최근접 순위)"""
+    if not values:
+        return 0.0
+    index = min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))
+    return values[index]
+
+
+class FramePacer:
+    """clock.tick 대신 다음 프레임 마감 시각까지 await 로 기다리는 페이서
+
+    기다리는 동안 spawn() 으로 등록한 백그라운드 코루틴이 실행된다. 코루틴은
+    작업 조각 사이에 `await pacer.idle()` 을 호출하고, 남은 유휴 시간이 없으면
+    다음 프레임의 대기 구간까지 멈춘다. 그래서 백그라운드 작업이 프레임 작업을
+    밀어내지 않는다.
+    """
+
+    def __init__(self, fps=FPS, report=DEBUG_FRAMES, report_frames=REPORT_FRAMES):
+        self.base_period = 1.0 / fps
+        self.period = self.base_period
+        self.report = report
+        self.report_frames = report_frames
+        self.work_ms = 0.0          # 직전 프레임 작업 시간 (대기 제외)
+        self.frames = 0
+        self._frame_start = time.perf_counter()
+        self._deadline = None
+        self._waiting = False
+        self._idle_event = asyncio.Event()
+        self._intervals = deque(maxlen=HISTORY)  # 프레임 시작 간격 (초)
+        self._work = deque(maxlen=HISTORY)       # 프레임 작업 시간 (ms)
+        self._late = 0
+        self._tasks = []
+
+    def set_fps(self, fps):
+        """프레임 속도 변경 (유휴 화면에서 낮췄다가 다시 올릴 때)"""
+        self.period = 1.0 / fps
+
+    def spawn(self, coro):
+        """백그라운드 코루틴 등록 (close 때 취소)"""
+        task = asyncio.create_task(coro)
+        self._tasks.append(task)
+        return task
+
+    def elapsed_ms(self):
+        """이번 프레임 시작 후 지난 시간"""
+        return (time.perf_counter() - self._frame_start) * 1000
+
+    def has_idle_time(self):
+        """지금 프레임 대기 중이고 마감까지 여유가 있는지"""
+        return (self._waiting and
+                time.perf_counter() < self._deadline - IDLE_MARGIN_MS / 1000)
+
+    async def idle(self):
+        """백그라운드 코루틴이 작업 조각 사이에 호출 (유휴 시간이 생길 때까지 대기)"""
+        await asyncio.sleep(0)
+        while not self.has_idle_time():
+            self._idle_event.clear()
+            await self._idle_event.wait()
+
+    async def wait(self, wake=None):
+        """프레임 끝에서 호출: 마감까지 유휴 시간을 백그라운드 코루틴에 주고 기다림
+
+        wake 를 주면 기본 프레임 간격마다 확인해서 True 면 바로 다음 프레임 시작
+        (낮은 프레임 속도로 쉬다가 입력이 오면 즉시 깨어나기 위해)
+        """
+        now = time.perf_counter()
+        self.work_ms = (now - self._frame_start) * 1000
+        self._work.append(self.work_ms)
+        paced = self.period == self.base_period
+
+        if self._deadline is None:
+            self._deadline = now + self.period
+        else:
+            self._deadline += self.period
+            if self._deadline < now:
+                # 늦었으면 따라잡으려 몰아서 그리지 않고 마감을 다시 맞춤
+                self._late += 1
+                self._deadline = now
+
+        self._waiting = True
+        self._idle_event.set()
+        try:
+            remaining = self._deadline - now - SPIN_MS / 1000
+            while remaining > 0:
+                await asyncio.sleep(remaining if wake is None else min(remaining, self.base_period))
+                if wake is not None and wake():
+                    self._deadline = time.perf_counter()
+                    paced = False
+                    break
+                remaining = self._deadline - time.perf_counter() - SPIN_MS / 1000
+            while time.perf_counter() < self._deadline:
+                await asyncio.sleep(0)
+        finally:
+            self._waiting = False
+            self._idle_event.clear()
+
+        start = time.perf_counter()
+        # 지터 통계는 기본 속도로 끝까지 기다린 프레임만
+        if self.frames and paced:
+            self._intervals.append(start - self._frame_start)
+        self._frame_start = start
+        self.frames += 1
+        if self.report and self.frames % self.report_frames == 0:
+            print(self.format_stats())
+
+    def stats(self):
+        """최근 프레임 통계 (ms)"""
+        intervals = [t * 1000 for t in self._intervals]
+        jitter = sorted(abs(t - self.base_period * 1000) for t in intervals)
+        work = sorted(self._work)
+        mean = sum(intervals) / len(intervals) if intervals else 0.0
+        return {
+            'fps': 1000 / mean if mean else 0.0,
+            'interval_mean': mean,
+            'jitter_mean': sum(jitter) / len(jitter) if jitter else 0.0,
+            'jitter_p95': percentile(jitter, 95),
+            'jitter_max': jitter[-1] if jitter else 0.0,
+            'work_p50': percentile(work, 50),
+            'work_p95': percentile(work, 95),
+            'late': self._late,
+        }
+
+    def format_stats(self):
+        s = self.stats()
+        return (f"[frames] {s['fps']:.1f} fps, interval {s['interval_mean']:.2f} ms, "
+                f"jitter mean {s['jitter_mean']:.2f} / p95 {s['jitter_p95']:.2f} / max {s['jitter_max']:.2f} ms, "
+                f"work p50 {s['work_p50']:.2f} / p95 {s['work_p95']:.2f} ms, late {s['late']}")
+
+    def close(self):
+        """등록한 백그라운드 코루틴 취소"""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
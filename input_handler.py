@@ -0,0 +1,46 @@
+import pygame
+
+# 게임에서 실제로 쓰는 이벤트만 큐에 받음
+ALLOWED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN, pygame.KEYUP,
+    pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+    pygame.WINDOWEXPOSED,  # 유휴 화면에서 그리기를 건너뛰는 중에 창이 다시 보이면 다시 그림
+]
+MOTION_EVENTS = (pygame.MOUSEMOTION, pygame.FINGERMOTION)
+MOUSE_ID = "mouse"
+
+
+class InputSampler:
+    """이벤트 큐를 프레임 단위로 읽고 이동 이벤트는 포인터별 최신 값만 남김"""
+
+    def __init__(self):
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(ALLOWED_EVENTS)
+        self.events = []   # 순서가 중요한 이벤트 (키, 버튼, 손가락 down/up)
+        self.motions = {}  # 포인터 id -> 이번 프레임 마지막 이동 이벤트
+
+    @staticmethod
+    def pointer_id(event):
+        """이벤트의 포인터 id (마우스 또는 손가락 id)"""
+        if event.type in (pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION):
+            return event.finger_id
+        return MOUSE_ID
+
+    def poll(self):
+        """이번 프레임 이벤트 수집 (events, motions 갱신)"""
+        self.events.clear()
+        self.motions.clear()
+
+        for event in pygame.event.get():
+            if event.type in MOTION_EVENTS:
+                self.motions[self.pointer_id(event)] = event
+                continue
+
+            if event.type in (pygame.MOUSEBUTTONUP, pygame.FINGERUP):
+                # 뗀 포인터의 이전 이동은 버림 (떼고 나서 다시 눌리지 않도록)
+                self.motions.pop(self.pointer_id(event), None)
+            self.events.append(event)
+
+        return self.events
@@ -1,16 +1,32 @@
 import pygame
 import sys
+import argparse
 import random
 import math
 import asyncio
 import platform
 from utils import (
     WHITE, BLACK, RED, GREEN, GRAY,
-    SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LIVES, has_four
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, MAX_LIVES, FINAL_STAGE, IS_WEB, has_four
 )
 from turtle_player import TurtlePlayer, AutoDrawer
-from stage import Stage
+from stage import get_stage
+from stage_pack import get_geometry
+from stage_generator import StagePrefetcher, is_cached
 from effects import GlitchEffect, generate_help_path
+from compositor import Compositor, RENDER_SCALES
+from quality import governor
+from surfaces import create_surface, blit, render_text
+from scene import Scene
+from cache_warmer import CacheWarmer
+from frame_pacer import FramePacer
+from capture import FrameCapture, CAPTURE_EVERY, CAPTURE_FORMATS
+import accuracy
+from accuracy import score_trail, iter_score_trail
+from stress import run_stress, STRESS_STAGE, STRESS_ENEMIES, STRESS_TRAIL, STRESS_FRAMES, STRESS_SEED
+from input_handler import InputSampler, MOUSE_ID
+from alloc_tracker import AllocationTracker
+from memory_report import MemoryReporter, start as start_memory_tracking
 
 
 class VirtualDPad:
@@ -21,8 +37,10 @@ class VirtualDPad:
         self.y = y
         self.size = size
         self.button_size = size // 3
+        self.rects = self.get_button_rects()  # hit test rects (computed once)
         self.pressed = {'up': False, 'down': False, 'left': False, 'right': False}
         self.alpha = 150
+        self._surfaces = {}  # (up, down, left, right) -> rendered surface
 
     def get_button_rects(self):
         """Get rectangles for each button"""
@@ -37,18 +55,20 @@ class VirtualDPad:
 
     def handle_touch(self, pos, is_down):
         """Handle touch event"""
-        rects = self.get_button_rects()
-        for direction, rect in rects.items():
+        for direction, rect in self.rects.items():
             if direction != 'center' and rect.collidepoint(pos):
                 self.pressed[direction] = is_down
                 return True
         return False
 
     def handle_touch_move(self, pos):
-        """Handle touch move - update all buttons based on position"""
-        rects = self.get_button_rects()
-        for direction in ['up', 'down', 'left', 'right']:
-            self.pressed[direction] = rects[direction].collidepoint(pos)
+        """Handle touch move - update all buttons based on position (True if any pressed)"""
+        any_pressed = False
+        for direction in ('up', 'down', 'left', 'right'):
+            hit = self.rects[direction].collidepoint(pos)
+            self.pressed[direction] = hit
+            any_pressed = any_pressed or hit
+        return any_pressed
 
     def release_all(self):
         """Release all buttons"""
@@ -69,18 +89,24 @@ class VirtualDPad:
         return dx, dy
 
     def draw(self, screen):
-        """Draw the D-Pad"""
-        rects = self.get_button_rects()
-
-        # Create surface with alpha
-        surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+        """Draw the D-Pad (cached surface per pressed-state combination)"""
+        state = (self.pressed['up'], self.pressed['down'],
+                 self.pressed['left'], self.pressed['right'])
+        surface = self._surfaces.get(state)
+        if surface is None:
+            surface = self._render(state)
+            self._surfaces[state] = surface
+        blit(screen, surface, (self.x, self.y), "dpad")
+
+    def _render(self, state):
+        """Render the D-Pad for one (up, down, left, right) pressed state"""
+        surface = create_surface((self.size, self.size), alpha=True, owner="controls")
+        pressed = dict(zip(['up', 'down', 'left', 'right'], state))
 
         # Draw buttons
         colors = {
-            'up': (100, 100, 100, self.alpha) if not self.pressed['up'] else (150, 150, 200, self.alpha),
-            'down': (100, 100, 100, self.alpha) if not self.pressed['down'] else (150, 150, 200, self.alpha),
-            'left': (100, 100, 100, self.alpha) if not self.pressed['left'] else (150, 150, 200, self.alpha),
-            'right': (100, 100, 100, self.alpha) if not self.pressed['right'] else (150, 150, 200, self.alpha),
+            direction: (150, 150, 200, self.alpha) if is_pressed else (100, 100, 100, self.alpha)
+            for direction, is_pressed in pressed.items()
         }
 
         bs = self.button_size
@@ -117,7 +143,7 @@ class VirtualDPad:
         # Center
         pygame.draw.rect(surface, (80, 80, 80, self.alpha), (bs, bs, bs, bs), border_radius=12)
 
-        screen.blit(surface, (self.x, self.y))
+        return surface
 
 
 class ActionButton:
@@ -129,6 +155,8 @@ class ActionButton:
         self.size = size
         self.pressed = False
         self.alpha = 150
+        self.font = None
+        self._surfaces = {}  # (text, pressed) -> rendered surface
 
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.size, self.size)
@@ -140,27 +168,59 @@ class ActionButton:
         return False
 
     def draw(self, screen, text="OK"):
-        surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        color = (100, 100, 100, self.alpha) if not self.pressed else (150, 150, 200, self.alpha)
+        key = (text, self.pressed)
+        surface = self._surfaces.get(key)
+        if surface is None:
+            surface = self._render(text, self.pressed)
+            self._surfaces[key] = surface
+        blit(screen, surface, (self.x, self.y), "action_button")
+
+    def _render(self, text, pressed):
+        """Render the button for one (label, pressed) state"""
+        surface = create_surface((self.size, self.size), alpha=True, owner="controls")
+        color = (100, 100, 100, self.alpha) if not pressed else (150, 150, 200, self.alpha)
         pygame.draw.rect(surface, color, (0, 0, self.size, self.size), border_radius=12)
 
         # Draw text
-        font = pygame.font.Font(None, 32)
-        text_surf = font.render(text, True, (255, 255, 255))
+        if self.font is None:
+            self.font = pygame.font.Font(None, 32)
+        text_surf = self.font.render(text, True, (255, 255, 255))
         text_x = (self.size - text_surf.get_width()) // 2
         text_y = (self.size - text_surf.get_height()) // 2
         surface.blit(text_surf, (text_x, text_y))
 
-        screen.blit(surface, (self.x, self.y))
+        return surface
+
+
+# 입력도 보이는 효과도 없으면 그리기를 건너뛰는 화면, 그때의 프레임 속도
+IDLE_STATES = ("title", "special_wait", "hospital_ending", "win")
+IDLE_FPS = 10
+HOSPITAL_STATIC_AFTER = 180  # 이 프레임 이후 병실 엔딩 화면은 더 바뀌지 않음
+
+# 병실 엔딩 벽 색, 심전도 선 레이어 영역 (파동 +-20px, 선 두께 포함)
+HOSPITAL_WALL = (240, 248, 255)
+ECG_RECT = (556, 176, 140, 48)
+
+# 게임오버 배경을 나누는 단위 (캐시 워머 조각 하나가 WARM_BUDGET_MS 를 넘지 않게)
+ROOM_SLICE_ROWS = 100    # 그라데이션 줄 수
+ROOM_SLICE_SHAPES = 12   # 달빛/스포트라이트/비네팅 도형 수
+
+# 스테이지 클리어 후 정확도를 HUD 에 보여주는 프레임 수
+SCORE_SHOW_FRAMES = 180
 
 
 class Game:
-    def __init__(self):
+    def __init__(self, endless=False, render_scale=None, memory_report=False, capture=None):
         pygame.init()
         pygame.display.set_caption("Turtle Drawing Game")
 
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        self.clock = pygame.time.Clock()
+        # 모든 그리기는 논리 해상도 좌표로 오프스크린 프레임에 하고 present 때 한 번에 출력
+        # render_scale 을 지정하면 고정, 아니면 웹에서는 품질 조절기가 결정
+        if render_scale is None and not IS_WEB:
+            render_scale = 1.0  # 데스크톱은 창 크기가 바뀌지 않도록 고정
+        self.fixed_render_scale = render_scale
+        self.compositor = Compositor(render_scale or governor.get('render_scale'))
+        self.screen = self.compositor.frame
 
         # 기본 시스템 폰트 사용 (영어 호환)
         self.font = pygame.font.Font(None, 36)
@@ -171,31 +231,58 @@ class Game:
         dpad_size = 240  # 4x bigger
         self.dpad = VirtualDPad(20, SCREEN_HEIGHT - dpad_size - 20, dpad_size)
         self.action_btn = ActionButton(SCREEN_WIDTH - 120, SCREEN_HEIGHT - 120, 100)
+        self.input = InputSampler()
         self.touch_active = False
-        self.active_touch_id = None
+        self.active_touch_id = None  # D-pad 를 조작 중인 손가락 id
+        # 터치/마우스 입력이 처음 들어오기 전까지는 가상 컨트롤 숨김
+        self.show_touch_controls = False
+
+        # 엔드리스 모드: FINAL_STAGE 이후에도 생성된 스테이지로 계속
+        self.endless = endless
+        self.prefetcher = StagePrefetcher(lambda n: get_geometry(n) is None)
 
+        self.turtle = None
+        # 사운드 생성이 무거우므로 글리치 효과는 한 번만 만들고 재시작 때는 reset
+        self.glitch = GlitchEffect()
+        self._build_scenes()
+        # 곧 필요할 캐시를 미리 렌더링 (데스크톱: 스레드, 웹: async 루프 시분할)
+        self.warmer = CacheWarmer()
+        self._warm_key = None
         self.reset_game()
 
+        # --memory-report: 상태가 바뀔 때마다 서브시스템별 메모리 표 출력
+        self.memory_reporter = MemoryReporter(self) if memory_report else None
+
+        # 게임 화면 녹화 (F9 로 켜고 끔)
+        self.capture = capture or FrameCapture()
+
     def reset_game(self):
         """게임 초기화"""
         self.current_stage = 1
         self.lives = MAX_LIVES
         self.game_state = "title"
-        self.glitch = GlitchEffect()
+        self.glitch.reset()
         self.hospital_timer = 0
         self.ending_shown = False
+        self.last_score = None  # 직전 클리어 스테이지 정확도 (accuracy.TrailScore)
+        self.score_timer = 0
+        self.score_steps = None  # numpy 없이 진행 중인 정확도 계산 (update 마다 한 조각)
 
         self._load_stage()
 
     def _load_stage(self):
         """현재 스테이지 로드"""
-        self.stage = Stage(self.current_stage)
+        self.stage = get_stage(self.current_stage)
+        self.prefetcher.set_current(self.current_stage)
         start_pos = self.stage.get_start_pos()
+        if not start_pos:
+            start_pos = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
 
-        if start_pos:
+        # 터틀은 재사용하고 위치/경로만 초기화
+        if self.turtle is None:
             self.turtle = TurtlePlayer(start_pos[0], start_pos[1])
         else:
-            self.turtle = TurtlePlayer(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+            self.turtle.reset(start_pos[0], start_pos[1])
 
         self.on_path = True
         self.auto_drawer = None
@@ -231,7 +318,7 @@ class Game:
                 self._play_beep_sound()
             return
 
-        if self.current_stage > 50:
+        if self.current_stage > FINAL_STAGE and not self.endless:
             self.game_state = "win"
         else:
             self._load_stage()
@@ -261,62 +348,92 @@ class Game:
         sound.play()
 
     def _get_touch_pos(self, event):
-        """Convert touch event to screen position"""
+        """Convert touch event to logical screen position"""
+        # 터치 좌표는 창 기준 0~1 이므로 출력 배율과 무관하게 논리 해상도로 변환
         if hasattr(event, 'x') and hasattr(event, 'y'):
             return (int(event.x * SCREEN_WIDTH), int(event.y * SCREEN_HEIGHT))
         return None
 
+    def _get_mouse_pos(self, event):
+        """Convert mouse event position to logical screen position"""
+        return self.compositor.to_logical(event.pos)
+
+    def _set_render_scale(self, render_scale):
+        """출력 배율 변경 (프레임이 바뀌므로 그리기 대상도 교체)"""
+        if self.compositor.set_render_scale(render_scale):
+            self.screen = self.compositor.frame
+
+    def _cycle_render_scale(self):
+        """출력 배율 순환 (F2, 자동 조절 중지)"""
+        index = RENDER_SCALES.index(self.compositor.render_scale)
+        self.fixed_render_scale = RENDER_SCALES[(index + 1) % len(RENDER_SCALES)]
+        self._set_render_scale(self.fixed_render_scale)
+
     def handle_events(self):
-        """이벤트 처리"""
-        for event in pygame.event.get():
+        """이벤트 처리 (이동 이벤트는 포인터별 최신 값만)"""
+        for event in self.input.poll():
             if event.type == pygame.QUIT:
                 return False
 
             # Keyboard events
             if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_F2:
+                    self._cycle_render_scale()
+                    continue
+                if event.key == pygame.K_F9:
+                    self.capture.toggle()
+                    continue
                 self._handle_key_action()
 
             # Mouse events (also work as touch on some platforms)
             if event.type == pygame.MOUSEBUTTONDOWN:
-                pos = event.pos
                 self.touch_active = True
-                if self.game_state == "playing":
-                    self.dpad.handle_touch(pos, True)
-                if self.action_btn.handle_touch(pos, True):
-                    self._handle_action_button()
+                self._handle_pointer_down(self._get_mouse_pos(event))
 
             if event.type == pygame.MOUSEBUTTONUP:
                 self.touch_active = False
                 self.dpad.release_all()
                 self.action_btn.pressed = False
 
-            if event.type == pygame.MOUSEMOTION and self.touch_active:
-                pos = event.pos
-                if self.game_state == "playing":
-                    self.dpad.handle_touch_move(pos)
-
             # Touch events (for mobile)
             if event.type == pygame.FINGERDOWN:
                 pos = self._get_touch_pos(event)
-                if pos:
-                    self.touch_active = True
-                    if self.game_state == "playing":
-                        self.dpad.handle_touch(pos, True)
-                    if self.action_btn.handle_touch(pos, True):
-                        self._handle_action_button()
+                if pos and self._handle_pointer_down(pos):
+                    # D-pad 를 누른 손가락만 D-pad 를 조작
+                    self.active_touch_id = event.finger_id
 
             if event.type == pygame.FINGERUP:
-                self.touch_active = False
-                self.dpad.release_all()
+                if event.finger_id == self.active_touch_id:
+                    self.active_touch_id = None
+                    self.dpad.release_all()
                 self.action_btn.pressed = False
 
-            if event.type == pygame.FINGERMOTION:
+        for pointer_id, event in self.input.motions.items():
+            if self.game_state != "playing":
+                break
+            if pointer_id == MOUSE_ID:
+                if self.touch_active:
+                    self.dpad.handle_touch_move(self._get_mouse_pos(event))
+            elif self.active_touch_id in (None, pointer_id):
+                # 다른 곳에서 시작한 손가락이 D-pad 위로 들어오면 그 손가락이 조작
                 pos = self._get_touch_pos(event)
-                if pos and self.game_state == "playing":
-                    self.dpad.handle_touch_move(pos)
+                if pos and self.dpad.handle_touch_move(pos):
+                    self.active_touch_id = pointer_id
+                elif pointer_id == self.active_touch_id:
+                    self.active_touch_id = None
 
         return True
 
+    def _handle_pointer_down(self, pos):
+        """마우스/손가락 누름 처리 (D-pad 를 눌렀으면 True)"""
+        self.show_touch_controls = True
+        on_dpad = False
+        if self.game_state == "playing":
+            on_dpad = self.dpad.handle_touch(pos, True)
+        if self.action_btn.handle_touch(pos, True):
+            self._handle_action_button()
+        return on_dpad
+
     def _handle_key_action(self):
         """Handle key/touch action for state changes"""
         if self.game_state == "title":
@@ -354,6 +471,60 @@ class Game:
             self._update_special_drawing()
         elif self.game_state == "hospital_ending":
             self.hospital_timer += 1
+        if self.score_timer:
+            self.score_timer -= 1
+        if self.score_steps is not None:
+            self._step_score()
+
+        # 글리치 효과 시뮬레이션 (병실 엔딩에서는 멈춤)
+        if self.game_state != "hospital_ending":
+            self.glitch.update(SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        # 앰비언트 사운드 (게임 화면에서만, 적 거리/글리치 레벨 반영)
+        in_stage = self.game_state in ("playing", "special_wait", "special_drawing")
+        self.glitch.update_ambient(self.turtle.get_position() if in_stage else None)
+
+        self._warm_caches()
+
+    def is_idle(self):
+        """화면이 바뀔 일이 없는지 (유휴 화면 + 입력 없음 + 보이는 효과 없음)"""
+        if self.game_state not in IDLE_STATES or self.input.events or self.input.motions:
+            return False
+        if self.score_timer or self.score_steps is not None:
+            return False  # 정확도 계산/표시가 끝날 때까지
+        if self.game_state == "hospital_ending":
+            # 병실 엔딩에서는 글리치 효과를 그리지 않음
+            return self.hospital_timer > HOSPITAL_STATIC_AFTER
+        return self.glitch.is_static()
+
+    def _warm_caches(self):
+        """다음에 필요할 캐시를 예측해서 미리 렌더링 요청 (상황이 바뀔 때만 판단)"""
+        level = self.glitch.glitch_level
+        key = (self.game_state, self.current_stage, self.lives, level > 0)
+        if key == self._warm_key:
+            return
+        self._warm_key = key
+        warmer = self.warmer
+
+        # 글리치가 처음 생기면 적/효과 스프라이트
+        if level > 0:
+            warmer.request("sprites", self.glitch.iter_warm_sprites)
+
+        if self.game_state != "playing":
+            return
+
+        # 다음 스테이지 레이어 (경로를 바로 알 수 있을 때만, 생성은 프리페처 담당)
+        next_stage = self.current_stage + 1
+        if get_geometry(next_stage) is not None or is_cached(next_stage):
+            stage = get_stage(next_stage)
+            if not stage.has_layer():
+                warmer.request(("stage", next_stage), stage.iter_render_layer)
+
+        # 목숨이 하나 남으면 게임오버 배경
+        if self.lives <= 1:
+            room = self.scenes["gameover"]["room"]
+            room.set(governor.get('gradient_step'))
+            warmer.request("gameover", room.iter_render)
 
     def _update_playing(self):
         """플레이 상태 업데이트"""
@@ -387,6 +558,7 @@ class Game:
 
             if self.stage.check_goal_reached(pos):
                 if self.on_path:
+                    self._score_stage()
                     self._next_stage()
                 else:
                     self._reset_stage()
@@ -397,6 +569,28 @@ class Game:
             # 적에게 잡힘 = 게임오버
             self.game_state = "gameover"
 
+    def _score_stage(self):
+        """클리어한 스테이지의 궤적 정확도 계산 (다음 스테이지 로드 전에 궤적/경로를 넘김)"""
+        trail, path, stage_num = list(self.turtle.trail), self.stage.path, self.current_stage
+        if accuracy.np is not None:
+            self._show_score(score_trail(trail, path, stage_num))
+            return
+        # numpy 가 없으면 (브라우저) 클리어 프레임이 멈추지 않게 메인 스레드에서 프레임마다 한 조각씩
+        self.score_steps = iter_score_trail(trail, path, stage_num)
+
+    def _step_score(self):
+        """진행 중인 정확도 계산 한 조각 (끝나면 HUD 에 표시)"""
+        try:
+            next(self.score_steps)
+        except StopIteration as done:
+            self.score_steps = None
+            self._show_score(done.value)
+
+    def _show_score(self, score):
+        if score is not None:
+            self.last_score = score
+            self.score_timer = SCORE_SHOW_FRAMES
+
     def _update_special_drawing(self):
         """특수 스테이지 자동 그리기 업데이트"""
         if self.auto_drawer:
@@ -411,231 +605,337 @@ class Game:
                     self._next_stage()
 
     def draw(self):
-        """화면 그리기"""
-        self.screen.fill(WHITE)
+        """화면 그리기 (레이어 등록 -> 오프스크린 합성 -> 출력)"""
+        comp = self.compositor
+        self._select_scene()
 
         if self.game_state == "title":
-            self._draw_title()
+            comp.add("background", self._draw_title)
         elif self.game_state in ["playing", "special_wait", "special_drawing"]:
             self._draw_game()
         elif self.game_state == "hospital_ending":
-            self._draw_hospital_ending()
+            comp.add("background", self._draw_hospital_ending)
         elif self.game_state == "gameover":
-            self._draw_gameover()
+            comp.add("background", self._draw_gameover)
         elif self.game_state == "win":
-            self._draw_win()
+            comp.add("background", self._draw_win)
 
         # 글리치 시각 효과
         if self.game_state not in ["hospital_ending"]:
-            self.glitch.apply_visual_glitch(self.screen)
+            comp.add("post", self._apply_visual_glitch)
+
+        comp.render()
+        comp.present()
+        self.capture.frame(comp.display)
+
+    def _apply_visual_glitch(self):
+        """글리치 효과 그리기 (흔들림은 출력 오프셋으로)"""
+        self.glitch.draw(self.screen)
+        self.compositor.offset = self.glitch.shake_offset
+
+    def _build_scenes(self):
+        """타이틀/병실 엔딩/게임오버/승리 화면을 리테인드 레이어로 구성 (입력이 바뀔 때만 다시 그림)"""
+        full = (0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
+        title = Scene()
+        title.add("title", full, self._render_title, fill=WHITE)
+
+        hospital = Scene()
+        hospital.add("room", full, self._render_hospital_room, fill=HOSPITAL_WALL)
+        # 심전도 선만 투명 레이어로 (파동 구간에서만 매 프레임 다시 그림)
+        hospital.add("ecg", ECG_RECT, self._render_ecg)
+        hospital.add("text", (0, 500, SCREEN_WIDTH, SCREEN_HEIGHT - 500),
+                     self._render_hospital_text, fill=HOSPITAL_WALL)
 
-        pygame.display.flip()
+        gameover = Scene()
+        gameover.add("room", full, self._render_gameover_room, fill=BLACK)
+
+        win = Scene()
+        win.add("win", full, self._render_win, fill=WHITE)
+
+        self.scenes = {"title": title, "hospital_ending": hospital, "gameover": gameover, "win": win}
+        self.active_scene = None
+
+    def _select_scene(self):
+        """상태가 바뀌면 이전 화면의 캐시 서피스 해제"""
+        scene = self.scenes.get(self.game_state)
+        if scene is not self.active_scene:
+            if self.active_scene is not None:
+                self.active_scene.release()
+            self.active_scene = scene
 
     def _draw_title(self):
         """타이틀 화면"""
+        self.scenes["title"].draw(self.screen)
+
+        # Action button for touch
+        self._draw_action_button("START")
+
+    def _render_title(self, surface, key):
         title = self.large_font.render("TURTLE DRAWING", True, BLACK)
         subtitle = self.font.render("Press any key to start", True, GRAY)
         hint = self.font.render("Follow the dotted line!", True, GRAY)
         warning = self.small_font.render("WARNING: Contains horror elements", True, RED)
 
-        self.screen.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 200))
-        self.screen.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 350))
-        self.screen.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 400))
-        self.screen.blit(warning, (SCREEN_WIDTH // 2 - warning.get_width() // 2, 500))
+        surface.blit(title, (SCREEN_WIDTH // 2 - title.get_width() // 2, 200))
+        surface.blit(subtitle, (SCREEN_WIDTH // 2 - subtitle.get_width() // 2, 350))
+        surface.blit(hint, (SCREEN_WIDTH // 2 - hint.get_width() // 2, 400))
+        surface.blit(warning, (SCREEN_WIDTH // 2 - warning.get_width() // 2, 500))
 
-        pygame.draw.polygon(self.screen, BLACK, [
+        pygame.draw.polygon(surface, BLACK, [
             (SCREEN_WIDTH // 2, 250),
             (SCREEN_WIDTH // 2 - 30, 320),
             (SCREEN_WIDTH // 2 + 30, 320)
         ])
 
-        # Action button for touch
-        self.action_btn.draw(self.screen, "START")
-
     def _draw_game(self):
         """게임 화면"""
-        self.stage.draw(self.screen)
-        self.turtle.draw(self.screen)
+        comp = self.compositor
+        comp.add("background", self.stage.draw, self.screen)
+        comp.add("trail", self.turtle.draw, self.screen)
 
         # 적 그리기
-        self.glitch.draw_enemies(self.screen)
+        comp.add("entities", self.glitch.draw_enemies, self.screen)
+
+        comp.add("hud", self._draw_game_hud)
 
+    def _draw_game_hud(self):
+        """게임 화면 HUD (UI, 메시지, 터치 컨트롤)"""
         self._draw_ui()
 
         if self.game_state == "special_wait":
-            msg = self.font.render("Press any key...", True, RED)
+            msg = render_text(self.font, "Press any key...", RED)
             self.screen.blit(msg, (SCREEN_WIDTH // 2 - msg.get_width() // 2, 50))
 
         if self.game_state == "playing" and not self.on_path:
-            warning = self.font.render("OFF PATH!", True, RED)
+            warning = render_text(self.font, "OFF PATH!", RED)
             self.screen.blit(warning, (SCREEN_WIDTH // 2 - warning.get_width() // 2, 80))
 
+        if self.score_timer:
+            score = self.last_score
+            text = render_text(self.small_font, f"Stage {score.stage_num} clear - {score.format()}", (0, 120, 0))
+            self.screen.blit(text, (SCREEN_WIDTH - text.get_width() - 10, 50))
+
         # Virtual controls (for touch devices)
-        self.dpad.draw(self.screen)
+        if self.show_touch_controls:
+            self.dpad.draw(self.screen)
         if self.game_state == "special_wait":
-            self.action_btn.draw(self.screen, "GO")
+            self._draw_action_button("GO")
+
+    def _draw_action_button(self, text):
+        """액션 버튼 그리기 (터치 입력이 감지된 경우만)"""
+        if self.show_touch_controls:
+            self.action_btn.draw(self.screen, text)
 
     def _draw_ui(self):
         """UI 요소 그리기"""
-        stage_text = self.font.render(f"Stage: {self.current_stage}", True, BLACK)
+        stage_text = render_text(self.font, f"Stage: {self.current_stage}", BLACK)
         self.screen.blit(stage_text, (10, 10))
 
-        lives_text = self.font.render(f"Lives: {'*' * self.lives}", True, RED)
+        lives_text = render_text(self.font, f"Lives: {'*' * self.lives}", RED)
         self.screen.blit(lives_text, (10, 50))
 
-        glitch_status = self.glitch.get_status_text()
-        if glitch_status:
-            glitch_text = self.font.render(f"{glitch_status}", True, (150, 0, 150))
+        if self.glitch.glitch_level > 0:
+            glitch_status = " | ".join(self.glitch.status()) or "Something's wrong..."
+            glitch_text = render_text(self.font, glitch_status, (150, 0, 150))
             self.screen.blit(glitch_text, (10, 90))
 
-        controls = self.font.render("Arrow keys to move", True, GRAY)
+        controls = render_text(self.font, "Arrow keys to move", GRAY)
         self.screen.blit(controls, (SCREEN_WIDTH - controls.get_width() - 10, 10))
 
     def _draw_hospital_ending(self):
         """병실 엔딩 화면"""
-        # 병실 배경 (흰색/밝은 파란색)
-        self.screen.fill((240, 248, 255))
+        scene = self.scenes["hospital_ending"]
+        # 처음 60프레임은 매 프레임 다른 파동, 이후 flat line (사망)
+        scene.set("ecg", self.hospital_timer if self.hospital_timer <= 60 else None)
+        scene.set("text", (self.hospital_timer > 120, self.hospital_timer > 180))
+        scene.draw(self.screen)
+
+        if self.hospital_timer > 180:
+            # Action button for touch
+            self._draw_action_button("NEXT")
 
+    def _render_hospital_room(self, surface, key):
+        """병실 배경 (흰색/밝은 파란색)"""
         # 침대
         bed_color = (200, 200, 220)
-        pygame.draw.rect(self.screen, bed_color, (200, 300, 400, 200))  # 침대 프레임
-        pygame.draw.rect(self.screen, (255, 255, 255), (210, 310, 380, 100))  # 이불
-        pygame.draw.rect(self.screen, (220, 220, 240), (210, 310, 380, 100), 3)
+        pygame.draw.rect(surface, bed_color, (200, 300, 400, 200))  # 침대 프레임
+        pygame.draw.rect(surface, (255, 255, 255), (210, 310, 380, 100))  # 이불
+        pygame.draw.rect(surface, (220, 220, 240), (210, 310, 380, 100), 3)
 
         # 베개
-        pygame.draw.ellipse(self.screen, (255, 255, 255), (220, 280, 100, 50))
+        pygame.draw.ellipse(surface, (255, 255, 255), (220, 280, 100, 50))
 
         # 환자 (단순화)
-        pygame.draw.ellipse(self.screen, (255, 220, 200), (240, 270, 60, 40))  # 머리
-        pygame.draw.rect(self.screen, (255, 255, 255), (250, 320, 200, 80))  # 몸
+        pygame.draw.ellipse(surface, (255, 220, 200), (240, 270, 60, 40))  # 머리
+        pygame.draw.rect(surface, (255, 255, 255), (250, 320, 200, 80))  # 몸
 
         # 심전도 모니터
-        pygame.draw.rect(self.screen, (50, 50, 50), (550, 150, 150, 120))
-        pygame.draw.rect(self.screen, (0, 50, 0), (560, 160, 130, 80))
+        pygame.draw.rect(surface, (50, 50, 50), (550, 150, 150, 120))
+        pygame.draw.rect(surface, (0, 50, 0), (560, 160, 130, 80))
 
-        # 심전도 선 (flat line - 사망)
-        if self.hospital_timer > 60:
-            pygame.draw.line(self.screen, (0, 255, 0), (560, 200), (690, 200), 2)
+        # 창문
+        pygame.draw.rect(surface, (135, 206, 235), (50, 100, 120, 150))
+        pygame.draw.rect(surface, (255, 255, 255), (50, 100, 120, 150), 5)
+        pygame.draw.line(surface, (255, 255, 255), (110, 100), (110, 250), 5)
+        pygame.draw.line(surface, (255, 255, 255), (50, 175), (170, 175), 5)
+
+    def _render_ecg(self, surface, timer):
+        """심전도 선 (ECG_RECT 기준 로컬 좌표)"""
+        left, top = ECG_RECT[0], ECG_RECT[1]
+        if timer is None:
+            # flat line - 사망
+            pygame.draw.line(surface, (0, 255, 0), (560 - left, 200 - top), (690 - left, 200 - top), 2)
         else:
             # 처음엔 약간의 파동
             for i in range(13):
-                x1 = 560 + i * 10
-                x2 = 560 + (i + 1) * 10
-                y1 = 200 + random.randint(-20, 20)
-                y2 = 200 + random.randint(-20, 20)
-                pygame.draw.line(self.screen, (0, 255, 0), (x1, y1), (x2, y2), 2)
-
-        # 창문
-        pygame.draw.rect(self.screen, (135, 206, 235), (50, 100, 120, 150))
-        pygame.draw.rect(self.screen, (255, 255, 255), (50, 100, 120, 150), 5)
-        pygame.draw.line(self.screen, (255, 255, 255), (110, 100), (110, 250), 5)
-        pygame.draw.line(self.screen, (255, 255, 255), (50, 175), (170, 175), 5)
-
-        # 텍스트
-        if self.hospital_timer > 120:
+                x1 = 560 + i * 10 - left
+                x2 = 560 + (i + 1) * 10 - left
+                y1 = 200 + random.randint(-20, 20) - top
+                y2 = 200 + random.randint(-20, 20) - top
+                pygame.draw.line(surface, (0, 255, 0), (x1, y1), (x2, y2), 2)
+
+    def _render_hospital_text(self, surface, key):
+        """텍스트 (y=500 기준 로컬 좌표)"""
+        show_dots, show_continue = key
+        if show_dots:
             text = self.font.render("...", True, BLACK)
-            self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 500))
+            surface.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 0))
 
-        if self.hospital_timer > 180:
+        if show_continue:
             text2 = self.small_font.render("Press any key to continue", True, GRAY)
-            self.screen.blit(text2, (SCREEN_WIDTH // 2 - text2.get_width() // 2, 550))
-            # Action button for touch
-            self.action_btn.draw(self.screen, "NEXT")
+            surface.blit(text2, (SCREEN_WIDTH // 2 - text2.get_width() // 2, 50))
 
     def _draw_gameover(self):
-        """게임오버 화면 - 인형들"""
+        """게임오버 화면 - 인형들 (배경은 캐시, 글리치 텍스트만 매 프레임)"""
+        scene = self.scenes["gameover"]
+        scene.set("room", governor.get('gradient_step'))
+        scene.draw(self.screen)
+
+        # 텍스트 (글리치 효과)
+        text = render_text(self.large_font, "GAME OVER", (180, 0, 0))
+        text_x = SCREEN_WIDTH // 2 - text.get_width() // 2
+        # 글리치 복제
+        if random.random() < 0.3:
+            offset = random.randint(-3, 3)
+            self.screen.blit(text, (text_x + offset, 25 + random.randint(-2, 2)))
+        self.screen.blit(text, (text_x, 25))
+
+        stage_text = render_text(self.font, f"Reached Stage: {self.current_stage}", (120, 120, 120))
+        self.screen.blit(stage_text, (SCREEN_WIDTH // 2 - stage_text.get_width() // 2, 540))
+
+        restart = render_text(self.font, "Press SPACE to restart", (100, 100, 100))
+        self.screen.blit(restart, (SCREEN_WIDTH // 2 - restart.get_width() // 2, 570))
+
+        # Action button for touch
+        self._draw_action_button("RETRY")
+
+    def _render_gameover_room(self, surface, step):
+        """게임오버 배경 - 인형들 (품질 단계별 gradient_step 이 입력, 구역마다 yield)"""
         # 어두운 그라데이션 배경
-        for y in range(SCREEN_HEIGHT):
+        for n, y in enumerate(range(0, SCREEN_HEIGHT, step), 1):
             darkness = int(20 + (y / SCREEN_HEIGHT) * 15)
-            pygame.draw.line(self.screen, (darkness, darkness - 5, darkness + 10),
-                           (0, y), (SCREEN_WIDTH, y))
+            pygame.draw.rect(surface, (darkness, darkness - 5, darkness + 10),
+                             (0, y, SCREEN_WIDTH, step))
+            if n % ROOM_SLICE_ROWS == 0:
+                yield
 
         # 바닥 (나무 마루)
         floor_y = 450
         for i in range(0, SCREEN_WIDTH, 60):
             color = (60, 40, 25) if (i // 60) % 2 == 0 else (50, 35, 20)
-            pygame.draw.rect(self.screen, color, (i, floor_y, 60, 150))
-            pygame.draw.line(self.screen, (40, 25, 15), (i, floor_y), (i, SCREEN_HEIGHT), 2)
+            pygame.draw.rect(surface, color, (i, floor_y, 60, 150))
+            pygame.draw.line(surface, (40, 25, 15), (i, floor_y), (i, SCREEN_HEIGHT), 2)
 
         # 벽 무늬 (벽지)
         for y in range(0, floor_y, 40):
             alpha = 30 if (y // 40) % 2 == 0 else 20
-            pygame.draw.line(self.screen, (alpha, alpha - 5, alpha + 5),
+            pygame.draw.line(surface, (alpha, alpha - 5, alpha + 5),
                            (0, y), (SCREEN_WIDTH, y), 1)
 
+        yield
+
         # 창문 (달빛)
-        pygame.draw.rect(self.screen, (40, 50, 70), (50, 80, 120, 160))
-        pygame.draw.rect(self.screen, (20, 25, 35), (50, 80, 120, 160), 4)
-        pygame.draw.line(self.screen, (20, 25, 35), (110, 80), (110, 240), 4)
-        pygame.draw.line(self.screen, (20, 25, 35), (50, 160), (170, 160), 4)
+        pygame.draw.rect(surface, (40, 50, 70), (50, 80, 120, 160))
+        pygame.draw.rect(surface, (20, 25, 35), (50, 80, 120, 160), 4)
+        pygame.draw.line(surface, (20, 25, 35), (110, 80), (110, 240), 4)
+        pygame.draw.line(surface, (20, 25, 35), (50, 160), (170, 160), 4)
         # 달
-        pygame.draw.circle(self.screen, (200, 200, 180), (90, 120), 25)
-        pygame.draw.circle(self.screen, (40, 50, 70), (100, 115), 20)
+        pygame.draw.circle(surface, (200, 200, 180), (90, 120), 25)
+        pygame.draw.circle(surface, (40, 50, 70), (100, 115), 20)
 
         # 달빛 효과
-        moonlight = pygame.Surface((200, 300), pygame.SRCALPHA)
-        for i in range(100, 0, -2):
+        moonlight = create_surface((200, 300), alpha=True, owner="scenes")
+        for n, i in enumerate(range(100, 0, -2 * step), 1):
             pygame.draw.polygon(moonlight, (100, 100, 150, i // 10),
                               [(60, 0), (0, 300), (140, 300)])
-        self.screen.blit(moonlight, (30, 240))
+            if n % ROOM_SLICE_SHAPES == 0:
+                yield
+        blit(surface, moonlight, (30, 240), "moonlight")
+
+        yield
 
         # 선반 (뒤쪽 인형들)
-        pygame.draw.rect(self.screen, (45, 30, 20), (500, 150, 250, 15))
-        self._draw_creepy_doll_detailed(550, 140, facing_right=False, scale=0.5)
-        self._draw_creepy_doll_detailed(620, 140, facing_right=False, scale=0.45)
-        self._draw_creepy_doll_detailed(690, 140, facing_right=False, scale=0.5)
+        pygame.draw.rect(surface, (45, 30, 20), (500, 150, 250, 15))
+        self._draw_creepy_doll_detailed(surface, 550, 140, facing_right=False, scale=0.5)
+        self._draw_creepy_doll_detailed(surface, 620, 140, facing_right=False, scale=0.45)
+        self._draw_creepy_doll_detailed(surface, 690, 140, facing_right=False, scale=0.5)
+
+        yield
 
         # 왼쪽 의자 위 인형
-        pygame.draw.rect(self.screen, (50, 35, 25), (80, 380, 80, 70))  # 의자
-        pygame.draw.rect(self.screen, (55, 40, 28), (80, 320, 80, 60))  # 등받이
-        self._draw_creepy_doll_detailed(120, 340, facing_right=True, scale=0.8)
+        pygame.draw.rect(surface, (50, 35, 25), (80, 380, 80, 70))  # 의자
+        pygame.draw.rect(surface, (55, 40, 28), (80, 320, 80, 60))  # 등받이
+        self._draw_creepy_doll_detailed(surface, 120, 340, facing_right=True, scale=0.8)
+
+        yield
 
         # 오른쪽 바닥 인형들
-        self._draw_creepy_doll_detailed(650, 420, facing_right=False, scale=0.9)
-        self._draw_clown_doll(720, 430, facing_right=False, scale=0.7)
+        self._draw_creepy_doll_detailed(surface, 650, 420, facing_right=False, scale=0.9)
+        self._draw_clown_doll(surface, 720, 430, facing_right=False, scale=0.7)
+
+        yield
 
         # 중앙 곰돌이 인형 (메인, 스포트라이트)
         bear_x, bear_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70
-        self._draw_teddy_bear_detailed(bear_x, bear_y, 1.2)
+        self._draw_teddy_bear_detailed(surface, bear_x, bear_y, 1.2)
 
-        # 스포트라이트 효과 (더 부드럽게)
-        spotlight = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for r in range(250, 0, -3):
+        yield
+
+        # 스포트라이트 효과 (더 부드럽게, 가장 큰 원 크기의 서피스에)
+        spotlight = create_surface((500, 500), alpha=True, owner="scenes")
+        for n, r in enumerate(range(250, 0, -3 * step), 1):
             alpha = int((250 - r) / 250 * 40)
-            pygame.draw.circle(spotlight, (255, 240, 200, alpha), (bear_x, bear_y), r)
-        self.screen.blit(spotlight, (0, 0))
+            pygame.draw.circle(spotlight, (255, 240, 200, alpha), (250, 250), r)
+            if n % ROOM_SLICE_SHAPES == 0:
+                yield
+        blit(surface, spotlight, (bear_x - 250, bear_y - 250), "spotlight")
+
+        yield
 
         # 가까이 있는 인형 (앞쪽, 일부만 보임)
-        self._draw_creepy_doll_detailed(50, 500, facing_right=True, scale=1.3)
-        self._draw_creepy_doll_detailed(750, 500, facing_right=False, scale=1.2)
+        self._draw_creepy_doll_detailed(surface, 50, 500, facing_right=True, scale=1.3)
+        self._draw_creepy_doll_detailed(surface, 750, 500, facing_right=False, scale=1.2)
+
+        yield
 
         # 비네팅 효과 (가장자리 어둡게)
-        vignette = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for i in range(100):
+        vignette = create_surface((SCREEN_WIDTH, SCREEN_HEIGHT), alpha=True, owner="scenes")
+        for n, i in enumerate(range(0, 100, step), 1):
             alpha = int(i * 1.5)
             pygame.draw.rect(vignette, (0, 0, 0, alpha),
-                           (i, i, SCREEN_WIDTH - i*2, SCREEN_HEIGHT - i*2), 3)
-        self.screen.blit(vignette, (0, 0))
-
-        # 텍스트 (글리치 효과)
-        text = self.large_font.render("GAME OVER", True, (180, 0, 0))
-        text_x = SCREEN_WIDTH // 2 - text.get_width() // 2
-        # 글리치 복제
-        if random.random() < 0.3:
-            offset = random.randint(-3, 3)
-            self.screen.blit(text, (text_x + offset, 25 + random.randint(-2, 2)))
-        self.screen.blit(text, (text_x, 25))
-
-        stage_text = self.font.render(f"Reached Stage: {self.current_stage}", True, (120, 120, 120))
-        self.screen.blit(stage_text, (SCREEN_WIDTH // 2 - stage_text.get_width() // 2, 540))
-
-        restart = self.font.render("Press SPACE to restart", True, (100, 100, 100))
-        self.screen.blit(restart, (SCREEN_WIDTH // 2 - restart.get_width() // 2, 570))
-
-        # Action button for touch
-        self.action_btn.draw(self.screen, "RETRY")
-
-    def _draw_teddy_bear(self, x, y, scale=1.0):
+                           (i, i, SCREEN_WIDTH - i*2, SCREEN_HEIGHT - i*2), max(3, step))
+            if n % ROOM_SLICE_SHAPES == 0:
+                yield
+        # 가운데는 투명하므로 테두리 띠 네 개만 블릿
+        band = 100 + max(3, step)
+        for area in ((0, 0, SCREEN_WIDTH, band), (0, SCREEN_HEIGHT - band, SCREEN_WIDTH, band),
+                     (0, band, band, SCREEN_HEIGHT - 2 * band),
+                     (SCREEN_WIDTH - band, band, band, SCREEN_HEIGHT - 2 * band)):
+            yield
+            surface.blit(vignette, area[:2], area)
+
+    def _draw_teddy_bear(self, surface, x, y, scale=1.0):
         """곰돌이 인형 그리기"""
         s = scale
         brown = (139, 90, 43)
@@ -643,47 +943,47 @@ class Game:
         dark_brown = (101, 67, 33)
 
         # 몸통
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x - int(40*s), y - int(20*s), int(80*s), int(100*s)))
 
         # 머리
-        pygame.draw.circle(self.screen, brown, (x, y - int(60*s)), int(50*s))
+        pygame.draw.circle(surface, brown, (x, y - int(60*s)), int(50*s))
 
         # 귀
-        pygame.draw.circle(self.screen, brown, (x - int(40*s), y - int(95*s)), int(20*s))
-        pygame.draw.circle(self.screen, brown, (x + int(40*s), y - int(95*s)), int(20*s))
-        pygame.draw.circle(self.screen, light_brown, (x - int(40*s), y - int(95*s)), int(12*s))
-        pygame.draw.circle(self.screen, light_brown, (x + int(40*s), y - int(95*s)), int(12*s))
+        pygame.draw.circle(surface, brown, (x - int(40*s), y - int(95*s)), int(20*s))
+        pygame.draw.circle(surface, brown, (x + int(40*s), y - int(95*s)), int(20*s))
+        pygame.draw.circle(surface, light_brown, (x - int(40*s), y - int(95*s)), int(12*s))
+        pygame.draw.circle(surface, light_brown, (x + int(40*s), y - int(95*s)), int(12*s))
 
         # 주둥이
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x - int(20*s), y - int(50*s), int(40*s), int(30*s)))
 
         # 코
-        pygame.draw.ellipse(self.screen, dark_brown,
+        pygame.draw.ellipse(surface, dark_brown,
                            (x - int(8*s), y - int(45*s), int(16*s), int(12*s)))
 
         # 눈 (버튼 눈, 하나가 떨어져 있음 - 무서운 효과)
-        pygame.draw.circle(self.screen, (20, 20, 20), (x - int(20*s), y - int(65*s)), int(8*s))
+        pygame.draw.circle(surface, (20, 20, 20), (x - int(20*s), y - int(65*s)), int(8*s))
         # X 표시된 눈 (꿰맨 자국)
-        pygame.draw.line(self.screen, (20, 20, 20),
+        pygame.draw.line(surface, (20, 20, 20),
                         (x + int(12*s), y - int(73*s)), (x + int(28*s), y - int(57*s)), int(3*s))
-        pygame.draw.line(self.screen, (20, 20, 20),
+        pygame.draw.line(surface, (20, 20, 20),
                         (x + int(28*s), y - int(73*s)), (x + int(12*s), y - int(57*s)), int(3*s))
 
         # 팔
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x - int(65*s), y - int(10*s), int(35*s), int(60*s)))
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x + int(30*s), y - int(10*s), int(35*s), int(60*s)))
 
         # 다리
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x - int(35*s), y + int(50*s), int(30*s), int(40*s)))
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x + int(5*s), y + int(50*s), int(30*s), int(40*s)))
 
-    def _draw_creepy_doll(self, x, y, facing_right=True, scale=1.0):
+    def _draw_creepy_doll(self, surface, x, y, facing_right=True, scale=1.0):
         """무서운 인형 그리기 (곰돌이를 쳐다보는)"""
         s = scale
         skin = (255, 220, 200)
@@ -691,40 +991,40 @@ class Game:
         hair = (40, 30, 20)
 
         # 몸 (드레스)
-        pygame.draw.ellipse(self.screen, dress,
+        pygame.draw.ellipse(surface, dress,
                            (x - int(25*s), y - int(10*s), int(50*s), int(70*s)))
 
         # 머리
-        pygame.draw.circle(self.screen, skin, (x, y - int(40*s)), int(30*s))
+        pygame.draw.circle(surface, skin, (x, y - int(40*s)), int(30*s))
 
         # 머리카락
-        pygame.draw.ellipse(self.screen, hair,
+        pygame.draw.ellipse(surface, hair,
                            (x - int(35*s), y - int(70*s), int(70*s), int(50*s)))
 
         # 눈 (큰 검은 눈, 중앙을 쳐다봄)
         eye_offset = int(5*s) if facing_right else -int(5*s)
         # 흰자
-        pygame.draw.ellipse(self.screen, (255, 255, 255),
+        pygame.draw.ellipse(surface, (255, 255, 255),
                            (x - int(18*s), y - int(50*s), int(15*s), int(20*s)))
-        pygame.draw.ellipse(self.screen, (255, 255, 255),
+        pygame.draw.ellipse(surface, (255, 255, 255),
                            (x + int(3*s), y - int(50*s), int(15*s), int(20*s)))
         # 동공 (중앙을 향해)
-        pygame.draw.circle(self.screen, (0, 0, 0),
+        pygame.draw.circle(surface, (0, 0, 0),
                           (x - int(10*s) + eye_offset, y - int(42*s)), int(5*s))
-        pygame.draw.circle(self.screen, (0, 0, 0),
+        pygame.draw.circle(surface, (0, 0, 0),
                           (x + int(10*s) + eye_offset, y - int(42*s)), int(5*s))
         # 하이라이트
-        pygame.draw.circle(self.screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                           (x - int(8*s) + eye_offset, y - int(44*s)), int(2*s))
-        pygame.draw.circle(self.screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                           (x + int(12*s) + eye_offset, y - int(44*s)), int(2*s))
 
         # 입 (미소, 하지만 무섭게)
-        pygame.draw.arc(self.screen, (100, 50, 50),
+        pygame.draw.arc(surface, (100, 50, 50),
                        (x - int(10*s), y - int(30*s), int(20*s), int(15*s)),
                        3.14, 0, int(2*s))
 
-    def _draw_teddy_bear_detailed(self, x, y, scale=1.0):
+    def _draw_teddy_bear_detailed(self, surface, x, y, scale=1.0):
         """고퀄리티 곰돌이 인형"""
         s = scale
         brown = (120, 80, 40)
@@ -733,89 +1033,89 @@ class Game:
         patch_color = (100, 70, 35)
 
         # 그림자
-        shadow = pygame.Surface((int(120*s), int(40*s)), pygame.SRCALPHA)
+        shadow = create_surface((int(120*s), int(40*s)), alpha=True, owner="scenes")
         pygame.draw.ellipse(shadow, (0, 0, 0, 80), (0, 0, int(120*s), int(40*s)))
-        self.screen.blit(shadow, (x - int(60*s), y + int(75*s)))
+        blit(surface, shadow, (x - int(60*s), y + int(75*s)), "teddy_shadow")
 
         # 다리
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x - int(40*s), y + int(40*s), int(35*s), int(50*s)))
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x + int(5*s), y + int(40*s), int(35*s), int(50*s)))
         # 발바닥
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x - int(35*s), y + int(70*s), int(25*s), int(15*s)))
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x + int(10*s), y + int(70*s), int(25*s), int(15*s)))
 
         # 몸통
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x - int(45*s), y - int(30*s), int(90*s), int(100*s)))
         # 배 패치
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x - int(25*s), y - int(5*s), int(50*s), int(45*s)))
 
         # 팔
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x - int(70*s), y - int(20*s), int(35*s), int(55*s)))
-        pygame.draw.ellipse(self.screen, brown,
+        pygame.draw.ellipse(surface, brown,
                            (x + int(35*s), y - int(20*s), int(35*s), int(55*s)))
         # 손바닥
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x - int(65*s), y + int(20*s), int(20*s), int(15*s)))
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x + int(45*s), y + int(20*s), int(20*s), int(15*s)))
 
         # 머리
-        pygame.draw.circle(self.screen, brown, (x, y - int(60*s)), int(55*s))
+        pygame.draw.circle(surface, brown, (x, y - int(60*s)), int(55*s))
 
         # 귀
-        pygame.draw.circle(self.screen, brown, (x - int(45*s), y - int(100*s)), int(22*s))
-        pygame.draw.circle(self.screen, brown, (x + int(45*s), y - int(100*s)), int(22*s))
-        pygame.draw.circle(self.screen, light_brown, (x - int(45*s), y - int(100*s)), int(12*s))
-        pygame.draw.circle(self.screen, light_brown, (x + int(45*s), y - int(100*s)), int(12*s))
+        pygame.draw.circle(surface, brown, (x - int(45*s), y - int(100*s)), int(22*s))
+        pygame.draw.circle(surface, brown, (x + int(45*s), y - int(100*s)), int(22*s))
+        pygame.draw.circle(surface, light_brown, (x - int(45*s), y - int(100*s)), int(12*s))
+        pygame.draw.circle(surface, light_brown, (x + int(45*s), y - int(100*s)), int(12*s))
 
         # 주둥이
-        pygame.draw.ellipse(self.screen, light_brown,
+        pygame.draw.ellipse(surface, light_brown,
                            (x - int(22*s), y - int(55*s), int(44*s), int(35*s)))
 
         # 코
-        pygame.draw.ellipse(self.screen, (30, 20, 15),
+        pygame.draw.ellipse(surface, (30, 20, 15),
                            (x - int(10*s), y - int(50*s), int(20*s), int(14*s)))
         # 코 하이라이트
-        pygame.draw.ellipse(self.screen, (60, 40, 30),
+        pygame.draw.ellipse(surface, (60, 40, 30),
                            (x - int(6*s), y - int(48*s), int(8*s), int(5*s)))
 
         # 입 (꿰맨 자국)
-        pygame.draw.arc(self.screen, (40, 25, 15),
+        pygame.draw.arc(surface, (40, 25, 15),
                        (x - int(12*s), y - int(40*s), int(24*s), int(16*s)),
                        3.14, 0, int(2*s))
         # 꿰맨 실
         for i in range(5):
             sx = x - int(10*s) + i * int(5*s)
-            pygame.draw.line(self.screen, (40, 25, 15),
+            pygame.draw.line(surface, (40, 25, 15),
                            (sx, y - int(35*s)), (sx, y - int(30*s)), 1)
 
         # 왼쪽 눈 (버튼)
-        pygame.draw.circle(self.screen, (20, 15, 10), (x - int(20*s), y - int(70*s)), int(10*s))
-        pygame.draw.circle(self.screen, (40, 30, 20), (x - int(20*s), y - int(70*s)), int(6*s))
+        pygame.draw.circle(surface, (20, 15, 10), (x - int(20*s), y - int(70*s)), int(10*s))
+        pygame.draw.circle(surface, (40, 30, 20), (x - int(20*s), y - int(70*s)), int(6*s))
         # 버튼 구멍
-        pygame.draw.circle(self.screen, (15, 10, 5), (x - int(22*s), y - int(72*s)), int(2*s))
-        pygame.draw.circle(self.screen, (15, 10, 5), (x - int(18*s), y - int(68*s)), int(2*s))
+        pygame.draw.circle(surface, (15, 10, 5), (x - int(22*s), y - int(72*s)), int(2*s))
+        pygame.draw.circle(surface, (15, 10, 5), (x - int(18*s), y - int(68*s)), int(2*s))
 
         # 오른쪽 눈 (X자 - 떨어진 버튼)
-        pygame.draw.line(self.screen, (30, 20, 10),
+        pygame.draw.line(surface, (30, 20, 10),
                         (x + int(10*s), y - int(80*s)), (x + int(30*s), y - int(60*s)), int(3*s))
-        pygame.draw.line(self.screen, (30, 20, 10),
+        pygame.draw.line(surface, (30, 20, 10),
                         (x + int(30*s), y - int(80*s)), (x + int(10*s), y - int(60*s)), int(3*s))
         # 실 자국
         for i in range(3):
-            pygame.draw.line(self.screen, (50, 35, 20),
+            pygame.draw.line(surface, (50, 35, 20),
                            (x + int(15*s) + i*int(5*s), y - int(75*s)),
                            (x + int(17*s) + i*int(5*s), y - int(65*s)), 1)
 
         # 패치 (기운 자국)
-        pygame.draw.polygon(self.screen, patch_color, [
+        pygame.draw.polygon(surface, patch_color, [
             (x + int(25*s), y - int(45*s)),
             (x + int(40*s), y - int(40*s)),
             (x + int(35*s), y - int(25*s)),
@@ -831,10 +1131,10 @@ class Game:
                 t = (j + 1) / 4
                 px = int(p1[0] + (p2[0] - p1[0]) * t)
                 py = int(p1[1] + (p2[1] - p1[1]) * t)
-                pygame.draw.line(self.screen, (40, 25, 15),
+                pygame.draw.line(surface, (40, 25, 15),
                                (px - 2, py - 2), (px + 2, py + 2), 1)
 
-    def _draw_creepy_doll_detailed(self, x, y, facing_right=True, scale=1.0):
+    def _draw_creepy_doll_detailed(self, surface, x, y, facing_right=True, scale=1.0):
         """고퀄리티 무서운 인형"""
         s = scale
         skin = (240, 210, 190)
@@ -845,19 +1145,19 @@ class Game:
 
         # 그림자
         if scale > 0.6:
-            shadow = pygame.Surface((int(60*s), int(20*s)), pygame.SRCALPHA)
+            shadow = create_surface((int(60*s), int(20*s)), alpha=True, owner="scenes")
             pygame.draw.ellipse(shadow, (0, 0, 0, 60), (0, 0, int(60*s), int(20*s)))
-            self.screen.blit(shadow, (x - int(30*s), y + int(55*s)))
+            blit(surface, shadow, (x - int(30*s), y + int(55*s)), "doll_shadow")
 
         # 다리
-        pygame.draw.rect(self.screen, skin,
+        pygame.draw.rect(surface, skin,
                         (x - int(15*s), y + int(30*s), int(12*s), int(30*s)))
-        pygame.draw.rect(self.screen, skin,
+        pygame.draw.rect(surface, skin,
                         (x + int(3*s), y + int(30*s), int(12*s), int(30*s)))
         # 신발
-        pygame.draw.ellipse(self.screen, (20, 15, 15),
+        pygame.draw.ellipse(surface, (20, 15, 15),
                            (x - int(18*s), y + int(55*s), int(18*s), int(10*s)))
-        pygame.draw.ellipse(self.screen, (20, 15, 15),
+        pygame.draw.ellipse(surface, (20, 15, 15),
                            (x, y + int(55*s), int(18*s), int(10*s)))
 
         # 드레스
@@ -867,146 +1167,220 @@ class Game:
             (x + int(20*s), y - int(5*s)),
             (x - int(20*s), y - int(5*s))
         ]
-        pygame.draw.polygon(self.screen, dress, points)
+        pygame.draw.polygon(surface, dress, points)
         # 드레스 주름
         for i in range(3):
             fx = x - int(15*s) + i * int(15*s)
-            pygame.draw.line(self.screen, dress_dark,
+            pygame.draw.line(surface, dress_dark,
                            (fx, y), (fx - int(5*s), y + int(35*s)), 1)
 
         # 팔
-        pygame.draw.rect(self.screen, skin,
+        pygame.draw.rect(surface, skin,
                         (x - int(30*s), y - int(5*s), int(12*s), int(25*s)))
-        pygame.draw.rect(self.screen, skin,
+        pygame.draw.rect(surface, skin,
                         (x + int(18*s), y - int(5*s), int(12*s), int(25*s)))
 
         # 목
-        pygame.draw.rect(self.screen, skin, (x - int(6*s), y - int(15*s), int(12*s), int(12*s)))
+        pygame.draw.rect(surface, skin, (x - int(6*s), y - int(15*s), int(12*s), int(12*s)))
 
         # 머리
-        pygame.draw.circle(self.screen, skin, (x, y - int(40*s)), int(28*s))
+        pygame.draw.circle(surface, skin, (x, y - int(40*s)), int(28*s))
 
         # 머리카락
-        pygame.draw.ellipse(self.screen, hair,
+        pygame.draw.ellipse(surface, hair,
                            (x - int(32*s), y - int(70*s), int(64*s), int(45*s)))
         # 앞머리
         for i in range(5):
             hx = x - int(20*s) + i * int(10*s)
-            pygame.draw.ellipse(self.screen, hair,
+            pygame.draw.ellipse(surface, hair,
                               (hx, y - int(55*s), int(12*s), int(20*s)))
         # 옆머리
-        pygame.draw.ellipse(self.screen, hair,
+        pygame.draw.ellipse(surface, hair,
                            (x - int(35*s), y - int(50*s), int(15*s), int(40*s)))
-        pygame.draw.ellipse(self.screen, hair,
+        pygame.draw.ellipse(surface, hair,
                            (x + int(20*s), y - int(50*s), int(15*s), int(40*s)))
 
         # 눈 (중앙을 쳐다봄)
         eye_offset = int(4*s) if facing_right else -int(4*s)
         # 흰자
-        pygame.draw.ellipse(self.screen, (255, 255, 255),
+        pygame.draw.ellipse(surface, (255, 255, 255),
                            (x - int(18*s), y - int(48*s), int(14*s), int(18*s)))
-        pygame.draw.ellipse(self.screen, (255, 255, 255),
+        pygame.draw.ellipse(surface, (255, 255, 255),
                            (x + int(4*s), y - int(48*s), int(14*s), int(18*s)))
         # 홍채
-        pygame.draw.circle(self.screen, (60, 40, 30),
+        pygame.draw.circle(surface, (60, 40, 30),
                           (x - int(11*s) + eye_offset, y - int(40*s)), int(6*s))
-        pygame.draw.circle(self.screen, (60, 40, 30),
+        pygame.draw.circle(surface, (60, 40, 30),
                           (x + int(11*s) + eye_offset, y - int(40*s)), int(6*s))
         # 동공
-        pygame.draw.circle(self.screen, (10, 5, 5),
+        pygame.draw.circle(surface, (10, 5, 5),
                           (x - int(11*s) + eye_offset, y - int(40*s)), int(3*s))
-        pygame.draw.circle(self.screen, (10, 5, 5),
+        pygame.draw.circle(surface, (10, 5, 5),
                           (x + int(11*s) + eye_offset, y - int(40*s)), int(3*s))
         # 하이라이트
-        pygame.draw.circle(self.screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                           (x - int(9*s) + eye_offset, y - int(42*s)), int(2*s))
-        pygame.draw.circle(self.screen, (255, 255, 255),
+        pygame.draw.circle(surface, (255, 255, 255),
                           (x + int(13*s) + eye_offset, y - int(42*s)), int(2*s))
 
         # 볼터치
-        pygame.draw.circle(self.screen, (255, 180, 180),
+        pygame.draw.circle(surface, (255, 180, 180),
                           (x - int(20*s), y - int(30*s)), int(5*s))
-        pygame.draw.circle(self.screen, (255, 180, 180),
+        pygame.draw.circle(surface, (255, 180, 180),
                           (x + int(20*s), y - int(30*s)), int(5*s))
 
         # 입 (미소)
-        pygame.draw.arc(self.screen, (150, 80, 80),
+        pygame.draw.arc(surface, (150, 80, 80),
                        (x - int(8*s), y - int(28*s), int(16*s), int(12*s)),
                        3.14, 0, int(2*s))
 
-    def _draw_clown_doll(self, x, y, facing_right=True, scale=1.0):
+    def _draw_clown_doll(self, surface, x, y, facing_right=True, scale=1.0):
         """무서운 광대 인형"""
         s = scale
         white = (240, 235, 230)
         red = (180, 30, 30)
 
         # 몸통
-        pygame.draw.ellipse(self.screen, (100, 80, 120),
+        pygame.draw.ellipse(surface, (100, 80, 120),
                            (x - int(20*s), y - int(10*s), int(40*s), int(50*s)))
 
         # 머리
-        pygame.draw.circle(self.screen, white, (x, y - int(35*s)), int(25*s))
+        pygame.draw.circle(surface, white, (x, y - int(35*s)), int(25*s))
 
         # 광대 머리카락 (양옆 뿔뿔이)
-        pygame.draw.circle(self.screen, red, (x - int(25*s), y - int(40*s)), int(12*s))
-        pygame.draw.circle(self.screen, red, (x + int(25*s), y - int(40*s)), int(12*s))
-        pygame.draw.circle(self.screen, (255, 200, 0), (x, y - int(55*s)), int(10*s))
+        pygame.draw.circle(surface, red, (x - int(25*s), y - int(40*s)), int(12*s))
+        pygame.draw.circle(surface, red, (x + int(25*s), y - int(40*s)), int(12*s))
+        pygame.draw.circle(surface, (255, 200, 0), (x, y - int(55*s)), int(10*s))
 
         # 눈 (무섭게)
         eye_offset = int(3*s) if facing_right else -int(3*s)
-        pygame.draw.ellipse(self.screen, (255, 255, 0),
+        pygame.draw.ellipse(surface, (255, 255, 0),
                            (x - int(15*s), y - int(45*s), int(12*s), int(15*s)))
-        pygame.draw.ellipse(self.screen, (255, 255, 0),
+        pygame.draw.ellipse(surface, (255, 255, 0),
                            (x + int(3*s), y - int(45*s), int(12*s), int(15*s)))
-        pygame.draw.circle(self.screen, (0, 0, 0),
+        pygame.draw.circle(surface, (0, 0, 0),
                           (x - int(9*s) + eye_offset, y - int(38*s)), int(4*s))
-        pygame.draw.circle(self.screen, (0, 0, 0),
+        pygame.draw.circle(surface, (0, 0, 0),
                           (x + int(9*s) + eye_offset, y - int(38*s)), int(4*s))
 
         # 코 (빨간 공)
-        pygame.draw.circle(self.screen, red, (x, y - int(30*s)), int(8*s))
-        pygame.draw.circle(self.screen, (220, 50, 50), (x - int(2*s), y - int(32*s)), int(3*s))
+        pygame.draw.circle(surface, red, (x, y - int(30*s)), int(8*s))
+        pygame.draw.circle(surface, (220, 50, 50), (x - int(2*s), y - int(32*s)), int(3*s))
 
         # 입 (무서운 미소)
-        pygame.draw.arc(self.screen, red,
+        pygame.draw.arc(surface, red,
                        (x - int(15*s), y - int(25*s), int(30*s), int(20*s)),
                        3.14, 0, int(3*s))
         # 이빨
         for i in range(4):
             tx = x - int(10*s) + i * int(7*s)
-            pygame.draw.rect(self.screen, (255, 255, 240),
+            pygame.draw.rect(surface, (255, 255, 240),
                            (tx, y - int(20*s), int(5*s), int(8*s)))
 
     def _draw_win(self):
         """승리 화면"""
+        self.scenes["win"].draw(self.screen)
+
+        # Action button for touch
+        self._draw_action_button("AGAIN")
+
+    def _render_win(self, surface, key):
         text = self.large_font.render("YOU WIN!", True, GREEN)
         congrats = self.font.render("Congratulations! You escaped!", True, BLACK)
         restart = self.font.render("Press SPACE to play again", True, GRAY)
 
-        self.screen.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 200))
-        self.screen.blit(congrats, (SCREEN_WIDTH // 2 - congrats.get_width() // 2, 300))
-        self.screen.blit(restart, (SCREEN_WIDTH // 2 - restart.get_width() // 2, 400))
-
-        # Action button for touch
-        self.action_btn.draw(self.screen, "AGAIN")
+        surface.blit(text, (SCREEN_WIDTH // 2 - text.get_width() // 2, 200))
+        surface.blit(congrats, (SCREEN_WIDTH // 2 - congrats.get_width() // 2, 300))
+        surface.blit(restart, (SCREEN_WIDTH // 2 - restart.get_width() // 2, 400))
 
     async def run(self):
         """메인 게임 루프 (async for Pygbag)"""
+        # 다음 프레임 마감까지 await 로 대기 (그 사이 백그라운드 코루틴 실행)
+        # KSH_DEBUG_FRAMES=1 이면 프레임 간격 지터 통계 출력
+        pacer = FramePacer(FPS)
+        # 다음 스테이지 경로 미리 생성, 캐시 워밍 (웹) - 프레임 유휴 시간에만
+        pacer.spawn(self.prefetcher.run(pacer.idle))
+        pacer.spawn(self.warmer.run(pacer.idle))
+        # 앰비언트 사운드 블록을 재생 직전에 합성해서 채널 대기열에 공급
+        sound_manager = self.glitch.sound_manager
+        if sound_manager:
+            pacer.spawn(sound_manager.ambient.run(pacer.idle))
+        # KSH_DEBUG_ALLOC=1 이면 프레임당 할당량 출력
+        alloc_tracker = AllocationTracker()
+
         running = True
+        idle_drawn = False
         while running:
             running = self.handle_events()
             self.update()
-            self.draw()
-            self.clock.tick(60)
-
-            # 브라우저에 제어권 반환 (Pygbag 필수)
-            await asyncio.sleep(0)
 
+            # 유휴 화면은 한 번 그린 뒤로는 입력이나 효과가 생길 때까지 그리지 않음
+            idle = self.is_idle()
+            if not (idle and idle_drawn):
+                self.draw()
+                # 대기 시간을 뺀 실제 작업 시간으로 품질 조절
+                governor.record(pacer.elapsed_ms())
+                if self.fixed_render_scale is None:
+                    self._set_render_scale(governor.get('render_scale'))
+            idle_drawn = idle
+            alloc_tracker.frame()
+            if self.memory_reporter:
+                self.memory_reporter.frame()
+
+            # 켜진 효과가 없으면 루프 자체를 늦추고, 입력이 오면 바로 깨어남
+            # (효과가 켜져 있으면 타이머가 제 속도로 돌도록 업데이트는 계속)
+            slow = idle and (self.game_state == "hospital_ending" or self.glitch.is_quiet())
+            pacer.set_fps(IDLE_FPS if slow else FPS)
+            # 마감까지 대기 (브라우저에 제어권 반환, Pygbag 필수)
+            await pacer.wait(pygame.event.peek if slow else None)
+
+        pacer.close()
+        self.warmer.shutdown()
+        self.capture.stop(wait=True)
         pygame.quit()
 
 
+def parse_args(argv):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="Turtle Drawing Game")
+    parser.add_argument("--endless", action="store_true",
+                        help="keep playing generated stages after the final stage")
+    parser.add_argument("--scale", type=float, choices=RENDER_SCALES, default=None,
+                        help="fixed render scale (default: 1.0 on desktop, chosen by the quality governor in the browser)")
+    parser.add_argument("--memory-report", action="store_true",
+                        help="print per-subsystem memory usage at every state change")
+    parser.add_argument("--capture", action="store_true",
+                        help="start recording immediately (F9 toggles recording in game)")
+    parser.add_argument("--capture-every", type=int, default=CAPTURE_EVERY, metavar="N",
+                        help="record every Nth presented frame")
+    parser.add_argument("--capture-format", choices=CAPTURE_FORMATS, default="png",
+                        help="PNG sequence, or animated GIF (needs Pillow)")
+    parser.add_argument("--stress", type=int, metavar="LEVEL", default=None,
+                        help="run the worst-case scene at glitch LEVEL and print frame-time percentiles")
+    parser.add_argument("--stage", type=int, default=STRESS_STAGE, help="stage for --stress")
+    parser.add_argument("--enemies", type=int, default=STRESS_ENEMIES, help="enemy count for --stress")
+    parser.add_argument("--trail", type=int, default=STRESS_TRAIL, help="pre-filled trail points for --stress")
+    parser.add_argument("--frames", type=int, default=STRESS_FRAMES, help="measured frames for --stress")
+    parser.add_argument("--seed", type=int, default=STRESS_SEED, help="random seed for --stress")
+    args, _ = parser.parse_known_args(argv)
+    return args
+
+
 async def main():
-    game = Game()
+    args = parse_args(sys.argv[1:])
+    if args.memory_report:
+        start_memory_tracking()  # 게임 객체보다 먼저 시작해야 모든 할당이 잡힘
+    capture = FrameCapture(args.capture_every, args.capture_format)
+    game = Game(endless=args.endless, render_scale=args.scale, memory_report=args.memory_report,
+                capture=capture)
+    if args.capture:
+        capture.start()
+    if args.stress is not None:
+        run_stress(game, args.stress, args.stage, args.enemies, args.trail, args.frames, args.seed)
+        game.warmer.shutdown()
+        capture.stop(wait=True)
+        pygame.quit()
+        return
     await game.run()
 
 
@@ -0,0 +1,132 @@
+import sys
+import tracemalloc
+from array import array
+import pygame
+import stage
+import stage_generator
+import stage_pack
+from surfaces import surface_bytes, surface_usage, enable_tracking
+
+# 서브시스템별 기본 메모리 예산 (바이트)
+MEMORY_BUDGETS = {
+    'sound': 2 * 1024 * 1024,
+    'surfaces': 16 * 1024 * 1024,
+    'trail': 512 * 1024,
+    'stage': 1024 * 1024,
+    'python_heap': 32 * 1024 * 1024,
+}
+TOP_MODULES = 5  # 표에 같이 출력할 파이썬 힙 상위 모듈 수
+
+
+def start():
+    """측정 시작 (게임 객체를 만들기 전에 호출해야 모든 할당이 잡힘)"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    enable_tracking()
+
+
+def deep_size(obj, seen=None):
+    """컨테이너를 따라가며 파이썬 객체 크기 합산 (서피스/사운드 버퍼는 제외)"""
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (str, bytes, bytearray, array, int, float, pygame.Surface)):
+        return size
+    if isinstance(obj, dict):
+        return size + sum(deep_size(k, seen) + deep_size(v, seen) for k, v in obj.items())
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(deep_size(item, seen) for item in obj)
+    if hasattr(obj, '__dict__'):
+        size += deep_size(vars(obj), seen)
+    for slot in getattr(type(obj), '__slots__', ()):
+        if hasattr(obj, slot):
+            size += deep_size(getattr(obj, slot), seen)
+    return size
+
+
+def _sound_bytes(sound):
+    try:
+        return memoryview(sound).nbytes
+    except TypeError:
+        return len(sound.get_raw())
+
+
+def sound_usage(sound_manager):
+    """효과음 + 앰비언트 스트림 버퍼 크기"""
+    if sound_manager is None:
+        return 0
+    total = sum(_sound_bytes(s) for s in sound_manager.sounds.values())
+    ambient = sound_manager.ambient
+    total += sum(_sound_bytes(s) for s in ambient._ring)
+    total += deep_size(ambient._heartbeat) + deep_size(ambient._block)
+    return total
+
+
+def measure(game):
+    """서브시스템별 메모리 사용량 {이름: 바이트} (surfaces:* 는 소유자별)"""
+    usage = {
+        'sound': sound_usage(game.glitch.sound_manager),
+        'trail': deep_size(game.turtle.trail),
+        # 팩과 스테이지 캐시가 경로를 공유하므로 한 번에 재서 중복 계산 방지
+        'stage': deep_size((stage_pack._pack, stage._stage_cache, stage_generator._path_cache)),
+    }
+
+    surfaces = surface_usage()
+    display = pygame.display.get_surface()
+    if display is not None:
+        surfaces['display'] = surface_bytes(display)
+    usage['surfaces'] = sum(surfaces.values())
+    for owner, size in surfaces.items():
+        usage[f'surfaces:{owner}'] = size
+
+    if tracemalloc.is_tracing():
+        current, peak = tracemalloc.get_traced_memory()
+        usage['python_heap'] = current
+        usage['python_heap_peak'] = peak
+        stats = tracemalloc.take_snapshot().statistics('filename')
+        for stat in stats[:TOP_MODULES]:
+            module = stat.traceback[0].filename.replace('\\', '/').rsplit('/', 1)[-1]
+            usage[f'python_heap:{module}'] = usage.get(f'python_heap:{module}', 0) + stat.size
+    return usage
+
+
+def format_table(usage, title, budgets=MEMORY_BUDGETS):
+    """사용량 표 문자열 (예산이 있는 항목은 사용률 표시)"""
+    lines = [f"== memory: {title} ==", f"{'subsystem':<40}{'KiB':>10}{'budget':>10}"]
+    for name in sorted(usage, key=lambda n: (n.split(':')[0], ':' in n, -usage[n])):
+        budget = budgets.get(name)
+        indent = "  " if ':' in name else ""
+        budget_text = f"{usage[name] * 100 // budget}%" if budget else ""
+        lines.append(f"{indent + name:<40}{usage[name] / 1024:>10.1f}{budget_text:>10}")
+    return "\n".join(lines)
+
+
+def check_budgets(usage, budgets=MEMORY_BUDGETS):
+    """예산 초과 항목 목록 [(이름, 사용량, 예산)]"""
+    return [(name, usage[name], budget) for name, budget in budgets.items()
+            if name in usage and usage[name] > budget]
+
+
+class MemoryReporter:
+    """게임 상태가 바뀔 때마다 메모리 표 출력 (--memory-report)"""
+
+    def __init__(self, game, budgets=MEMORY_BUDGETS):
+        self.game = game
+        self.budgets = budgets
+        self.state = None
+
+    def frame(self):
+        """프레임 끝에서 호출"""
+        state = self.game.game_state
+        if state == self.state:
+            return
+        title = state if self.state is None else f"{self.state} -> {state}"
+        self.state = state
+        usage = measure(self.game)
+        print(format_table(usage, title, self.budgets))
+        for name, size, budget in check_budgets(usage, self.budgets):
+            print(f"[memory] {name} over budget: {size} > {budget} bytes")
@@ -0,0 +1,72 @@
+# 효과 품질 단계 (낮음 -> 높음)
+#   noise_density : TV 정적 노이즈 점 개수 배율
+#   particles     : 핏자국 등 파티클 개수 배율
+#   gradient_step : 그라데이션/비네팅 루프 간격 (1 = 최고 품질)
+#   sprite_detail : 적/해골 디테일 (0 = 글로우, 그림자, 금 생략)
+#   render_scale  : 프레임 래스터화 배율 (compositor.RENDER_SCALES 중 하나, 브라우저에서만 적용)
+#   effect_budget_ms : 부가 글리치 효과 그리기 예산 (None = 제한 없음)
+QUALITY_TIERS = [
+    {'name': 'low', 'noise_density': 0.25, 'particles': 0.3, 'gradient_step': 4, 'sprite_detail': 0,
+     'render_scale': 0.5, 'effect_budget_ms': 1.0},
+    {'name': 'medium', 'noise_density': 0.5, 'particles': 0.6, 'gradient_step': 2, 'sprite_detail': 1,
+     'render_scale': 0.75, 'effect_budget_ms': 2.0},
+    {'name': 'high', 'noise_density': 1.0, 'particles': 1.0, 'gradient_step': 1, 'sprite_detail': 2,
+     'render_scale': 1.0, 'effect_budget_ms': None},
+]
+
+FRAME_BUDGET_MS = 1000 / 60
+DOWNGRADE_RATIO = 1.1   # 평균이 예산의 110% 넘으면 한 단계 낮춤
+UPGRADE_RATIO = 0.6     # 평균이 예산의 60% 미만이면 한 단계 높임
+WINDOW = 30             # 평균 낼 프레임 수
+UPGRADE_WINDOWS = 4     # 올릴 때는 이만큼 연속으로 여유가 있어야 함 (히스테리시스)
+
+
+class QualityGovernor:
+    """측정된 프레임 시간으로 효과 품질 단계를 조절"""
+
+    def __init__(self, budget_ms=FRAME_BUDGET_MS, tier=len(QUALITY_TIERS) - 1):
+        self.budget_ms = budget_ms
+        self.tier = tier
+        self.locked = False  # True 면 자동 조절 안 함
+        self._samples = []
+        self._fast_windows = 0
+
+    def record(self, frame_ms):
+        """프레임 작업 시간(ms) 기록, WINDOW 프레임마다 단계 재평가"""
+        self._samples.append(frame_ms)
+        if len(self._samples) < WINDOW:
+            return
+
+        average = sum(self._samples) / len(self._samples)
+        self._samples.clear()
+        if self.locked:
+            return
+
+        if average > self.budget_ms * DOWNGRADE_RATIO:
+            self._fast_windows = 0
+            if self.tier > 0:
+                self.set_tier(self.tier - 1)
+        elif average < self.budget_ms * UPGRADE_RATIO:
+            self._fast_windows += 1
+            if self._fast_windows >= UPGRADE_WINDOWS and self.tier < len(QUALITY_TIERS) - 1:
+                self._fast_windows = 0
+                self.set_tier(self.tier + 1)
+        else:
+            self._fast_windows = 0
+
+    def set_tier(self, tier, lock=False):
+        """품질 단계 직접 지정 (lock=True 면 자동 조절 중지)"""
+        tier = max(0, min(len(QUALITY_TIERS) - 1, tier))
+        self.locked = lock
+        self.tier = tier
+
+    def get(self, key):
+        """현재 단계의 설정값"""
+        return QUALITY_TIERS[self.tier][key]
+
+    def name(self):
+        return QUALITY_TIERS[self.tier]['name']
+
+
+# 게임 전체에서 공유하는 인스턴스
+governor = QualityGovernor()
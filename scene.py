@@ -0,0 +1,124 @@
+import pygame
+from surfaces import create_surface, blit
+import canvas
+
+_UNSET = object()
+
+
+class SceneLayer:
+    """이름 있는 레이어: 입력(key)이 바뀔 때만 캐시 서피스에 다시 그림
+
+    render(surface, key) 는 레이어 서피스의 로컬 좌표로 그린다. 제너레이터면
+    yield 마다 한 조각으로 보고 캐시 워머가 나눠서 실행할 수 있다.
+    fill 이 None 이면 투명(픽셀별 알파) 서피스, 아니면 그 색으로 채운 불투명 서피스.
+    """
+
+    def __init__(self, name, rect, render, fill=None):
+        self.name = name
+        self.rect = pygame.Rect(rect)
+        self.render = render
+        self.fill = fill
+        self.visible = True
+        self.surface = None
+        self.key = _UNSET
+        self.dirty = True
+
+    def set(self, key):
+        """입력 값 갱신 (이전과 다르면 dirty)"""
+        if key != self.key:
+            self.key = key
+            self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def release(self):
+        """캐시 서피스 해제 (다음 draw 때 다시 만듦)"""
+        self.surface = None
+        self.dirty = True
+
+    def _iter_paint(self, surface, key):
+        surface.fill(self.fill if self.fill is not None else (0, 0, 0, 0))
+        steps = self.render(surface, None if key is _UNSET else key)
+        if steps is not None:
+            yield from steps
+
+    def _paint(self, surface, key):
+        for _ in self._iter_paint(surface, key):
+            pass
+
+    def iter_render(self):
+        """화면에 나오기 전에 미리 렌더링 (캐시 워머용)
+
+        새 서피스에 다 그린 뒤 교체하므로 다른 스레드에서 돌려도 안전하다.
+        그리는 동안 입력이 바뀌었으면 dirty 가 남아서 draw 때 다시 그린다.
+        """
+        if self.surface is not None and not self.dirty:
+            return
+        key = self.key
+        surface = create_surface(self.rect.size, alpha=self.fill is None, owner="scenes")
+        yield
+        yield from self._iter_paint(surface, key)
+        self.surface = surface
+        self.dirty = key != self.key
+
+    def draw_immediate(self, screen):
+        """캐시 없이 화면에 바로 그리기 (캐시 결과와 픽셀 비교용)"""
+        if not self.visible:
+            return
+        target = screen.subsurface(self.rect)
+        if self.fill is not None:
+            target.fill(self.fill)
+        steps = self.render(target, None if self.key is _UNSET else self.key)
+        if steps is not None:
+            for _ in steps:
+                pass
+
+    def draw(self, screen):
+        if not self.visible:
+            return
+        if self.surface is None:
+            self.surface = create_surface(self.rect.size, alpha=self.fill is None, owner="scenes")
+        if self.dirty:
+            self._paint(self.surface, self.key)
+            canvas.changed(self.surface)
+            self.dirty = False
+        blit(screen, self.surface, self.rect.topleft, f"scene:{self.name}")
+
+
+class Scene:
+    """레이어를 순서대로 쌓은 리테인드 모드 화면 (변화가 없으면 레이어 수만큼의 블릿)"""
+
+    def __init__(self):
+        self.layers = {}  # 이름 -> 레이어 (추가 순서 = 그리기 순서)
+
+    def add(self, name, rect, render, fill=None):
+        layer = SceneLayer(name, rect, render, fill)
+        self.layers[name] = layer
+        return layer
+
+    def __getitem__(self, name):
+        return self.layers[name]
+
+    def set(self, name, key):
+        self.layers[name].set(key)
+
+    def show(self, name, visible=True):
+        self.layers[name].visible = visible
+
+    def draw(self, screen):
+        for layer in self.layers.values():
+            layer.draw(screen)
+
+    def draw_immediate(self, screen):
+        for layer in self.layers.values():
+            layer.draw_immediate(screen)
+
+    def invalidate(self):
+        for layer in self.layers.values():
+            layer.invalidate()
+
+    def release(self):
+        """화면을 떠날 때 모든 레이어 서피스 해제"""
+        for layer in self.layers.values():
+            layer.release()
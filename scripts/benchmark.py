@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Headless benchmark suite.
+
+Drives the game without a window through a scripted session and checks the
+results against budgets. Exits with status 1 if any check fails.
+This script is called by `make bench`.
+
+    python3 scripts/benchmark.py                      # all benchmarks
+    python3 scripts/benchmark.py memory --budget trail=65536
+    python3 scripts/benchmark.py accuracy spatial
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import memory_report  # noqa: E402
+
+SEED = 1234
+ACCURACY_STAGE = 39                   # 선분 50개짜리 경로
+ACCURACY_POINTS = (500, 1000, 2000, 5000)
+ACCURACY_BUDGET_MS = 20.0             # numpy 로 5000점 궤적 채점 한 번
+SPATIAL_COUNTS = (50, 100, 200, 500)
+SPATIAL_AREA = 2000                   # 개체 하나당 면적 (px^2, 개체 수에 맞춰 영역을 넓혀 밀도 고정)
+SPATIAL_REPEAT = 20
+SPATIAL_SCALING_LIMIT = 2.0           # 500개의 개체당 시간이 50개일 때의 이 배수를 넘으면 실패
+
+
+def _frames(game, count, reporter=None):
+    for _ in range(count):
+        game.handle_events()
+        game.update()
+        game.draw()
+        if reporter:
+            reporter.frame()
+
+
+def bench_memory(args):
+    """상태를 한 바퀴 돌며 서브시스템별 메모리를 재고 예산 확인"""
+    memory_report.start()
+    from main import Game
+
+    random.seed(SEED)
+    budgets = dict(memory_report.MEMORY_BUDGETS)
+    budgets.update(args.budget)
+
+    game = Game(render_scale=1.0)
+    reporter = memory_report.MemoryReporter(game, budgets)
+    _frames(game, 5, reporter)
+
+    # 글리치가 쌓인 상태로 여러 스테이지를 플레이 (궤적, 스테이지 캐시, 효과 서피스)
+    game.game_state = "playing"
+    for stage_num in range(1, args.stages + 1):
+        game.current_stage = stage_num
+        game._load_stage()
+        game.game_state = "playing"
+        if stage_num % 3 == 0:
+            game.glitch.add_glitch()
+        for frame in range(args.frames):
+            game.turtle.move(1 if frame % 40 < 20 else 0, 1 if frame % 40 >= 20 else 0)
+            _frames(game, 1, reporter)
+            game.game_state = "playing"
+    for state in ("gameover", "win", "title"):
+        game.game_state = state
+        _frames(game, 10, reporter)
+
+    usage = memory_report.measure(game)
+    print(memory_report.format_table(usage, "final", budgets))
+    failures = memory_report.check_budgets(usage, budgets)
+    for name, size, budget in failures:
+        print(f"FAIL memory {name}: {size} bytes > budget {budget}")
+    return not failures
+
+
+def _noisy_trail(path, count, rng):
+    """경로를 따라 흔들리며 그린 궤적 count 점"""
+    points = []
+    while len(points) < count:
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            steps = max(1, int(((x2 - x1) ** 2 + (y2 - y1) ** 2) ** 0.5 / 3))
+            for i in range(steps):
+                points.append((x1 + (x2 - x1) * i / steps + rng.uniform(-10, 10),
+                               y1 + (y2 - y1) * i / steps + rng.uniform(-10, 10)))
+    return points[:count]
+
+
+def _slice_times(steps):
+    """제너레이터를 끝까지 돌리며 조각별 시간 (ms) 목록"""
+    times = []
+    while True:
+        start = time.perf_counter()
+        try:
+            next(steps)
+        except StopIteration:
+            times.append((time.perf_counter() - start) * 1000)
+            return times
+        times.append((time.perf_counter() - start) * 1000)
+
+
+def bench_accuracy(args):
+    """궤적 점 수를 늘려가며 정확도 채점 시간 측정 (numpy 한 번 / 순수 파이썬 조각)"""
+    import accuracy
+    from stage import Stage
+
+    tracemalloc.stop()  # memory 벤치마크가 켠 추적은 시간 측정을 몇 배 느리게 함
+    path = Stage(ACCURACY_STAGE).path
+    rng = random.Random(SEED)
+    print(f"stage {ACCURACY_STAGE}: {len(path) - 1} segments, "
+          f"fallback scores <= {accuracy.FALLBACK_POINTS} points in slices of {accuracy.SLICE_POINTS}")
+    print(f"{'points':>8}{'numpy ms':>11}{'python ms':>11}{'max slice':>11}  score")
+    ok = True
+    for count in ACCURACY_POINTS:
+        trail = _noisy_trail(path, count, rng)
+        numpy_ms = None
+        if accuracy.np is not None:
+            start = time.perf_counter()
+            accuracy.score_trail(trail, path, ACCURACY_STAGE)
+            numpy_ms = (time.perf_counter() - start) * 1000
+        slices = _slice_times(accuracy.iter_score_trail(trail, path, ACCURACY_STAGE, use_numpy=False))
+        score = accuracy.score_trail(trail, path, ACCURACY_STAGE)
+        shown = "-" if numpy_ms is None else f"{numpy_ms:.2f}"
+        print(f"{count:>8}{shown:>11}{sum(slices):>11.2f}{max(slices):>11.2f}  {score.format()}")
+        if count == ACCURACY_POINTS[-1] and numpy_ms is not None and numpy_ms > ACCURACY_BUDGET_MS:
+            print(f"FAIL accuracy {count} points: {numpy_ms:.2f} ms > budget {ACCURACY_BUDGET_MS} ms")
+            ok = False
+    if accuracy.np is None:
+        print("numpy is not installed: only the pure Python fallback was measured")
+    return ok
+
+
+class _Entity:
+    __slots__ = ("x", "y")
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+def _best_ms(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def bench_spatial(args):
+    """개체 수를 늘려가며 공간 해시 재구성 + 모든 개체의 이웃 질의 시간 측정 (전수 비교와 대조)"""
+    from spatial_hash import SpatialHash
+    from effects import ENEMY_SEPARATION
+
+    rng = random.Random(SEED)
+    grid = SpatialHash()
+    radius_sq = ENEMY_SEPARATION * ENEMY_SEPARATION
+
+    def hashed(entities):
+        grid.rebuild(entities)
+        return sum(len(grid.query(e.x, e.y, ENEMY_SEPARATION, exclude=e)) for e in entities)
+
+    def naive(entities):
+        return sum(1 for e in entities for o in entities
+                   if o is not e and (e.x - o.x) ** 2 + (e.y - o.y) ** 2 <= radius_sq)
+
+    print(f"separation radius {ENEMY_SEPARATION}px, {SPATIAL_AREA} px^2 per entity")
+    print(f"{'entities':>9}{'hash ms':>10}{'us/entity':>11}{'naive ms':>10}{'neighbors':>11}")
+    per_entity = {}
+    for count in SPATIAL_COUNTS:
+        side = (count * SPATIAL_AREA) ** 0.5
+        entities = [_Entity(rng.uniform(0, side), rng.uniform(0, side)) for _ in range(count)]
+        neighbors = hashed(entities)
+        if neighbors != naive(entities):
+            print(f"FAIL spatial {count}: hash found {neighbors} neighbor pairs, naive {naive(entities)}")
+            return False
+        hash_ms = _best_ms(lambda: hashed(entities), SPATIAL_REPEAT)
+        naive_ms = _best_ms(lambda: naive(entities), max(1, SPATIAL_REPEAT // 4))
+        per_entity[count] = hash_ms * 1000 / count
+        print(f"{count:>9}{hash_ms:>10.3f}{per_entity[count]:>11.2f}{naive_ms:>10.3f}{neighbors / count:>11.2f}")
+
+    ratio = per_entity[SPATIAL_COUNTS[-1]] / per_entity[SPATIAL_COUNTS[0]]
+    print(f"per-entity cost {SPATIAL_COUNTS[-1]} vs {SPATIAL_COUNTS[0]}: x{ratio:.2f} (linear = x1)")
+    if ratio > SPATIAL_SCALING_LIMIT:
+        print(f"FAIL spatial scaling x{ratio:.2f} > x{SPATIAL_SCALING_LIMIT}")
+        return False
+    return True
+
+
+BENCHMARKS = {
+    "memory": bench_memory,
+    "accuracy": bench_accuracy,
+    "spatial": bench_spatial,
+}
+
+
+def parse_budget(text):
+    name, _, value = text.partition("=")
+    if name not in memory_report.MEMORY_BUDGETS or not value.isdigit():
+        raise argparse.ArgumentTypeError(f"expected NAME=BYTES with NAME in {sorted(memory_report.MEMORY_BUDGETS)}")
+    return name, int(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run headless benchmarks")
+    parser.add_argument("names", nargs="*", metavar="NAME",
+                        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--budget", type=parse_budget, action="append", default=[],
+                        help="override a memory budget, e.g. trail=65536")
+    parser.add_argument("--stages", type=int, default=12, help="stages to play in the memory run")
+    parser.add_argument("--frames", type=int, default=120, help="frames per stage in the memory run")
+    args = parser.parse_args()
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    ok = True
+    for name in args.names or list(BENCHMARKS):
+        print(f"==> {name}")
+        ok = BENCHMARKS[name](args) and ok
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Compile stages.json into the binary stage geometry pack (stages.bin).
+This script is called by `make stages` / `make build`.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from stage_pack import CATALOG_PATH, PACK_PATH, build_pack  # noqa: E402
+
+
+def main():
+    catalog_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(CATALOG_PATH)
+    pack_path = Path(sys.argv[2]) if len(sys.argv) > 2 else Path(PACK_PATH)
+
+    if not catalog_path.exists():
+        print(f"Error: {catalog_path} not found")
+        sys.exit(1)
+
+    try:
+        size = build_pack(catalog_path, pack_path)
+    except (ValueError, KeyError, TypeError) as e:
+        print(f"Error: invalid stage catalog: {e}")
+        sys.exit(1)
+
+    print(f"Successfully built {pack_path} ({size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
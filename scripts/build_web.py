@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Web build pipeline for pygbag.
+
+Stages only the runtime modules (found by following imports from main.py)
+into a clean directory, strips docstrings/comments, pre-bakes the stage pack
+and sound bank, runs pygbag, copies the result to docs/, applies the
+iOS Safari patch and reports the bundle size against a budget.
+This script is called by `make build`.
+"""
+
+import argparse
+import ast
+import io
+import os
+import shutil
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from patch_index import patch_index_html  # noqa: E402
+
+# pygbag 은 디렉터리 이름으로 apk 이름을 정하므로 스테이징 디렉터리 이름을 고정
+APP_NAME = "ksh"
+STAGE_DIR = ROOT / "build" / "stage" / APP_NAME
+DOCS_DIR = ROOT / "docs"
+ENTRY_MODULE = "main"
+
+# 압축된 번들(ksh.apk) 크기 예산
+BUDGET_BYTES = 256 * 1024
+
+
+def find_runtime_modules(entry=ENTRY_MODULE):
+    """entry 모듈에서 import 를 따라가며 프로젝트 루트의 모듈 목록 수집"""
+    found = []
+    pending = [entry]
+    while pending:
+        name = pending.pop()
+        path = ROOT / f"{name}.py"
+        if name in found or not path.exists():
+            continue
+        found.append(name)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                pending.extend(alias.name.split(".")[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+                pending.append(node.module.split(".")[0])
+    return sorted(found)
+
+
+def minify_source(source, filename):
+    """docstring/주석 제거 후 다시 소스로 (문법 검사 포함)"""
+    tree = ast.parse(source, filename)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Module, ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
+            body = node.body
+            if (body and isinstance(body[0], ast.Expr) and
+                    isinstance(body[0].value, ast.Constant) and isinstance(body[0].value.value, str)):
+                body[0] = ast.Pass() if len(body) == 1 else None
+                node.body = [stmt for stmt in body if stmt is not None]
+    minified = ast.unparse(tree) + "\n"
+    compile(minified, filename, "exec")
+    return minified
+
+
+def stage_modules(modules, minify=True):
+    """런타임 모듈을 스테이징 디렉터리에 복사 (크기 반환)"""
+    sizes = {}
+    for name in modules:
+        source = (ROOT / f"{name}.py").read_text(encoding="utf-8")
+        if minify:
+            source = minify_source(source, f"{name}.py")
+        target = STAGE_DIR / f"{name}.py"
+        target.write_text(source, encoding="utf-8")
+        sizes[target.name] = target.stat().st_size
+    return sizes
+
+
+def bake_caches():
+    """스테이지 팩, 사운드 뱅크를 스테이징 디렉터리에 미리 생성"""
+    from stage_pack import build_pack
+    from sound_bank import build_bank
+    import pygame
+    from effects import SoundManager, SAMPLE_RATE
+
+    sizes = {}
+    sizes["stages.bin"] = build_pack(pack_path=STAGE_DIR / "stages.bin")
+    pygame.init()  # 합성에는 믹서가 필요 없지만 effects 가 pygame 을 씀
+    sizes["sounds.bin"] = build_bank(SoundManager.synthesize(), SAMPLE_RATE, STAGE_DIR / "sounds.bin")
+    return sizes
+
+
+def run_pygbag():
+    """pygbag 빌드 후 결과를 docs/ 로 복사"""
+    subprocess.run([sys.executable, "-m", "pygbag", "--build", str(STAGE_DIR)], check=True)
+    web_dir = STAGE_DIR / "build" / "web"
+    DOCS_DIR.mkdir(exist_ok=True)
+    for item in web_dir.iterdir():
+        shutil.copy2(item, DOCS_DIR / item.name)
+    return DOCS_DIR / f"{APP_NAME}.apk"
+
+
+def compressed_sizes(files):
+    """apk 가 없을 때 쓰는 압축 크기 추정 (zip deflate)"""
+    sizes = {}
+    for path in files:
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as z:
+            z.write(path, path.name)
+        sizes[path.name] = buffer.getbuffer().nbytes
+    return sizes
+
+
+def report(raw_sizes, apk_path, budget):
+    """번들 크기 내역 출력, 예산을 넘으면 False"""
+    if apk_path is not None and apk_path.exists():
+        with zipfile.ZipFile(apk_path) as z:
+            packed = {}
+            for info in z.infolist():
+                packed[os.path.basename(info.filename)] = info.compress_size
+        total = apk_path.stat().st_size
+        source = apk_path.name
+    else:
+        packed = compressed_sizes(STAGE_DIR / name for name in raw_sizes)
+        total = sum(packed.values())
+        source = "estimated (deflate)"
+
+    print(f"{'file':<24}{'raw':>10}{'packed':>10}")
+    for name in sorted(raw_sizes, key=lambda n: packed.get(n, 0), reverse=True):
+        print(f"{name:<24}{raw_sizes[name]:>10}{packed.get(name, 0):>10}")
+    extra = sorted(set(packed) - set(raw_sizes))
+    for name in extra:
+        print(f"{name:<24}{'-':>10}{packed[name]:>10}")
+    print(f"{'total (' + source + ')':<34}{total:>10}  budget {budget}")
+
+    if total > budget:
+        print(f"Error: bundle is {total - budget} bytes over budget")
+        return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the pygbag web bundle")
+    parser.add_argument("--budget", type=int, default=BUDGET_BYTES,
+                        help="maximum bundle size in bytes")
+    parser.add_argument("--no-pygbag", action="store_true",
+                        help="only stage, bake and report (skip pygbag, docs/ and patching)")
+    parser.add_argument("--no-minify", action="store_true",
+                        help="copy module sources unchanged")
+    args = parser.parse_args()
+
+    print(f"==> Staging runtime modules into {STAGE_DIR}...")
+    if STAGE_DIR.exists():
+        shutil.rmtree(STAGE_DIR)
+    STAGE_DIR.mkdir(parents=True)
+    modules = find_runtime_modules()
+    raw_sizes = stage_modules(modules, minify=not args.no_minify)
+
+    print("==> Baking caches (stage pack, sound bank)...")
+    raw_sizes.update(bake_caches())
+
+    apk_path = None
+    if not args.no_pygbag:
+        print("==> Building with pygbag...")
+        apk_path = run_pygbag()
+        print("==> Applying patches...")
+        if not patch_index_html(DOCS_DIR / "index.html"):
+            sys.exit(1)
+
+    print("==> Bundle size:")
+    if not report(raw_sizes, apk_path, args.budget):
+        sys.exit(1)
+    print("==> Build complete!")
+
+
+if __name__ == "__main__":
+    main()
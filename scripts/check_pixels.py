@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Pixel-equivalence harness for cached versus immediate renderers.
+
+Renders every cached drawing path (stage layers, retained scenes, text cache,
+skull glow surfaces, darkness overlay) next to its immediate-mode equivalent
+with the same RNG seed, compares the two with pygame.surfarray and reports the
+share of differing pixels. Diff images (cached | immediate | differences in
+red) are written for every case that differs. Exits with status 1 if any case
+differs by more than --max-diff percent.
+This script is called by `make pixels`.
+"""
+
+import argparse
+import os
+import random
+import sys
+from contextlib import contextmanager
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("check_pixels.py needs numpy for pygame.surfarray (pip install numpy)")
+
+import pygame  # noqa: E402
+from utils import WHITE, BLACK, RED, SCREEN_WIDTH, SCREEN_HEIGHT  # noqa: E402
+from surfaces import create_surface, render_text  # noqa: E402
+from stage import Stage  # noqa: E402
+
+SEED = 1234
+DEFAULT_STAGES = (1, 5, 9, 23, 39, 51)
+DIFF_DIR = ROOT / "build" / "pixel_diff"
+
+
+def render(background, draw):
+    """고정 시드로 빈 프레임에 그린 결과"""
+    surface = create_surface((SCREEN_WIDTH, SCREEN_HEIGHT), owner="pixels")
+    surface.fill(background)
+    random.seed(SEED)
+    draw(surface)
+    return surface
+
+
+@contextmanager
+def immediate_scene(scene):
+    """장면의 draw 를 캐시 없는 draw_immediate 로 잠시 바꿈"""
+    scene.draw = scene.draw_immediate
+    try:
+        yield
+    finally:
+        del scene.draw
+
+
+def stage_cases(stage_nums):
+    for stage_num in stage_nums:
+        stage = Stage(stage_num)
+        yield f"stage_{stage_num}", WHITE, stage.draw, stage.draw_immediate
+
+
+def scene_cases(game):
+    screens = [("title", 0), ("hospital_ending", 30), ("hospital_ending", 100),
+               ("hospital_ending", 150), ("hospital_ending", 200), ("gameover", 0), ("win", 0)]
+    draw_fns = {"title": game._draw_title, "hospital_ending": game._draw_hospital_ending,
+                "gameover": game._draw_gameover, "win": game._draw_win}
+
+    for state, timer in screens:
+        def cached(surface, state=state, timer=timer):
+            game.game_state, game.hospital_timer, game.screen = state, timer, surface
+            draw_fns[state]()
+
+        def immediate(surface, state=state, timer=timer):
+            game.game_state, game.hospital_timer, game.screen = state, timer, surface
+            with immediate_scene(game.scenes[state]):
+                draw_fns[state]()
+
+        name = f"scene_{state}" + (f"_{timer}" if state == "hospital_ending" else "")
+        yield name, WHITE, cached, immediate
+
+
+def text_cases(game):
+    lines = [(game.large_font, "GAME OVER", (180, 0, 0)), (game.font, "Stage: 12", BLACK),
+             (game.font, "OFF PATH!", RED), (game.small_font, "Press any key to continue", (128, 128, 128))]
+
+    def cached(surface):
+        for i, (font, text, color) in enumerate(lines):
+            surface.blit(render_text(font, text, color), (20, 20 + i * 80))
+
+    def immediate(surface):
+        for i, (font, text, color) in enumerate(lines):
+            surface.blit(font.render(text, True, color), (20, 20 + i * 80))
+
+    yield "text_cache", WHITE, cached, immediate
+
+
+def effect_cases(game):
+    components = {c.name: c for c in game.glitch.scheduler.components}
+    skull = components['skull']
+    darkness = components['darkness']
+
+    for is_sans in (False, True):
+        def cached(surface, is_sans=is_sans):
+            skull.pos, skull.scale, skull.is_sans = (300, 150), 1.2, is_sans
+            skull.draw(surface)  # 재사용 글로우 서피스로 그림
+
+        def immediate(surface, is_sans=is_sans):
+            skull.pos, skull.scale, skull.is_sans = (300, 150), 1.2, is_sans
+            skull._glow_surfaces = {}  # 매번 새 글로우 서피스
+            skull.draw(surface)
+
+        yield "effect_sans" if is_sans else "effect_skull", BLACK, cached, immediate
+
+    def dark_cached(surface):
+        game.glitch.darkness_level = 130
+        darkness.draw(surface)
+
+    def dark_immediate(surface):
+        game.glitch.darkness_level = 130
+        darkness._overlay = None
+        darkness.draw(surface)
+
+    yield "effect_darkness", WHITE, dark_cached, dark_immediate
+
+
+def compare(cached, immediate, threshold):
+    """(다른 픽셀 비율 %, 마스크)"""
+    a = pygame.surfarray.array3d(cached).astype(np.int16)
+    b = pygame.surfarray.array3d(immediate).astype(np.int16)
+    mask = np.any(np.abs(a - b) > threshold, axis=2)
+    return mask.mean() * 100, mask
+
+
+def write_diff(path, cached, immediate, mask):
+    """캐시 | 즉시 | 차이 (어둡게 한 캐시 위에 다른 픽셀을 빨간색) 이미지 저장"""
+    a = pygame.surfarray.array3d(cached)
+    b = pygame.surfarray.array3d(immediate)
+    diff = (a // 4).astype(np.uint8)
+    diff[mask] = (255, 0, 0)
+    pygame.image.save(pygame.surfarray.make_surface(np.concatenate([a, b, diff], axis=0)), str(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cached and immediate renderers pixel by pixel")
+    parser.add_argument("--stages", type=int, nargs="*", default=list(DEFAULT_STAGES),
+                        help="stages whose path layer is compared")
+    parser.add_argument("--threshold", type=int, default=0,
+                        help="per-channel difference that still counts as equal")
+    parser.add_argument("--max-diff", type=float, default=0.0,
+                        help="fail if a case differs in more than this percent of pixels")
+    parser.add_argument("--out", type=Path, default=DIFF_DIR, help="directory for diff images")
+    parser.add_argument("--all", action="store_true", help="write images for identical cases too")
+    args = parser.parse_args()
+
+    from main import Game
+    game = Game(render_scale=1.0)
+    cases = [*stage_cases(args.stages), *scene_cases(game), *text_cases(game), *effect_cases(game)]
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    print(f"{'case':<28}{'diff %':>10}  result")
+    failed = 0
+    for name, background, cached_fn, immediate_fn in cases:
+        render(background, cached_fn)  # 캐시 채우기 (두 번째 그리기가 캐시 경로)
+        cached = render(background, cached_fn)
+        immediate = render(background, immediate_fn)
+        percent, mask = compare(cached, immediate, args.threshold)
+
+        ok = percent <= args.max_diff
+        failed += not ok
+        if percent > 0 or args.all:
+            write_diff(args.out / f"{name}.png", cached, immediate, mask)
+        print(f"{name:<28}{percent:>10.4f}  {'ok' if ok else 'DIFF'}")
+
+    print(f"\n{len(cases)} cases, {failed} over {args.max_diff}% (diff images in {args.out})")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Offline stage validator.
+
+Drives a headless TurtlePlayer with a greedy path-following bot through every
+catalog stage and a sample of generated (endless) stages, using the same
+8-direction movement, PATH_TOLERANCE and GOAL_SIZE rules as the game.
+Stages run in parallel with multiprocessing. Reports completion frames,
+minimum clearance to the tolerance edge, trail accuracy (path coverage),
+early goal hits and failures.
+This script is called by `make validate`.
+"""
+
+import argparse
+import math
+import multiprocessing
+import os
+import random
+import sys
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils import FINAL_STAGE, PATH_TOLERANCE, TURTLE_SPEED, has_four, distance  # noqa: E402
+from turtle_player import TurtlePlayer  # noqa: E402
+from stage import Stage  # noqa: E402
+from stage_pack import get_geometry  # noqa: E402
+from accuracy import score_trail  # noqa: E402
+
+DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+WAYPOINT_SPACING = TURTLE_SPEED * 2
+LOOKAHEAD = 6            # 현재 목표보다 이만큼 앞 웨이포인트까지 가까우면 건너뜀
+STALL_FRAMES = 120       # 이 프레임 동안 진행이 없으면 막힌 것으로 판단
+EARLY_PROGRESS = 0.9     # 경로를 이만큼 따라가기 전에 골에 닿으면 early goal
+
+
+def resample(path, spacing=WAYPOINT_SPACING):
+    """경로를 일정 간격 웨이포인트로 변환"""
+    points = [path[0]]
+    for (x1, y1), (x2, y2) in zip(path, path[1:]):
+        steps = max(1, int(distance((x1, y1), (x2, y2)) // spacing))
+        for i in range(1, steps + 1):
+            t = i / steps
+            points.append((x1 + (x2 - x1) * t, y1 + (y2 - y1) * t))
+    return points
+
+
+def path_distance(stage, pos):
+    """경로까지의 최단 거리"""
+    px, py = pos
+    best = math.inf
+    for x1, y1, dx, dy, len_sq in stage.segments:
+        t = 0 if len_sq == 0 else max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / len_sq))
+        best = min(best, math.hypot(px - (x1 + t * dx), py - (y1 + t * dy)))
+    return best
+
+
+def _try_move(turtle, dx, dy):
+    """실제 이동 코드로 다음 위치 계산 후 되돌림"""
+    x, y = turtle.x, turtle.y
+    turtle.move(dx, dy)
+    pos = turtle.get_position()
+    turtle.x, turtle.y = x, y
+    turtle.trail.pop()
+    return pos
+
+
+def run_bot(stage_num):
+    """한 스테이지를 봇으로 플레이하고 결과 행 반환"""
+    stage = Stage(stage_num)
+    kind = "catalog" if get_geometry(stage_num) is not None else "generated"
+    row = {"stage": stage_num, "kind": kind, "frames": None, "clearance": None,
+           "accuracy": None, "early_goal": None, "result": "ok"}
+    if stage.is_special_stage():
+        row["kind"] = "special"
+        row["result"] = "skipped"
+        return row
+
+    waypoints = resample(stage.get_path())
+    turtle = TurtlePlayer(*stage.get_start_pos())
+    target = 1
+    best_target, stalled = target, 0
+    clearance = PATH_TOLERANCE - path_distance(stage, turtle.get_position())
+    max_frames = int(3 * len(waypoints) * WAYPOINT_SPACING / TURTLE_SPEED) + 300
+
+    for frame in range(1, max_frames + 1):
+        # 목표 웨이포인트에 가장 가까워지는, 경로를 벗어나지 않는 방향 선택
+        goal = waypoints[target]
+        best = None
+        for dx, dy in DIRECTIONS:
+            pos = _try_move(turtle, dx, dy)
+            score = distance(pos, goal) + (0 if stage.check_on_path(pos) else 1000)
+            if best is None or score < best[0]:
+                best = (score, dx, dy)
+        turtle.move(best[1], best[2])
+        pos = turtle.get_position()
+
+        on_path = stage.check_on_path(pos)
+        clearance = min(clearance, PATH_TOLERANCE - path_distance(stage, pos))
+
+        # 목표 갱신 (가까우면 다음, 앞쪽 웨이포인트가 더 가까우면 건너뜀)
+        while target < len(waypoints) - 1 and distance(pos, waypoints[target]) <= WAYPOINT_SPACING:
+            target += 1
+        ahead = range(target + 1, min(target + LOOKAHEAD, len(waypoints)))
+        for i in ahead:
+            if distance(pos, waypoints[i]) < distance(pos, waypoints[target]):
+                target = i
+
+        if stage.check_goal_reached(pos):
+            progress = target / (len(waypoints) - 1)
+            if progress < EARLY_PROGRESS:
+                if row["early_goal"] is None:
+                    row["early_goal"] = frame  # 게임에서는 여기서 바로 클리어됨
+            elif on_path:
+                row["frames"] = frame
+                row["accuracy"] = f"{score_trail(turtle.trail, stage.path).coverage * 100:.0f}%"
+                break
+            else:
+                row["result"] = "goal off path"
+                break
+
+        if not on_path:
+            row["result"] = "left path"
+            break
+
+        if target > best_target:
+            best_target, stalled = target, 0
+        else:
+            stalled += 1
+            if stalled >= STALL_FRAMES:
+                row["result"] = f"stuck at {target}/{len(waypoints) - 1}"
+                break
+    else:
+        row["result"] = "timeout"
+
+    row["clearance"] = round(clearance, 1)
+    return row
+
+
+def format_row(row):
+    def show(value):
+        return "-" if value is None else str(value)
+    return (f"{row['stage']:>6}  {row['kind']:<10}{show(row['frames']):>8}{show(row['clearance']):>11}"
+            f"{show(row['accuracy']):>10}{show(row['early_goal']):>12}  {row['result']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate that every stage is playable")
+    parser.add_argument("--generated", type=int, default=20,
+                        help="number of random generated (endless) stages to check")
+    parser.add_argument("--seed", type=int, default=None, help="seed for picking generated stages")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--strict", action="store_true", help="also fail on early goal hits")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    generated = set()
+    while len(generated) < args.generated:
+        n = rng.randint(FINAL_STAGE + 1, 100000)
+        if not has_four(n):
+            generated.add(n)
+    stages = list(range(1, FINAL_STAGE + 1)) + sorted(generated)
+
+    with multiprocessing.Pool(args.jobs) as pool:
+        rows = pool.map(run_bot, stages)
+
+    print(f"{'stage':>6}  {'kind':<10}{'frames':>8}{'clearance':>11}{'accuracy':>10}{'early goal':>12}  result")
+    for row in rows:
+        print(format_row(row))
+
+    failures = [r for r in rows if r["result"] not in ("ok", "skipped")]
+    early = [r for r in rows if r["early_goal"] is not None]
+    played = [r for r in rows if r["result"] != "skipped"]
+    print(f"\n{len(played)} stages played, {len(failures)} failed, {len(early)} with early goal hits")
+    if failures or (args.strict and early):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+import os
+import struct
+from array import array
+
+# 미리 합성해 둔 효과음 (웹 빌드에서 시작 시 합성 시간을 줄이기 위해 사용)
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BANK_PATH = os.path.join(BASE_DIR, "sounds.bin")
+
+# 뱅크 포맷: 헤더 + (이름 길이, 이름, 샘플 수, int8 모노 샘플) 반복
+# 효과음이 노이즈 위주라 8비트로 저장해도 차이가 거의 없고 번들 크기는 절반이 됨
+BANK_MAGIC = b"KSHA"
+BANK_VERSION = 1
+_HEADER = struct.Struct("<4sHHI")  # magic, version, count, sample rate
+_ENTRY = struct.Struct("<BI")      # name length, sample count
+
+
+def compile_bank(sounds, sample_rate):
+    """{이름: 16비트 모노 샘플} 을 바이너리 뱅크로 변환"""
+    chunks = [_HEADER.pack(BANK_MAGIC, BANK_VERSION, len(sounds), sample_rate)]
+    for name, samples in sounds.items():
+        data = array("b", (max(-128, min(127, round(v / 256))) for v in samples))
+        encoded = name.encode("ascii")
+        chunks.append(_ENTRY.pack(len(encoded), len(data)))
+        chunks.append(encoded)
+        chunks.append(data.tobytes())
+    return b"".join(chunks)
+
+
+def read_bank(data):
+    """바이너리 뱅크를 ({이름: array('h')}, sample_rate) 로 변환"""
+    magic, version, count, sample_rate = _HEADER.unpack_from(data, 0)
+    if magic != BANK_MAGIC or version != BANK_VERSION:
+        raise ValueError("Invalid sound bank")
+
+    sounds = {}
+    offset = _HEADER.size
+    for _ in range(count):
+        name_len, n_samples = _ENTRY.unpack_from(data, offset)
+        offset += _ENTRY.size
+        name = data[offset:offset + name_len].decode("ascii")
+        offset += name_len
+        raw = array("b")
+        raw.frombytes(data[offset:offset + n_samples])
+        offset += n_samples
+        sounds[name] = array("h", (v << 8 for v in raw))
+    return sounds, sample_rate
+
+
+def build_bank(sounds, sample_rate, bank_path=BANK_PATH):
+    """뱅크 파일 쓰기 (바이트 수 반환)"""
+    data = compile_bank(sounds, sample_rate)
+    with open(bank_path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+def load_bank(sample_rate, bank_path=BANK_PATH):
+    """뱅크 파일 로드 (없거나 샘플레이트가 다르면 None)"""
+    if not os.path.exists(bank_path):
+        return None
+    with open(bank_path, "rb") as f:
+        sounds, bank_rate = read_bank(f.read())
+    return sounds if bank_rate == sample_rate else None
@@ -0,0 +1,62 @@
+import math
+
+# 격자 칸 크기 (px): 주로 쓰는 질의 반경(적 간격 50px) 근처로 잡으면
+# 질의 한 번이 2x2~3x3 칸만 본다
+CELL_SIZE = 64
+
+
+class SpatialHash:
+    """균일 격자 공간 해시 (적 간격 유지, 근접 사운드, 이후 투사체/아이템 충돌용)
+
+    매 프레임 rebuild() 로 O(n) 에 다시 채우고, query() 는 반경이 걸치는 칸만
+    확인하므로 n 개 모두의 이웃 찾기가 O(n^2) 이 아니라 O(n x 이웃 수) 이다.
+    항목은 x, y 속성이 있어야 하고, 질의는 현재 x, y 로 거리를 잰다.
+    """
+
+    def __init__(self, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.count = 0
+        self._cells = {}   # (칸 x, 칸 y) -> 항목 리스트
+        self._spare = []   # 비운 리스트 (다음 rebuild 때 재사용해서 할당을 줄임)
+
+    def clear(self):
+        for bucket in self._cells.values():
+            bucket.clear()
+            self._spare.append(bucket)
+        self._cells.clear()
+        self.count = 0
+
+    def insert(self, item):
+        key = (math.floor(item.x / self.cell_size), math.floor(item.y / self.cell_size))
+        bucket = self._cells.get(key)
+        if bucket is None:
+            bucket = self._spare.pop() if self._spare else []
+            self._cells[key] = bucket
+        bucket.append(item)
+        self.count += 1
+
+    def rebuild(self, items):
+        """모든 항목을 현재 위치로 다시 넣음 (매 프레임, 항목이 움직인 뒤)"""
+        self.clear()
+        for item in items:
+            self.insert(item)
+
+    def query(self, x, y, radius, exclude=None):
+        """(x, y) 에서 radius 이내 항목 목록 (exclude 는 자기 자신 제외용)"""
+        size = self.cell_size
+        radius_sq = radius * radius
+        min_cx, max_cx = math.floor((x - radius) / size), math.floor((x + radius) / size)
+        min_cy, max_cy = math.floor((y - radius) / size), math.floor((y + radius) / size)
+        cells = self._cells
+        found = []
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    continue
+                for item in bucket:
+                    dx = item.x - x
+                    dy = item.y - y
+                    if dx * dx + dy * dy <= radius_sq and item is not exclude:
+                        found.append(item)
+        return found
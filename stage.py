@@ -1,291 +1,72 @@
 import pygame
 import math
+from collections import OrderedDict
 from utils import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, GRAY, GREEN, GOAL_SIZE,
-    PATH_TOLERANCE, has_four, point_to_line_distance
+    GRAY, GREEN, GOAL_SIZE, PATH_TOLERANCE, has_four
 )
-from effects import generate_help_path
+from stage_pack import StageGeometry, get_geometry
+import stage_generator
+from surfaces import create_surface, blit
 
+# 메모리에 유지할 스테이지 수 (레이어 서피스 포함)
+STAGE_CACHE_SIZE = 4
+_stage_cache = OrderedDict()
 
-class Stage:
-    """스테이지 관리 클래스"""
-
-    def __init__(self, stage_num):
-        self.stage_num = stage_num
-        self.path = self._generate_path()
-        self.start_pos = self.path[0] if self.path else (100, 300)
-        self.goal_pos = self.path[-1] if self.path else (700, 300)
-
-    def _generate_path(self):
-        """스테이지 번호에 따른 경로 생성"""
-        # 특수 스테이지는 빈 경로 반환 (자동 그리기)
-        if self.is_special_stage():
-            return []
-
-        # 스테이지별 경로 데이터
-        paths = self._get_stage_paths()
-
-        if self.stage_num <= len(paths):
-            return paths[self.stage_num - 1]
-        else:
-            # 45번 이후는 랜덤 생성
-            return self._generate_random_path()
-
-    def _get_stage_paths(self):
-        """44개 스테이지의 경로 데이터"""
-        cx, cy = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
-
-        paths = [
-            # Stage 1: 직선 (가로)
-            [(100, 300), (700, 300)],
-
-            # Stage 2: 직선 (세로)
-            [(400, 100), (400, 500)],
-
-            # Stage 3: L자
-            [(100, 150), (100, 450), (400, 450)],
-
-            # Stage 4: 특수 스테이지 (빈 경로)
-            [],
-
-            # Stage 5: 역 L자
-            [(700, 150), (700, 450), (400, 450)],
-
-            # Stage 6: ㄱ자
-            [(100, 150), (500, 150), (500, 450)],
-
-            # Stage 7: Z자
-            [(150, 150), (650, 150), (150, 450), (650, 450)],
-
-            # Stage 8: 사각형
-            [(200, 150), (600, 150), (600, 450), (200, 450), (200, 150)],
-
-            # Stage 9: 삼각형
-            [(400, 100), (650, 450), (150, 450), (400, 100)],
-
-            # Stage 10: 대각선
-            [(100, 100), (700, 500)],
-
-            # Stage 11: W자
-            [(100, 150), (250, 450), (400, 200), (550, 450), (700, 150)],
-
-            # Stage 12: M자
-            [(100, 450), (100, 150), (400, 350), (700, 150), (700, 450)],
-
-            # Stage 13: N자
-            [(150, 450), (150, 150), (650, 450), (650, 150)],
-
-            # Stage 14: 특수 스테이지
-            [],
-
-            # Stage 15: 번개
-            [(200, 100), (400, 250), (250, 300), (500, 500)],
-
-            # Stage 16: 계단 (상승)
-            [(100, 500), (200, 500), (200, 400), (300, 400), (300, 300),
-             (400, 300), (400, 200), (500, 200), (500, 100), (600, 100)],
-
-            # Stage 17: 계단 (하강)
-            [(100, 100), (200, 100), (200, 200), (300, 200), (300, 300),
-             (400, 300), (400, 400), (500, 400), (500, 500), (600, 500)],
-
-            # Stage 18: 지그재그 (수평)
-            [(100, 200), (200, 400), (300, 200), (400, 400), (500, 200), (600, 400), (700, 200)],
-
-            # Stage 19: 지그재그 (수직)
-            [(200, 100), (400, 200), (200, 300), (400, 400), (200, 500)],
-
-            # Stage 20: 오각형
-            self._regular_polygon(cx, cy, 5, 180),
-
-            # Stage 21: 육각형
-            self._regular_polygon(cx, cy, 6, 150),
 
-            # Stage 22: 팔각형
-            self._regular_polygon(cx, cy, 8, 150),
+def get_stage(stage_num):
+    """스테이지 캐시 조회 (없으면 생성, 오래된 것부터 제거)"""
+    stage = _stage_cache.get(stage_num)
+    if stage is not None:
+        _stage_cache.move_to_end(stage_num)
+        return stage
 
-            # Stage 23: 별 (5각)
-            self._star(cx, cy, 5, 180, 80),
+    stage = Stage(stage_num)
+    _stage_cache[stage_num] = stage
+    while len(_stage_cache) > STAGE_CACHE_SIZE:
+        _stage_cache.popitem(last=False)
+    return stage
 
-            # Stage 24: 특수 스테이지
-            [],
 
-            # Stage 25: 별 (6각)
-            self._star(cx, cy, 6, 150, 70),
+def clear_stage_cache():
+    """스테이지 캐시 비우기"""
+    _stage_cache.clear()
 
-            # Stage 26: 나선형 (안으로)
-            self._spiral(cx, cy, 200, 50, clockwise=True),
 
-            # Stage 27: 나선형 (밖으로)
-            self._spiral(cx, cy, 50, 200, clockwise=False),
-
-            # Stage 28: 하트
-            self._heart(cx, cy, 2.5),
-
-            # Stage 29: 물결
-            self._wave(100, 300, 600, 4, 100),
-
-            # Stage 30: 이중 사각형
-            [(200, 150), (600, 150), (600, 450), (200, 450), (200, 150),
-             (300, 220), (500, 220), (500, 380), (300, 380), (300, 220)],
-
-            # Stage 31: 십자가
-            [(400, 100), (400, 250), (250, 250), (250, 350), (400, 350),
-             (400, 500), (500, 500), (500, 350), (650, 350), (650, 250),
-             (500, 250), (500, 100), (400, 100)],
-
-            # Stage 32: 화살표
-            [(100, 300), (500, 300), (500, 200), (700, 300), (500, 400), (500, 300)],
-
-            # Stage 33: 집 모양
-            [(200, 450), (200, 250), (400, 100), (600, 250), (600, 450),
-             (200, 450), (200, 250), (600, 250)],
-
-            # Stage 34: 특수 스테이지
-            [],
-
-            # Stage 35: 미로 1
-            [(100, 100), (100, 500), (300, 500), (300, 200), (200, 200),
-             (200, 400), (400, 400), (400, 100), (600, 100), (600, 500), (700, 500)],
-
-            # Stage 36: 미로 2
-            [(100, 300), (200, 300), (200, 100), (400, 100), (400, 300),
-             (300, 300), (300, 500), (500, 500), (500, 200), (700, 200)],
-
-            # Stage 37: 복잡한 지그재그
-            [(100, 150)] + [(100 + i * 60, 150 if i % 2 == 0 else 450) for i in range(11)],
-
-            # Stage 38: 8자
-            self._figure_eight(cx, cy, 120),
-
-            # Stage 39: 무한대
-            self._infinity(cx, cy, 150),
-
-            # Stage 40: 톱니바퀴
-            self._gear(cx, cy, 180, 120, 12),
-
-            # Stage 41: 다이아몬드
-            [(400, 80), (650, 300), (400, 520), (150, 300), (400, 80)],
-
-            # Stage 42: 나비 모양
-            [(400, 300), (200, 100), (200, 500), (400, 300),
-             (600, 500), (600, 100), (400, 300)],
+class Stage:
+    """스테이지 관리 클래스"""
 
-            # Stage 43: 복잡한 별
-            self._star(cx, cy, 8, 200, 100),
+    def __init__(self, stage_num):
+        self.stage_num = stage_num
+        self.geometry = self._load_geometry()
+        self.path = list(self.geometry.path)
+        self.bounds = self.geometry.bounds
+        self.segment_lengths = self.geometry.segment_lengths
+        self.start_pos = self.path[0] if self.path else (100, 300)
+        self.goal_pos = self.path[-1] if self.path else (700, 300)
 
-            # Stage 44: 특수 스테이지
-            [],
+        # 경로 판정용 선분 테이블 (x1, y1, dx, dy, 길이 제곱)
+        self.segments = [
+            (x1, y1, x2 - x1, y2 - y1, (x2 - x1) ** 2 + (y2 - y1) ** 2)
+            for (x1, y1), (x2, y2) in zip(self.path, self.path[1:])
         ]
 
-        return paths
-
-    def _regular_polygon(self, cx, cy, sides, radius):
-        """정다각형 경로 생성"""
-        points = []
-        for i in range(sides + 1):
-            angle = 2 * math.pi * i / sides - math.pi / 2
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            points.append((x, y))
-        return points
-
-    def _star(self, cx, cy, points, outer_r, inner_r):
-        """별 모양 경로 생성"""
-        path = []
-        for i in range(points * 2 + 1):
-            angle = math.pi * i / points - math.pi / 2
-            r = outer_r if i % 2 == 0 else inner_r
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            path.append((x, y))
-        return path
-
-    def _spiral(self, cx, cy, start_r, end_r, clockwise=True):
-        """나선형 경로 생성"""
-        path = []
-        steps = 40
-        for i in range(steps + 1):
-            t = i / steps
-            r = start_r + (end_r - start_r) * t
-            angle = 4 * math.pi * t * (1 if clockwise else -1) - math.pi / 2
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            path.append((x, y))
-        return path
-
-    def _heart(self, cx, cy, scale):
-        """하트 모양 경로 생성"""
-        path = []
-        for i in range(50):
-            t = 2 * math.pi * i / 49
-            x = cx + scale * 16 * math.sin(t) ** 3
-            y = cy - scale * (13 * math.cos(t) - 5 * math.cos(2 * t)
-                              - 2 * math.cos(3 * t) - math.cos(4 * t))
-            path.append((x, y))
-        path.append(path[0])
-        return path
-
-    def _wave(self, start_x, center_y, width, periods, amplitude):
-        """물결 모양 경로 생성"""
-        path = []
-        steps = 40
-        for i in range(steps + 1):
-            t = i / steps
-            x = start_x + width * t
-            y = center_y + amplitude * math.sin(2 * math.pi * periods * t)
-            path.append((x, y))
-        return path
-
-    def _figure_eight(self, cx, cy, size):
-        """8자 모양 경로 생성"""
-        path = []
-        for i in range(50):
-            t = 2 * math.pi * i / 49
-            x = cx + size * math.sin(t)
-            y = cy + size * math.sin(t) * math.cos(t)
-            path.append((x, y))
-        path.append(path[0])
-        return path
-
-    def _infinity(self, cx, cy, size):
-        """무한대 모양 경로 생성"""
-        path = []
-        for i in range(50):
-            t = 2 * math.pi * i / 49
-            scale = 2 / (3 - math.cos(2 * t))
-            x = cx + size * scale * math.cos(t)
-            y = cy + size * scale * math.sin(2 * t) / 2
-            path.append((x, y))
-        path.append(path[0])
-        return path
-
-    def _gear(self, cx, cy, outer_r, inner_r, teeth):
-        """톱니바퀴 모양 경로 생성"""
-        path = []
-        for i in range(teeth * 4 + 1):
-            angle = 2 * math.pi * i / (teeth * 4) - math.pi / 2
-            if (i // 2) % 2 == 0:
-                r = outer_r
-            else:
-                r = inner_r
-            x = cx + r * math.cos(angle)
-            y = cy + r * math.sin(angle)
-            path.append((x, y))
-        return path
+        # 점선/골/시작점 레이어 (첫 draw 때 렌더링)
+        self._layer = None
+        self._layer_pos = (0, 0)
 
-    def _generate_random_path(self):
-        """랜덤 경로 생성 (45번 이후 스테이지)"""
-        import random
-        random.seed(self.stage_num)  # 일관된 랜덤
+    def _load_geometry(self):
+        """스테이지 번호에 따른 지오메트리 로드"""
+        # 특수 스테이지는 빈 경로 (자동 그리기)
+        if self.is_special_stage():
+            return StageGeometry(self.stage_num, [], special=True)
 
-        path = [(100, 300)]
-        for _ in range(random.randint(5, 10)):
-            x = random.randint(100, 700)
-            y = random.randint(100, 500)
-            path.append((x, y))
+        # 미리 컴파일된 스테이지 팩에서 조회
+        geometry = get_geometry(self.stage_num)
+        if geometry is not None:
+            return geometry
 
-        return path
+        # 45번 이후는 절차적 생성 (엔드리스)
+        return StageGeometry(self.stage_num, stage_generator.get_path(self.stage_num))
 
     def is_special_stage(self):
         """4가 포함된 특수 스테이지인지 확인"""
@@ -308,9 +89,22 @@ class Stage:
         if len(self.path) < 2:
             return True
 
-        for i in range(len(self.path) - 1):
-            dist = point_to_line_distance(pos, self.path[i], self.path[i + 1])
-            if dist <= PATH_TOLERANCE:
+        # 바운딩 박스 밖이면 선분 검사 생략
+        min_x, min_y, max_x, max_y = self.bounds
+        if (pos[0] < min_x - PATH_TOLERANCE or pos[0] > max_x + PATH_TOLERANCE or
+                pos[1] < min_y - PATH_TOLERANCE or pos[1] > max_y + PATH_TOLERANCE):
+            return False
+
+        px, py = pos
+        tolerance_sq = PATH_TOLERANCE * PATH_TOLERANCE
+        for x1, y1, dx, dy, len_sq in self.segments:
+            if len_sq == 0:
+                t = 0
+            else:
+                t = max(0, min(1, ((px - x1) * dx + (py - y1) * dy) / len_sq))
+            ex = px - (x1 + t * dx)
+            ey = py - (y1 + t * dy)
+            if ex * ex + ey * ey <= tolerance_sq:
                 return True
         return False
 
@@ -324,19 +118,56 @@ class Stage:
         return (dx * dx + dy * dy) <= (GOAL_SIZE * GOAL_SIZE)
 
     def draw(self, screen):
-        """스테이지 경로 그리기 (점선)"""
+        """스테이지 경로 그리기 (캐시된 레이어 블릿)"""
         if len(self.path) < 2:
             return
 
+        if self._layer is None:
+            self._render_layer()
+        blit(screen, self._layer, self._layer_pos, "stage_layer")
+
+    def _render_layer(self):
+        """경로 바운딩 박스 크기의 레이어에 점선/골/시작점 미리 그리기"""
+        for _ in self.iter_render_layer():
+            pass
+
+    def iter_render_layer(self):
+        """레이어 렌더링을 조각으로 나눈 이터레이터 (캐시 워머용)
+
+        다 그린 뒤에 교체하므로 다른 스레드에서 돌려도 그리다 만 레이어가 보이지 않는다.
+        """
+        if self._layer is not None or len(self.path) < 2:
+            return
+        margin = GOAL_SIZE
+        min_x, min_y, max_x, max_y = self.bounds
+        ox = int(math.floor(min_x)) - margin
+        oy = int(math.floor(min_y)) - margin
+        width = int(math.ceil(max_x)) - ox + margin
+        height = int(math.ceil(max_y)) - oy + margin
+
+        layer = create_surface((width, height), alpha=True, owner="stage_layer")
+        yield
+        self.draw_immediate(layer, (-ox, -oy))
+        self._layer_pos = (ox, oy)
+        self._layer = layer
+
+    def has_layer(self):
+        """레이어가 준비됐는지 (그릴 경로가 없으면 항상 True)"""
+        return self._layer is not None or len(self.path) < 2
+
+    def draw_immediate(self, screen, offset=(0, 0)):
+        """스테이지 경로 직접 그리기 (점선)"""
+        ox, oy = offset
+
         # 점선 그리기
         for i in range(len(self.path) - 1):
-            self._draw_dashed_line(screen, self.path[i], self.path[i + 1], GRAY, 3, 10)
+            self._draw_dashed_line(screen, self.path[i], self.path[i + 1], GRAY, 3, 10, offset)
 
         # 골 박스 그리기
         if self.goal_pos:
             goal_rect = pygame.Rect(
-                self.goal_pos[0] - GOAL_SIZE // 2,
-                self.goal_pos[1] - GOAL_SIZE // 2,
+                self.goal_pos[0] + ox - GOAL_SIZE // 2,
+                self.goal_pos[1] + oy - GOAL_SIZE // 2,
                 GOAL_SIZE, GOAL_SIZE
             )
             pygame.draw.rect(screen, GREEN, goal_rect)
@@ -344,10 +175,11 @@ class Stage:
 
         # 시작점 표시
         if self.start_pos:
-            pygame.draw.circle(screen, (100, 100, 255), (int(self.start_pos[0]), int(self.start_pos[1])), 10)
+            pygame.draw.circle(screen, (100, 100, 255),
+                               (int(self.start_pos[0]) + ox, int(self.start_pos[1]) + oy), 10)
 
-    def _draw_dashed_line(self, screen, start, end, color, width, dash_length):
-        """점선 그리기"""
+    def _draw_dashed_line(self, screen, start, end, color, width, dash_length, offset=(0, 0)):
+        """점선 그리기 (offset: 레이어 좌표 보정)"""
         dx = end[0] - start[0]
         dy = end[1] - start[1]
         distance = math.sqrt(dx * dx + dy * dy)
@@ -362,6 +194,6 @@ class Stage:
         for i in range(0, dashes, 2):
             t1 = i / dashes
             t2 = min((i + 1) / dashes, 1.0)
-            p1 = (start[0] + dx * t1, start[1] + dy * t1)
-            p2 = (start[0] + dx * t2, start[1] + dy * t2)
+            p1 = (start[0] + dx * t1 + offset[0], start[1] + dy * t1 + offset[1])
+            p2 = (start[0] + dx * t2 + offset[0], start[1] + dy * t2 + offset[1])
             pygame.draw.line(screen, color, p1, p2, width)
@@ -0,0 +1,199 @@
+import asyncio
+import math
+import random
+from collections import OrderedDict
+import pygame
+from utils import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, PATH_TOLERANCE, GOAL_SIZE,
+    has_four, distance, segment_distance
+)
+
+# 경로가 들어갈 수 있는 영역 (상단 HUD 아래, 화면 가장자리 제외)
+PLAY_AREA = pygame.Rect(60, 130, SCREEN_WIDTH - 120, SCREEN_HEIGHT - 170)
+
+# 경로가 지나가면 안 되는 영역 (D-pad, 액션 버튼)
+FORBIDDEN_AREAS = [
+    pygame.Rect(20, SCREEN_HEIGHT - 260, 240, 240).inflate(PATH_TOLERANCE * 2, PATH_TOLERANCE * 2),
+    pygame.Rect(SCREEN_WIDTH - 120, SCREEN_HEIGHT - 120, 100, 100).inflate(PATH_TOLERANCE * 2, PATH_TOLERANCE * 2),
+]
+
+# 인접하지 않은 선분끼리 유지할 최소 간격 (경로 판정이 겹치지 않도록)
+MIN_CLEARANCE = PATH_TOLERANCE * 2 + 10
+MAX_ATTEMPTS = 200
+SEGMENT_TRIES = 12
+
+# 미리 생성해 둘 스테이지 수 / 생성된 경로 캐시 크기
+PREFETCH_STAGES = 3
+PATH_CACHE_SIZE = 16
+
+_path_cache = OrderedDict()
+
+
+def difficulty(stage_num, first_stage=45):
+    """스테이지 번호에 따른 생성 파라미터 (선분 수, 길이, 최대 회전각)"""
+    level = max(0, stage_num - first_stage)
+    min_len = max(160 - level * 3, 70)
+    return {
+        'segments': min(5 + level // 4, 11),
+        'min_len': min_len,
+        'max_len': min_len + 100,
+        'max_turn': math.radians(min(90 + level * 3, 150)),
+    }
+
+
+def _segment_allowed(path, end):
+    """path 끝에서 end까지의 새 선분이 제약을 만족하는지 확인"""
+    start = path[-1]
+    if not PLAY_AREA.collidepoint(end):
+        return False
+
+    for area in FORBIDDEN_AREAS:
+        if area.collidepoint(end) or area.clipline(start, end):
+            return False
+
+    # 바로 앞 선분을 제외한 이전 선분들과 간격 유지
+    for i in range(len(path) - 2):
+        if segment_distance(path[i], path[i + 1], start, end) < MIN_CLEARANCE:
+            return False
+    return True
+
+
+def _start_allowed(start):
+    return not any(area.collidepoint(start) for area in FORBIDDEN_AREAS)
+
+
+def _path_allowed(path):
+    """완성된 경로 전체가 생성 제약을 만족하는지 확인"""
+    if not PLAY_AREA.collidepoint(path[0]) or not _start_allowed(path[0]):
+        return False
+    return all(_segment_allowed(path[:i], path[i]) for i in range(1, len(path)))
+
+
+def _try_build(rng, params):
+    """경로 한 번 생성 시도 (실패 시 None)"""
+    start = (rng.randint(PLAY_AREA.left, PLAY_AREA.right - 1),
+             rng.randint(PLAY_AREA.top, PLAY_AREA.bottom - 1))
+    if not _start_allowed(start):
+        return None
+
+    path = [start]
+    heading = rng.uniform(0, 2 * math.pi)
+
+    for _ in range(params['segments']):
+        for _ in range(SEGMENT_TRIES):
+            turn = rng.uniform(-params['max_turn'], params['max_turn']) if len(path) > 1 else 0
+            length = rng.uniform(params['min_len'], params['max_len'])
+            angle = heading + turn
+            end = (int(round(path[-1][0] + length * math.cos(angle))),
+                   int(round(path[-1][1] + length * math.sin(angle))))
+            if _segment_allowed(path, end):
+                path.append(end)
+                heading = angle
+                break
+        else:
+            return None
+
+    # 시작점이 골 판정 범위에 걸리지 않도록
+    if distance(path[0], path[-1]) < GOAL_SIZE * 3:
+        return None
+    return path
+
+
+def _fallback_path(stage_num):
+    """생성 실패 시 사용할 단순 지그재그 경로 (D-pad/버튼 위쪽 띠 안에서만)"""
+    top = PLAY_AREA.top + 20
+    bottom = min(area.top for area in FORBIDDEN_AREAS) - 20
+    step = (PLAY_AREA.width - 40) // 6
+    path = [(PLAY_AREA.left + 20 + i * step, top if (i + stage_num) % 2 == 0 else bottom)
+            for i in range(7)]
+    assert _path_allowed(path), path
+    return path
+
+
+def iter_generate(stage_num):
+    """경로 생성 제너레이터 (시도마다 yield, 결과는 StopIteration.value)"""
+    # 전역 random 을 건드리지 않도록 스테이지 전용 RNG 사용
+    rng = random.Random(stage_num)
+    params = difficulty(stage_num)
+
+    for _ in range(MAX_ATTEMPTS):
+        path = _try_build(rng, params)
+        if path:
+            return path
+        yield
+    return _fallback_path(stage_num)
+
+
+def generate_path(stage_num):
+    """경로를 즉시 생성"""
+    gen = iter_generate(stage_num)
+    while True:
+        try:
+            next(gen)
+        except StopIteration as e:
+            return e.value
+
+
+def _store(stage_num, path):
+    _path_cache[stage_num] = path
+    _path_cache.move_to_end(stage_num)
+    while len(_path_cache) > PATH_CACHE_SIZE:
+        _path_cache.popitem(last=False)
+
+
+def get_path(stage_num):
+    """생성된 경로 반환 (미리 생성된 게 없으면 즉시 생성)"""
+    path = _path_cache.get(stage_num)
+    if path is None:
+        path = generate_path(stage_num)
+        _store(stage_num, path)
+    return list(path)
+
+
+def is_cached(stage_num):
+    """이미 생성된 스테이지인지 확인"""
+    return stage_num in _path_cache
+
+
+async def _yield():
+    await asyncio.sleep(0)
+
+
+class StagePrefetcher:
+    """다음 스테이지 경로를 async 루프에서 미리 생성"""
+
+    def __init__(self, needs_generation, horizon=PREFETCH_STAGES):
+        self.needs_generation = needs_generation  # stage_num -> bool
+        self.horizon = horizon
+        self.current_stage = 1
+
+    def set_current(self, stage_num):
+        """현재 스테이지 갱신 (이후 horizon 개 스테이지를 준비)"""
+        self.current_stage = stage_num
+
+    def _next_missing(self):
+        for n in range(self.current_stage + 1, self.current_stage + self.horizon + 1):
+            if not has_four(n) and self.needs_generation(n) and not is_cached(n):
+                return n
+        return None
+
+    async def run(self, idle=None):
+        """백그라운드 태스크 본체 (시도 한 번마다 제어권 반환)
+
+        idle 은 조각 사이에 기다릴 코루틴 함수 (FramePacer.idle 이면 프레임 유휴 시간에만 실행)
+        """
+        idle = idle or _yield
+        while True:
+            stage_num = self._next_missing()
+            if stage_num is None:
+                await asyncio.sleep(0.1)
+                continue
+
+            gen = iter_generate(stage_num)
+            while True:
+                try:
+                    next(gen)
+                except StopIteration as e:
+                    _store(stage_num, e.value)
+                    break
+                await idle()
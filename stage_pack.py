@@ -0,0 +1,286 @@
+import json
+import math
+import os
+import struct
+import sys
+from array import array
+
+# 스테이지 데이터 파일
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CATALOG_PATH = os.path.join(BASE_DIR, "stages.json")
+PACK_PATH = os.path.join(BASE_DIR, "stages.bin")
+
+# 팩 포맷: 헤더 + 엔트리 테이블 + float32 정점/세그먼트 길이 배열
+PACK_MAGIC = b"KSHS"
+PACK_VERSION = 1
+_HEADER = struct.Struct("<4sHHII")   # magic, version, count, vertex floats, length floats
+_ENTRY = struct.Struct("<HHIII5f")   # stage, flags, vert_offset, vert_count, seg_offset, bounds(4), length
+FLAG_SPECIAL = 1
+
+
+def regular_polygon(cx, cy, sides, radius):
+    """정다각형 경로 생성"""
+    points = []
+    for i in range(sides + 1):
+        angle = 2 * math.pi * i / sides - math.pi / 2
+        x = cx + radius * math.cos(angle)
+        y = cy + radius * math.sin(angle)
+        points.append((x, y))
+    return points
+
+
+def star(cx, cy, points, outer_r, inner_r):
+    """별 모양 경로 생성"""
+    path = []
+    for i in range(points * 2 + 1):
+        angle = math.pi * i / points - math.pi / 2
+        r = outer_r if i % 2 == 0 else inner_r
+        x = cx + r * math.cos(angle)
+        y = cy + r * math.sin(angle)
+        path.append((x, y))
+    return path
+
+
+def spiral(cx, cy, start_r, end_r, clockwise=True):
+    """나선형 경로 생성"""
+    path = []
+    steps = 40
+    for i in range(steps + 1):
+        t = i / steps
+        r = start_r + (end_r - start_r) * t
+        angle = 4 * math.pi * t * (1 if clockwise else -1) - math.pi / 2
+        x = cx + r * math.cos(angle)
+        y = cy + r * math.sin(angle)
+        path.append((x, y))
+    return path
+
+
+def heart(cx, cy, scale):
+    """하트 모양 경로 생성"""
+    path = []
+    for i in range(50):
+        t = 2 * math.pi * i / 49
+        x = cx + scale * 16 * math.sin(t) ** 3
+        y = cy - scale * (13 * math.cos(t) - 5 * math.cos(2 * t)
+                          - 2 * math.cos(3 * t) - math.cos(4 * t))
+        path.append((x, y))
+    path.append(path[0])
+    return path
+
+
+def wave(start_x, center_y, width, periods, amplitude):
+    """물결 모양 경로 생성"""
+    path = []
+    steps = 40
+    for i in range(steps + 1):
+        t = i / steps
+        x = start_x + width * t
+        y = center_y + amplitude * math.sin(2 * math.pi * periods * t)
+        path.append((x, y))
+    return path
+
+
+def figure_eight(cx, cy, size):
+    """8자 모양 경로 생성"""
+    path = []
+    for i in range(50):
+        t = 2 * math.pi * i / 49
+        x = cx + size * math.sin(t)
+        y = cy + size * math.sin(t) * math.cos(t)
+        path.append((x, y))
+    path.append(path[0])
+    return path
+
+
+def infinity(cx, cy, size):
+    """무한대 모양 경로 생성"""
+    path = []
+    for i in range(50):
+        t = 2 * math.pi * i / 49
+        scale = 2 / (3 - math.cos(2 * t))
+        x = cx + size * scale * math.cos(t)
+        y = cy + size * scale * math.sin(2 * t) / 2
+        path.append((x, y))
+    path.append(path[0])
+    return path
+
+
+def gear(cx, cy, outer_r, inner_r, teeth):
+    """톱니바퀴 모양 경로 생성"""
+    path = []
+    for i in range(teeth * 4 + 1):
+        angle = 2 * math.pi * i / (teeth * 4) - math.pi / 2
+        if (i // 2) % 2 == 0:
+            r = outer_r
+        else:
+            r = inner_r
+        x = cx + r * math.cos(angle)
+        y = cy + r * math.sin(angle)
+        path.append((x, y))
+    return path
+
+
+# stages.json 의 "shape" 이름 -> 생성 함수
+SHAPES = {
+    "regular_polygon": regular_polygon,
+    "star": star,
+    "spiral": spiral,
+    "heart": heart,
+    "wave": wave,
+    "figure_eight": figure_eight,
+    "infinity": infinity,
+    "gear": gear,
+}
+
+
+class StageGeometry:
+    """미리 계산된 스테이지 지오메트리 (불변)"""
+
+    __slots__ = ("stage_num", "special", "path", "bounds", "segment_lengths", "length")
+
+    def __init__(self, stage_num, path, special=False, bounds=None,
+                 segment_lengths=None, length=None):
+        self.stage_num = stage_num
+        self.special = special
+        self.path = tuple(path)
+
+        if bounds is None:
+            bounds = _path_bounds(self.path)
+        if segment_lengths is None:
+            segment_lengths = tuple(
+                math.hypot(x2 - x1, y2 - y1)
+                for (x1, y1), (x2, y2) in zip(self.path, self.path[1:])
+            )
+        self.bounds = bounds
+        self.segment_lengths = tuple(segment_lengths)
+        self.length = sum(self.segment_lengths) if length is None else length
+
+
+def _path_bounds(path):
+    """경로의 (min_x, min_y, max_x, max_y)"""
+    if not path:
+        return (0.0, 0.0, 0.0, 0.0)
+    xs = [p[0] for p in path]
+    ys = [p[1] for p in path]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def build_path(entry):
+    """카탈로그 엔트리 하나를 정점 리스트로 변환"""
+    if entry.get("special"):
+        return []
+    if "shape" in entry:
+        shape = entry["shape"]
+        if shape not in SHAPES:
+            raise ValueError(f"Stage {entry['stage']}: unknown shape '{shape}'")
+        return SHAPES[shape](**entry.get("params", {}))
+    return [tuple(p) for p in entry.get("points", [])]
+
+
+def load_catalog(path=CATALOG_PATH):
+    """stages.json 읽어서 StageGeometry 리스트 생성"""
+    with open(path, encoding="utf-8") as f:
+        catalog = json.load(f)
+
+    geometries = []
+    for entry in catalog["stages"]:
+        geometries.append(StageGeometry(entry["stage"], build_path(entry),
+                                        special=bool(entry.get("special"))))
+    return geometries
+
+
+def compile_pack(geometries):
+    """StageGeometry 리스트를 바이너리 팩으로 변환"""
+    entries = []
+    vertices = array("f")
+    lengths = array("f")
+
+    for geo in geometries:
+        vert_offset = len(vertices) // 2
+        seg_offset = len(lengths)
+        for x, y in geo.path:
+            vertices.append(x)
+            vertices.append(y)
+        lengths.extend(geo.segment_lengths)
+        flags = FLAG_SPECIAL if geo.special else 0
+        entries.append(_ENTRY.pack(geo.stage_num, flags, vert_offset, len(geo.path),
+                                   seg_offset, *geo.bounds, geo.length))
+
+    if sys.byteorder == "big":
+        vertices.byteswap()
+        lengths.byteswap()
+
+    header = _HEADER.pack(PACK_MAGIC, PACK_VERSION, len(entries), len(vertices), len(lengths))
+    return header + b"".join(entries) + vertices.tobytes() + lengths.tobytes()
+
+
+def read_pack(data):
+    """바이너리 팩을 {stage_num: StageGeometry} 로 변환"""
+    magic, version, count, n_vertex, n_length = _HEADER.unpack_from(data, 0)
+    if magic != PACK_MAGIC or version != PACK_VERSION:
+        raise ValueError("Invalid stage pack")
+
+    offset = _HEADER.size
+    raw_entries = [_ENTRY.unpack_from(data, offset + i * _ENTRY.size) for i in range(count)]
+    offset += count * _ENTRY.size
+
+    vertices = array("f")
+    vertices.frombytes(data[offset:offset + n_vertex * 4])
+    offset += n_vertex * 4
+    lengths = array("f")
+    lengths.frombytes(data[offset:offset + n_length * 4])
+    if sys.byteorder == "big":
+        vertices.byteswap()
+        lengths.byteswap()
+
+    geometries = {}
+    for stage_num, flags, vert_offset, vert_count, seg_offset, *rest in raw_entries:
+        bounds, length = tuple(rest[:4]), rest[4]
+        path = [(vertices[2 * i], vertices[2 * i + 1])
+                for i in range(vert_offset, vert_offset + vert_count)]
+        seg_count = max(vert_count - 1, 0)
+        geometries[stage_num] = StageGeometry(
+            stage_num, path, special=bool(flags & FLAG_SPECIAL), bounds=bounds,
+            segment_lengths=lengths[seg_offset:seg_offset + seg_count], length=length)
+    return geometries
+
+
+def build_pack(catalog_path=CATALOG_PATH, pack_path=PACK_PATH):
+    """stages.json -> stages.bin 빌드"""
+    data = compile_pack(load_catalog(catalog_path))
+    with open(pack_path, "wb") as f:
+        f.write(data)
+    return len(data)
+
+
+_pack = None
+
+
+def load_pack():
+    """스테이지 팩 로드 (프로세스당 한 번)"""
+    global _pack
+    if _pack is not None:
+        return _pack
+
+    # 팩이 없거나 카탈로그보다 오래됐으면 카탈로그에서 바로 컴파일
+    stale = (not os.path.exists(PACK_PATH) or
+             (os.path.exists(CATALOG_PATH) and
+              os.path.getmtime(PACK_PATH) < os.path.getmtime(CATALOG_PATH)))
+    if stale:
+        data = compile_pack(load_catalog())
+    else:
+        with open(PACK_PATH, "rb") as f:
+            data = f.read()
+
+    _pack = read_pack(data)
+    return _pack
+
+
+def get_geometry(stage_num):
+    """스테이지 번호의 지오메트리 반환 (카탈로그에 없으면 None)"""
+    return load_pack().get(stage_num)
+
+
+def stage_count():
+    """카탈로그에 정의된 스테이지 수"""
+    return len(load_pack())
@@ -0,0 +1,101 @@
+import random
+import time
+from utils import SCREEN_WIDTH, SCREEN_HEIGHT, MAX_LIVES
+from quality import governor, QUALITY_TIERS
+from frame_pacer import percentile
+
+# --stress 기본값 (같은 옵션이면 항상 같은 작업량)
+STRESS_STAGE = 39
+STRESS_ENEMIES = 8
+STRESS_TRAIL = 5000
+STRESS_FRAMES = 600
+STRESS_SEED = 1234
+WARMUP_FRAMES = 30       # 캐시 생성 등 첫 프레임들은 통계에서 제외
+HOLD_FRAMES = (15, 45)   # 스크립트 입력이 한 방향을 유지하는 프레임 수 범위
+PERCENTILES = (50, 90, 95, 99)
+DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+class ScriptedInput:
+    """시드 고정 방향 입력 (일정 프레임마다 8방향 중 하나로 바꿈)"""
+
+    def __init__(self, seed):
+        self.rng = random.Random(seed)
+        self.direction = (0, 0)
+        self.hold = 0
+
+    def next(self):
+        if self.hold <= 0:
+            self.direction = self.rng.choice(DIRECTIONS)
+            self.hold = self.rng.randint(*HOLD_FRAMES)
+        self.hold -= 1
+        return self.direction
+
+
+def prepare_stress(game, level, stage_num=STRESS_STAGE, enemies=STRESS_ENEMIES,
+                   trail=STRESS_TRAIL, seed=STRESS_SEED):
+    """최악의 장면 구성: 스테이지, 글리치 레벨 고정, 모든 효과, 적, 긴 궤적"""
+    random.seed(seed)
+    governor.set_tier(len(QUALITY_TIERS) - 1, lock=True)  # 최고 품질 고정 (작업량이 바뀌지 않도록)
+
+    game.current_stage = stage_num
+    game.lives = MAX_LIVES
+    game._load_stage()
+    game.game_state = "playing"
+    game.glitch.force_level(level)
+
+    # 긴 궤적 미리 채우기 (스크립트 입력과 같은 방식, 다른 시드)
+    walk = ScriptedInput(seed + 1)
+    for _ in range(trail):
+        game.turtle.move(*walk.next())
+    fill_enemies(game, enemies)
+
+
+def fill_enemies(game, count):
+    """적 수가 count 보다 적으면 모자란 만큼 스폰"""
+    x, y = game.turtle.get_position()
+    while len(game.glitch.enemies) < count:
+        game.glitch.spawn_enemy(SCREEN_WIDTH, SCREEN_HEIGHT, x, y)
+
+
+def _row(name, samples):
+    ordered = sorted(samples)
+    mean = sum(ordered) / len(ordered)
+    cells = [mean] + [percentile(ordered, p) for p in PERCENTILES] + [ordered[-1]]
+    return f"{name:<8}" + "".join(f"{value:>8.2f}" for value in cells)
+
+
+def run_stress(game, level, stage_num=STRESS_STAGE, enemies=STRESS_ENEMIES, trail=STRESS_TRAIL,
+               frames=STRESS_FRAMES, seed=STRESS_SEED):
+    """스크립트 입력으로 frames 프레임을 최대한 빨리 돌리고 프레임 시간 백분위 출력"""
+    prepare_stress(game, level, stage_num, enemies, trail, seed)
+    script = ScriptedInput(seed)
+    times = {'frame': [], 'update': [], 'draw': []}
+
+    for frame in range(WARMUP_FRAMES + frames):
+        start = time.perf_counter()
+        if not game.handle_events():
+            break
+
+        # 실제 입력 경로 대신 터틀을 직접 움직임 (경로 이탈로 스테이지가 리셋되지 않도록)
+        game.turtle.move(*script.next())
+        game.on_path = game.stage.check_on_path(game.turtle.get_position())
+        game.update()
+        game.game_state = "playing"  # 적과 부딪혀도 계속
+        fill_enemies(game, enemies)
+        middle = time.perf_counter()
+
+        game.draw()
+        end = time.perf_counter()
+        if frame >= WARMUP_FRAMES:
+            times['frame'].append((end - start) * 1000)
+            times['update'].append((middle - start) * 1000)
+            times['draw'].append((end - middle) * 1000)
+
+    print(f"stress: stage {stage_num}, glitch level {level}, {enemies} enemies, "
+          f"{len(game.turtle.trail)} trail points, {len(times['frame'])} frames, seed {seed}")
+    print(f"{'ms':<8}" + "".join(f"{h:>8}" for h in ["mean"] + [f"p{p}" for p in PERCENTILES] + ["max"]))
+    for name, samples in times.items():
+        if samples:
+            print(_row(name, samples))
+    return times
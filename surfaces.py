@@ -0,0 +1,101 @@
+import os
+import warnings
+import weakref
+from collections import OrderedDict
+import pygame
+
+# KSH_DEBUG_BLITS=1 이면 픽셀 포맷 변환이 필요한 블릿마다 경고
+DEBUG_BLITS = bool(os.environ.get("KSH_DEBUG_BLITS"))
+
+_templates = {}  # alpha 여부 -> 화면 포맷 1x1 서피스
+
+# 메모리 리포트용 소유자별 서피스 목록 (enable_tracking() 전에는 None)
+_tracked = None
+
+# 렌더링한 텍스트 캐시 ((폰트, 문자열, 색) -> 서피스)
+TEXT_CACHE_SIZE = 64
+_text_cache = OrderedDict()
+
+
+def _template(alpha):
+    """화면 픽셀 포맷을 가진 1x1 서피스 (화면이 없으면 None)"""
+    template = _templates.get(alpha)
+    if template is None:
+        if pygame.display.get_surface() is None:
+            return None
+        template = pygame.Surface((1, 1), pygame.SRCALPHA if alpha else 0)
+        template = template.convert_alpha() if alpha else template.convert()
+        _templates[alpha] = template
+    return template
+
+
+def create_surface(size, alpha=False, owner="misc"):
+    """화면과 같은 픽셀 포맷의 오프스크린 서피스 생성 (alpha=True 면 픽셀별 알파)"""
+    flags = pygame.SRCALPHA if alpha else 0
+    template = _template(alpha)
+    if template is None:
+        surface = pygame.Surface(size, flags)
+    else:
+        surface = pygame.Surface(size, flags, template)
+    if _tracked is not None:
+        _tracked.setdefault(owner, weakref.WeakSet()).add(surface)
+    return surface
+
+
+def create_overlay(size, color, alpha, owner="overlay"):
+    """단색 + 고정 알파 오버레이 (RLE 가속)"""
+    surface = create_surface(size, owner=owner)
+    surface.fill(color)
+    surface.set_alpha(alpha, pygame.RLEACCEL)
+    return surface
+
+
+def is_fast_blit(src, dest):
+    """포맷 변환 없이 블릿되는지 확인"""
+    return (src.get_bitsize() == dest.get_bitsize() and
+            src.get_masks()[:3] == dest.get_masks()[:3])
+
+
+def blit(dest, src, pos, owner=""):
+    """블릿 (디버그 모드면 느린 경로 경고)"""
+    if DEBUG_BLITS and not is_fast_blit(src, dest):
+        warnings.warn(
+            f"slow blit{' from ' + owner if owner else ''}: "
+            f"{src.get_bitsize()}bpp {src.get_masks()} -> "
+            f"{dest.get_bitsize()}bpp {dest.get_masks()}",
+            RuntimeWarning, stacklevel=2)
+    return dest.blit(src, pos)
+
+
+def render_text(font, text, color):
+    """텍스트 렌더링 (같은 폰트/문자열/색이면 캐시된 서피스 반환)"""
+    key = (font, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color)
+        _text_cache[key] = surface
+        while len(_text_cache) > TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surface
+
+
+def surface_bytes(surface):
+    """서피스 픽셀 버퍼 크기"""
+    return surface.get_pitch() * surface.get_height()
+
+
+def enable_tracking():
+    """이후 create_surface 로 만든 서피스를 소유자별로 추적"""
+    global _tracked
+    if _tracked is None:
+        _tracked = {}
+
+
+def surface_usage():
+    """소유자별 살아있는 서피스 바이트 수 (텍스트 캐시 포함)"""
+    usage = {owner: sum(surface_bytes(s) for s in surfaces)
+             for owner, surfaces in (_tracked or {}).items()}
+    usage["text_cache"] = sum(surface_bytes(s) for s in _text_cache.values())
+    return {owner: size for owner, size in usage.items() if size}
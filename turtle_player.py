@@ -1,4 +1,4 @@
-import pygame
+import canvas
 import math
 from utils import BLACK, RED, TURTLE_SPEED, SCREEN_WIDTH, SCREEN_HEIGHT
 
@@ -49,7 +49,9 @@ class TurtlePlayer:
             self.start_y = y
         self.x = self.start_x
         self.y = self.start_y
-        self.trail = [(self.x, self.y)]
+        # 리스트 재할당 없이 비우기 (재시도 시 할당 최소화)
+        self.trail.clear()
+        self.trail.append((self.x, self.y))
         self.color = BLACK
 
     def set_color(self, color):
@@ -60,7 +62,7 @@ class TurtlePlayer:
         """터틀과 경로 그리기"""
         # 경로 그리기 (선)
         if len(self.trail) >= 2:
-            pygame.draw.lines(screen, self.color, False, self.trail, 3)
+            canvas.lines(screen, self.color, False, self.trail, 3)
 
         # 터틀 그리기 (삼각형)
         self._draw_turtle(screen)
@@ -74,8 +76,8 @@ class TurtlePlayer:
             (self.x - size * 0.7, self.y + size * 0.7),  # 왼쪽 아래
             (self.x + size * 0.7, self.y + size * 0.7),  # 오른쪽 아래
         ]
-        pygame.draw.polygon(screen, self.color, points)
-        pygame.draw.polygon(screen, (255, 255, 255), points, 2)  # 테두리
+        canvas.polygon(screen, self.color, points)
+        canvas.polygon(screen, (255, 255, 255), points, 2)  # 테두리
 
 
 class AutoDrawer:
@@ -1,4 +1,5 @@
 import math
+import sys
 
 # 색상 정의
 WHITE = (255, 255, 255)
@@ -13,12 +14,17 @@ YELLOW = (255, 255, 0)
 # 화면 설정
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
+FPS = 60
+
+# pygbag (브라우저) 실행 여부
+IS_WEB = sys.platform == "emscripten"
 
 # 게임 설정
 TURTLE_SPEED = 3
 PATH_TOLERANCE = 30  # 경로 이탈 허용 거리 (픽셀)
 GOAL_SIZE = 30  # 골 박스 크기
 MAX_LIVES = 5
+FINAL_STAGE = 50  # 엔드리스 모드가 아니면 이 스테이지 클리어 시 승리
 
 
 def distance(p1, p2):
@@ -75,3 +81,26 @@ def lerp(a, b, t):
 def clamp(value, min_val, max_val):
     """값을 범위 내로 제한"""
     return max(min_val, min(max_val, value))
+
+
+def segments_intersect(a1, a2, b1, b2):
+    """두 선분이 교차하는지 확인"""
+    def cross(o, p, q):
+        return (p[0] - o[0]) * (q[1] - o[1]) - (p[1] - o[1]) * (q[0] - o[0])
+
+    d1 = cross(b1, b2, a1)
+    d2 = cross(b1, b2, a2)
+    d3 = cross(a1, a2, b1)
+    d4 = cross(a1, a2, b2)
+    return ((d1 > 0) != (d2 > 0) and d1 != 0 and d2 != 0 and
+            (d3 > 0) != (d4 > 0) and d3 != 0 and d4 != 0)
+
+
+def segment_distance(a1, a2, b1, b2):
+    """두 선분 사이의 최단 거리 계산"""
+    if segments_intersect(a1, a2, b1, b2):
+        return 0.0
+    return min(point_to_line_distance(a1, b1, b2),
+               point_to_line_distance(a2, b1, b2),
+               point_to_line_distance(b1, a1, a2),
+               point_to_line_distance(b2, a1, a2))